@@ -0,0 +1,51 @@
+"""Benchmark games played concurrently on an asyncio event loop against
+how many are played at once.
+
+Every player decides through a LatencyAgent, which waits LATENCY seconds
+before each random choice as a remote agent would. One game at a time
+spends most of its time waiting; with more games at once the waits
+overlap, until the engine's own work fills the CPU.
+
+Usage:
+    python -m benchmarks.bench_async_games [max_concurrency] [seed]
+"""
+import asyncio
+import sys
+import time
+from typing import List
+
+from mahjong.async_play import LatencyAgent, play_games_async
+
+LATENCY = 0.002
+CONCURRENCY = (1, 8, 64, 256)
+MIN_GAMES = 4
+
+
+def run(max_concurrency: int = 256, seed: int = 0) -> dict:
+    results = {'latency_ms': LATENCY * 1e3}
+    for concurrency in CONCURRENCY:
+        if concurrency > max_concurrency:
+            break
+        n_games = max(concurrency, MIN_GAMES)
+        agents: List[LatencyAgent] = []
+
+        def agent_factory(game_seed):
+            agents.append(LatencyAgent(LATENCY, game_seed))
+            return agents[-1]
+
+        start = time.perf_counter()
+        asyncio.run(play_games_async(range(seed, seed + n_games),
+                                     agent_factory, concurrency))
+        elapsed = time.perf_counter() - start
+        decisions = sum(agent.decisions for agent in agents)
+        results[f'concurrency_{concurrency}_games_per_sec'] = \
+            n_games / elapsed
+        results[f'concurrency_{concurrency}_decisions_per_sec'] = \
+            decisions / elapsed
+    return results
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    for name, value in run(*args).items():
+        print(f'{name:>36}: {value:,.3f}')
@@ -0,0 +1,42 @@
+"""Benchmark batched inference of a NumPy policy over concurrent games.
+
+Plays the same seeded games with every player deciding through a
+BatchedInference, all on one thread, for a few batch sizes, and times
+the decisions made per second. Batch size 1 is a policy call for every
+decision, as a per-player agent would make.
+
+Usage:
+    python -m benchmarks.bench_batched_inference [n_games] [seed]
+"""
+import sys
+import time
+
+from mahjong.inference import (
+    BatchedInference, NumpyPolicy, play_batched_games
+)
+
+BATCH_SIZES = (1, 4, 16)
+N_HIDDEN = 1024
+
+
+def run(n_games: int = 16, seed: int = 0) -> dict:
+    seeds = [seed + i for i in range(n_games)]
+    policy = NumpyPolicy(N_HIDDEN, seed=seed)
+    results = {'games': n_games}
+    for batch_size in BATCH_SIZES:
+        inference = BatchedInference(policy, batch_size)
+        start = time.perf_counter()
+        play_batched_games(seeds, inference)
+        elapsed = time.perf_counter() - start
+        results[f'batch_{batch_size}_decisions_per_sec'] = \
+            inference.n_decisions / elapsed
+        results[f'batch_{batch_size}_mean_batch'] = inference.mean_batch_size
+    results['speedup'] = (results[f'batch_{BATCH_SIZES[-1]}_decisions_per_sec']
+                          / results['batch_1_decisions_per_sec'])
+    return results
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    for name, value in run(*args).items():
+        print(f'{name:>32}: {value:,.3f}')
@@ -0,0 +1,58 @@
+"""Benchmark random access into a ReplayDataset.
+
+Packs the kyokus of seeded headless games into a log file, then times
+sampling uniformly random actions with their state, first with a replay
+cache big enough for every kyoku and then without caching any.
+
+Usage:
+    python -m benchmarks.bench_replay_dataset [n_games] [seed]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from mahjong.dataset import ReplayDataset
+from mahjong.packed_log import append_kyokus
+from mahjong.self_play import play_game
+
+SAMPLES = 2_000
+
+
+def time_samples(dataset: ReplayDataset, rng: random.Random) -> float:
+    start = time.perf_counter()
+    for _ in range(SAMPLES):
+        dataset.sample(rng)
+    return (time.perf_counter() - start) / SAMPLES
+
+
+def run(n_games: int = 10, seed: int = 0) -> dict:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'games.log')
+        for i in range(n_games):
+            append_kyokus(path, play_game(seed + i).kyoku_logs)
+
+        start = time.perf_counter()
+        dataset = ReplayDataset(path, cache_size=None)
+        index = time.perf_counter() - start
+        with dataset:
+            time_samples(dataset, random.Random(seed))  # fill the cache
+            cached = time_samples(dataset, random.Random(seed + 1))
+            n_kyokus, n_actions = dataset.n_kyokus, len(dataset)
+        with ReplayDataset(path, cache_size=0) as dataset:
+            uncached = time_samples(dataset, random.Random(seed + 1))
+
+    return {
+        'kyokus': n_kyokus,
+        'actions': n_actions,
+        'index_ms': index * 1e3,
+        'cached_sample_us': cached * 1e6,
+        'uncached_sample_us': uncached * 1e6,
+    }
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    for name, value in run(*args).items():
+        print(f'{name:>20}: {value:,.3f}')
@@ -0,0 +1,89 @@
+"""Benchmark tenpai_discards against a check_tenpai per discard.
+
+To know which discards of a 14-tile hand leave it tenpai, as when
+choosing the discard of a riichi, Player.call_riichi's way is to copy the
+hand without the discard and check_tenpai it, 14 times. tenpai_discards
+answers for every discard at once. The hands are random agari hands with
+one tile swapped for a random one, so that discarding at least the new
+tile keeps them tenpai. The tenpai cache is cleared before every pass, so
+check_tenpai computes each machi. Hands where the two disagree are
+counted as mismatches.
+
+Usage:
+    python -m benchmarks.bench_riichi_discards [n_hands] [seed]
+"""
+import random
+import sys
+import time
+from typing import List
+
+from benchmarks.bench_separations import random_agari_hands
+from mahjong.components import Hand, Tile, TILE_INDICES
+from mahjong.naki_and_actions import (
+    check_tenpai, tenpai_cache, tenpai_discards
+)
+
+
+def one_away_hands(n_hands: int, seed: int) -> List[Hand]:
+    """Agari hands with a random tile swapped for another random tile."""
+    rng = random.Random(seed)
+    hands = []
+    for hand in random_agari_hands(n_hands, seed):
+        hand[rng.choice(hand.keys())] -= 1
+        index = rng.choice(TILE_INDICES)
+        while hand[index] >= 4:
+            index = rng.choice(TILE_INDICES)
+        hand[index] += 1
+        hands.append(hand)
+    return hands
+
+
+def sequential(hand: Hand) -> list:
+    """The machi of every discard, one check_tenpai per tile of hand."""
+    found = {}
+    for index, count in hand.items():
+        for _ in range(count):
+            discarded = hand.copy()
+            discarded[index] -= 1
+            if machi := check_tenpai(discarded, []):
+                found[index] = machi
+    return [(Tile.from_index(index), machi)
+            for index, machi in sorted(found.items())]
+
+
+def timed(func, hands: List[Hand]) -> float:
+    tenpai_cache.clear()
+    start = time.perf_counter()
+    for hand in hands:
+        func(hand)
+    return time.perf_counter() - start
+
+
+def run(n_hands: int = 5_000, seed: int = 0) -> dict:
+    hands = one_away_hands(n_hands, seed)
+    tenpai_cache.clear()
+    mismatches = sum(
+        sequential(hand) != [
+            (discard, [tile for tile, _ in machi])
+            for discard, machi in tenpai_discards(hand, [])]
+        for hand in hands
+    )
+    sequential_s = timed(sequential, hands)
+    one_pass_s = timed(lambda hand: tenpai_discards(hand, []), hands)
+    return {
+        'hands': n_hands,
+        'mismatches': mismatches,
+        'tenpai_hands': sum(bool(tenpai_discards(hand, [])) for hand in hands),
+        'sequential_hands_per_sec': n_hands / sequential_s,
+        'one_pass_hands_per_sec': n_hands / one_pass_s,
+        'speedup': sequential_s / one_pass_s,
+    }
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    result = run(*args)
+    for name, value in result.items():
+        print(f'{name:>26}: {value:,.3f}')
+    if result['mismatches']:
+        sys.exit(1)
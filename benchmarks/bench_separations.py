@@ -0,0 +1,100 @@
+"""Benchmark the separation enumerator against repeated separate_sets.
+
+Before the hand was separated once per agari, the yaku evaluators called
+the greedy separate_sets nine times per agari hand, seven times koutsu
+first and twice shuntsu first. Here the same random agari hands are
+either separated that way or enumerated once with separations, picking
+both preferred separations from the result. Hands where the greedy split
+finds something the enumerator does not are counted as mismatches.
+
+Usage:
+    python -m benchmarks.bench_separations [n_hands] [seed]
+"""
+import random
+import sys
+import time
+from collections import Counter
+from typing import List
+
+from mahjong.components import Hand, Suit, TILE_INDICES
+from mahjong.hand_decomposition import (
+    preferred_separation, separations, suit_splits
+)
+from mahjong.helpers import separate_sets
+
+GREEDY_KOUTSU_FIRST_CALLS = 7
+GREEDY_SHUNTSU_FIRST_CALLS = 2
+
+
+def random_agari_hands(n_hands: int, seed: int) -> List[Hand]:
+    """Closed agari hands of four random sets and a jantou."""
+    rng = random.Random(seed)
+    hands = []
+    while len(hands) < n_hands:
+        counts = Counter()
+        counts[rng.choice(TILE_INDICES)] += 2
+        for _ in range(4):
+            index = rng.choice(TILE_INDICES)
+            if index // 10 != Suit.JIHAI.value and index % 10 <= 7 \
+                    and rng.random() < 0.6:
+                counts.update((index, index + 1, index + 2))
+            else:
+                counts[index] += 3
+        if max(counts.values()) <= 4:
+            hands.append(Hand.from_counts(counts))
+    return hands
+
+
+def greedy(hand: Hand) -> None:
+    for _ in range(GREEDY_KOUTSU_FIRST_CALLS):
+        separate_sets(hand.copy(), 0)
+    for _ in range(GREEDY_SHUNTSU_FIRST_CALLS):
+        separate_sets(hand.copy(), 0, False)
+
+
+def enumerated(hand: Hand) -> None:
+    found = separations(hand, 0)
+    preferred_separation(found, True)
+    preferred_separation(found, False)
+
+
+def timed(func, hands: List[Hand]) -> float:
+    start = time.perf_counter()
+    for hand in hands:
+        func(hand)
+    return time.perf_counter() - start
+
+
+def run(n_hands: int = 20_000, seed: int = 0) -> dict:
+    hands = random_agari_hands(n_hands, seed)
+
+    mismatches = 0
+    for hand in hands:
+        koutsus, shuntsus, jantou = separate_sets(hand.copy(), 0)
+        greedy_sets = len(koutsus) + len(shuntsus)
+        if jantou is not None and greedy_sets == 4 \
+                and not separations(hand, 0):
+            mismatches += 1
+
+    greedy_time = timed(greedy, hands)
+    suit_splits.cache_clear()
+    cold = timed(enumerated, hands)
+    warm = timed(enumerated, hands)
+
+    return {
+        'hands': n_hands,
+        'mismatches': mismatches,
+        'greedy_hands_per_sec': n_hands / greedy_time,
+        'enumerator_cold_hands_per_sec': n_hands / cold,
+        'enumerator_warm_hands_per_sec': n_hands / warm,
+        'speedup_cold': greedy_time / cold,
+    }
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    results = run(*args)
+    for name, value in results.items():
+        print(f'{name:>30}: {value:,.3f}')
+    if results['mismatches']:
+        sys.exit(1)
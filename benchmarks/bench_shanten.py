@@ -0,0 +1,102 @@
+"""Benchmark calculate_shanten against check_tenpai.
+
+Random 13-tile hands are dealt from a seeded wall, biased towards fewer
+suits so that a fair share of them are tenpai. Before anything is timed,
+every hand is checked for shanten == 0 <=> a brute force finds a machi,
+the way check_tenpai did before the suit tables: add each tile, take out
+each pair and check_remains_are_sets, or chiitoitsu and kokushi musou.
+The partial splits the check memoizes are then dropped again, so that
+the cold run starts from the bare suit tables.
+
+Usage:
+    python -m benchmarks.bench_shanten [n_hands] [seed]
+"""
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import List
+
+from mahjong.components import Hand, Tile, TILE_INDICES
+from mahjong.helpers import check_remains_are_sets
+from mahjong.naki_and_actions import check_tenpai
+from mahjong.shanten import calculate_shanten, calculate_ukeire
+from mahjong.suit_tables import JIHAI_TABLE, NUMBER_TABLE
+
+
+def random_hands(n_hands: int, seed: int) -> List[Hand]:
+    rng = random.Random(seed)
+    wall = [index for index in TILE_INDICES for _ in range(4)]
+    hands = []
+    for _ in range(n_hands):
+        suits = rng.sample(range(4), rng.choice([1, 2, 2, 3, 4]))
+        pool = [index for index in wall if index // 10 in suits]
+        hands.append(Hand.from_counts(Counter(rng.sample(pool, 13))))
+    return hands
+
+
+def brute_force_tenpai(hand: Hand) -> bool:
+    counts = defaultdict(int, hand.items())
+    # a machi joins a set or the jantou with a tile of the hand
+    near = {index + offset for index in counts for offset in range(-2, 3)
+            if index > 10 or offset == 0}
+    for machi in near.intersection(TILE_INDICES):
+        completed = counts.copy()
+        completed[machi] += 1
+        for jantou, count in list(completed.items()):
+            if count >= 2:
+                remains = completed.copy()
+                remains[jantou] -= 2
+                if check_remains_are_sets(remains, 0):
+                    return True
+
+    if sorted(counts.values()) == [1] + [2] * 6:  # chiitoitsu
+        return True
+    yaochuu = [tile.index for tiles in Tile.get_yaochuuhai() for tile in tiles]
+    singles = sum(counts[index] == 1 for index in yaochuu)
+    pairs = sum(counts[index] == 2 for index in yaochuu)
+    return singles == 13 or (singles == 11 and pairs == 1)  # kokushi
+
+
+def forget_partials() -> None:
+    for table in (JIHAI_TABLE, NUMBER_TABLE):
+        table.partials = {0: ((0, 0, 0), )}
+
+
+def timed(func, hands: List[Hand]) -> float:
+    start = time.perf_counter()
+    for hand in hands:
+        func(hand)
+    return time.perf_counter() - start
+
+
+def run(n_hands: int = 20_000, seed: int = 0) -> dict:
+    hands = random_hands(n_hands, seed)
+
+    mismatches = sum(
+        (calculate_shanten(hand) == 0) != brute_force_tenpai(hand)
+        for hand in hands
+    )
+    forget_partials()
+    cold = timed(calculate_shanten, hands)
+    warm = timed(calculate_shanten, hands)
+    tenpai = timed(lambda hand: check_tenpai(hand, []), hands)
+    ukeire = timed(calculate_ukeire, hands)
+
+    return {
+        'hands': n_hands,
+        'mismatches': mismatches,
+        'shanten_cold_per_min': n_hands / cold * 60,
+        'shanten_warm_per_min': n_hands / warm * 60,
+        'check_tenpai_per_min': n_hands / tenpai * 60,
+        'ukeire_per_min': n_hands / ukeire * 60,
+    }
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    result = run(*args)
+    for name, value in result.items():
+        print(f'{name:>24}: {value:,.0f}')
+    if result['mismatches']:
+        sys.exit(1)
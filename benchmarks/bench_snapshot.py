@@ -0,0 +1,65 @@
+"""Benchmark kyoku snapshot/restore against copy.deepcopy.
+
+Plays seeded headless kyokus part of the way, then times taking and
+restoring a snapshot of the Kyoku and its Turn against deep copying
+both, as a search agent branching from that state would.
+
+Usage:
+    python -m benchmarks.bench_snapshot [n_states] [seed]
+"""
+import copy
+import random
+import sys
+import time
+
+from mahjong.kyoku import Kyoku, Turn
+from mahjong.player import Player
+from mahjong.renderer import Renderer
+
+REPEATS = 200
+
+
+def mid_kyoku(seed: int):
+    """A kyoku and its turn some discards in, still being played."""
+    rng = random.Random(seed)
+    random.seed(seed)
+    renderer = Renderer()
+    players = [Player(f'A.I. {i}', i, 'dummy', renderer) for i in range(4)]
+    kyoku = Kyoku(players, renderer=renderer, seed=seed)
+    kyoku.deal()
+    turn = Turn(players, kyoku.tile_stack, kyoku.bakaze, kyoku.logger)
+    state, tile, pos, _ = turn.draw_flow(kyoku.oya_player)
+    for _ in range(rng.randrange(5, 30)):
+        if state != 0:
+            break
+        state, tile, pos, _ = turn.discard_flow(tile, pos)
+    return kyoku, turn
+
+
+def run(n_states: int = 20, seed: int = 0) -> dict:
+    states = [mid_kyoku(seed + i) for i in range(n_states)]
+
+    start = time.perf_counter()
+    for kyoku, turn in states:
+        for _ in range(REPEATS):
+            kyoku.restore(kyoku.snapshot(turn), turn)
+    snapshot = (time.perf_counter() - start) / (n_states * REPEATS)
+
+    start = time.perf_counter()
+    for kyoku, turn in states:
+        for _ in range(REPEATS):
+            copy.deepcopy((kyoku, turn))
+    deepcopy = (time.perf_counter() - start) / (n_states * REPEATS)
+
+    return {
+        'states': n_states,
+        'snapshot_restore_us': snapshot * 1e6,
+        'deepcopy_us': deepcopy * 1e6,
+        'speedup': deepcopy / snapshot,
+    }
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    for name, value in run(*args).items():
+        print(f'{name:>20}: {value:,.3f}')
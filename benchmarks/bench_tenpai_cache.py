@@ -0,0 +1,45 @@
+"""How much check_tenpai work the tenpai cache saves in full games.
+
+Plays the same seeded headless games with the cache on and off and
+reports the cache's hit rate and the time taken.
+
+Usage:
+    python -m benchmarks.bench_tenpai_cache [n_games] [seed]
+"""
+import sys
+import time
+
+from mahjong.naki_and_actions import tenpai_cache, TENPAI_CACHE_SIZE
+from mahjong.self_play import play_game
+
+
+def play(n_games: int, seed: int, maxsize) -> float:
+    tenpai_cache.resize(maxsize)
+    tenpai_cache.clear()
+    start = time.perf_counter()
+    for game in range(n_games):
+        play_game(seed + game)
+    return time.perf_counter() - start
+
+
+def run(n_games: int = 50, seed: int = 0) -> dict:
+    try:
+        uncached = play(n_games, seed, 0)
+        cached = play(n_games, seed, TENPAI_CACHE_SIZE)
+        info = tenpai_cache.cache_info()
+    finally:
+        tenpai_cache.resize(TENPAI_CACHE_SIZE)
+    return {
+        'games': n_games,
+        'hits': info.hits,
+        'misses': info.misses,
+        'hit_rate': info.hits / max(1, info.hits + info.misses),
+        'uncached_games_per_sec': n_games / uncached,
+        'cached_games_per_sec': n_games / cached,
+    }
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    for name, value in run(*args).items():
+        print(f'{name:>24}: {value:,.3f}')
@@ -0,0 +1,269 @@
+"""Benchmark suite of the engine's hot paths, with JSON results to diff
+between commits.
+
+Every benchmark runs over a corpus built from the seed, so two runs with
+the same seed and scale time exactly the same work. Each is repeated and
+the best time kept, the least noisy estimate on a busy machine. Results
+are written with sorted keys, one value per line, so that `git diff` or
+--compare between two runs shows what got slower.
+
+    check_tenpai            13-tile hands, tenpai cache cleared per repeat
+    check_remains_are_sets  agari hands without their jantou
+    separate_sets           agari hands, koutsu first
+    yaku_calculate          YakuCalculator(...).calculate() on agari hands
+    check_yaku              check_yaku on the same agari hands
+    check_chii/pon/ankan    13-tile hands against a random tile
+    legal_on_discard        the legal actions and their mask on a random
+                            discard of kamicha, 13-tile hands
+    stack                   Stack() construction, shuffle included
+    game                    a whole headless game of four A.I. players
+
+--all also runs the other benchmarks/bench_* modules and adds their
+results under "benchmarks".
+
+Usage:
+    python -m benchmarks.suite [--out results.json] [--seed S]
+                               [--scale X] [--all]
+    python -m benchmarks.suite --compare old.json [--threshold 0.2]
+"""
+import argparse
+import importlib
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from benchmarks.bench_separations import random_agari_hands
+from benchmarks.bench_shanten import random_hands
+from mahjong.action_space import legal_on_discard
+from mahjong.components import Hand, Jihai, Stack, Tile, TILE_INDICES
+from mahjong.helpers import check_remains_are_sets, separate_sets
+from mahjong.naki_and_actions import (
+    check_ankan, check_chii, check_pon, check_tenpai, check_yaku,
+    tenpai_cache
+)
+from mahjong.player import Player
+from mahjong.self_play import play_game
+from mahjong.yaku_calculator import YakuCalculator
+
+REPEATS = 5
+SIZES = {
+    'check_tenpai': 2_000,
+    'check_remains_are_sets': 20_000,
+    'separate_sets': 20_000,
+    'yaku_calculate': 2_000,
+    'check_yaku': 2_000,
+    'check_chii': 20_000,
+    'check_pon': 20_000,
+    'check_ankan': 20_000,
+    'legal_on_discard': 5_000,
+    'stack': 5_000,
+    'game': 5,
+}
+OTHER_BENCHMARKS = [
+    'bench_separations', 'bench_shanten', 'bench_snapshot',
+    'bench_tenpai_cache', 'bench_replay_dataset', 'bench_batched_inference',
+    'bench_async_games', 'bench_riichi_discards',
+]
+
+
+def timed(
+    func: Callable,
+    items: Sequence,
+    repeats: int = REPEATS,
+    setup: Optional[Callable[[], None]] = None,
+) -> dict:
+    """Best time of calling func on every item, over repeats runs.
+    Args:
+        setup: called before every run, untimed
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return {
+        'n': len(items),
+        'repeats': repeats,
+        'us_per_op': round(best / len(items) * 1e6, 3),
+        'ops_per_sec': round(len(items) / best, 1),
+    }
+
+
+def without_jantou(hands: List[Hand]) -> List[Hand]:
+    """Agari hands with a pair taken out so that the rest form sets."""
+    remains = []
+    for hand in hands:
+        for index in hand.keys():
+            if hand[index] >= 2:
+                remain = hand.copy()
+                remain[index] -= 2
+                if check_remains_are_sets(remain.copy(), 0):
+                    remains.append(remain)
+                    break
+    return remains
+
+
+def agari_players(hands: List[Hand], rng: random.Random) -> List[tuple]:
+    """(player, stack, is_ron, machi) ready for YakuCalculator, the agari
+    tile being a random tile of each hand.
+    """
+    agaris = []
+    for hand in hands:
+        tile = Tile.from_index(rng.choice(hand.keys()))
+        player = Player('bench', 0, 'dummy')
+        player.hand = hand.copy()
+        player.hand[tile.index] -= 1
+        player.agari_tile = tile
+        machi = check_tenpai(player.hand, [])
+        agaris.append((player, Stack(rng), rng.random() < 0.5, machi))
+    return agaris
+
+
+def run(seed: int = 0, scale: float = 1.0, repeats: int = REPEATS) -> dict:
+    """Time every hot path.
+    Args:
+        scale: of the corpus sizes in SIZES
+    Returns:
+        benchmark name -> its timing
+    """
+    rng = random.Random(seed)
+    size = {name: max(1, int(n * scale)) for name, n in SIZES.items()}
+    results = {}
+
+    hands = random_hands(size['check_tenpai'], seed)
+    results['check_tenpai'] = timed(
+        lambda hand: check_tenpai(hand, []), hands, repeats,
+        setup=tenpai_cache.clear)
+
+    agari_hands = random_agari_hands(size['separate_sets'], seed)
+    remains = without_jantou(
+        agari_hands[:size['check_remains_are_sets']])
+    results['check_remains_are_sets'] = timed(
+        lambda remain: check_remains_are_sets(remain.copy(), 0),
+        remains, repeats)
+    results['separate_sets'] = timed(
+        lambda hand: separate_sets(hand.copy(), 0), agari_hands, repeats)
+
+    agaris = agari_players(agari_hands[:size['yaku_calculate']], rng)
+    results['yaku_calculate'] = timed(
+        lambda agari: YakuCalculator(
+            agari[0], agari[1], agari[0].jikaze, agari[2], agari[3],
+            agari[0].agari_tile).calculate(),
+        agaris, repeats)
+    results['check_yaku'] = timed(
+        lambda agari: check_yaku(
+            agari[0], agari[1], agari[0].jikaze, agari[2], agari[3],
+            agari[0].agari_tile),
+        agaris[:size['check_yaku']], repeats)
+
+    for name, check in (('check_chii', check_chii), ('check_pon', check_pon),
+                        ('check_ankan', check_ankan)):
+        pairs = [(hand, Tile.from_index(rng.choice(TILE_INDICES)))
+                 for hand in random_hands(size[name], seed)]
+        results[name] = timed(lambda pair: check(*pair), pairs, repeats)
+
+    stack = Stack(rng)
+    discards = []
+    for hand in random_hands(size['legal_on_discard'], seed):
+        player = Player('bench', 1, 'dummy')
+        player.hand = hand
+        discards.append((player, Tile.from_index(rng.choice(TILE_INDICES))))
+    results['legal_on_discard'] = timed(
+        lambda discard: legal_on_discard(
+            discard[0], discard[1], 0, stack, Jihai.TON).mask,
+        discards, repeats)
+
+    results['stack'] = timed(
+        lambda _: Stack(rng), range(size['stack']), repeats)
+    results['game'] = timed(
+        play_game, [seed + i for i in range(size['game'])], repeats)
+    return results
+
+
+def run_others(seed: int = 0) -> Dict[str, dict]:
+    """Results of the other benchmarks/bench_* modules."""
+    return {
+        name: importlib.import_module(f'benchmarks.{name}').run(seed=seed)
+        for name in OTHER_BENCHMARKS
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+            text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old: dict, new: dict, threshold: float) -> List[str]:
+    """Names of the hot paths over threshold slower in new than in old,
+    printing the change of each.
+    """
+    regressions = []
+    for name, result in sorted(new['results'].items()):
+        if name not in old['results']:
+            continue
+        before = old['results'][name]['us_per_op']
+        change = result['us_per_op'] / before - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  <- slower'
+        print(f'{name:>24}: {before:>12,.3f}us -> '
+              f'{result["us_per_op"]:>12,.3f}us  {change:+7.1%}{flag}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out', default=None,
+                        help='write the results to this JSON file')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='of the corpus sizes, e.g. 0.1 for a quick run')
+    parser.add_argument('--repeats', type=int, default=REPEATS)
+    parser.add_argument('--all', action='store_true',
+                        help='also run the other benchmarks')
+    parser.add_argument('--compare', default=None, metavar='OLD_JSON',
+                        help='compare with earlier results, exit 1 if any '
+                             'hot path got slower than the threshold')
+    parser.add_argument('--threshold', type=float, default=0.2)
+    args = parser.parse_args()
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'scale': args.scale,
+        },
+        'results': run(args.seed, args.scale, args.repeats),
+    }
+    if args.all:
+        report['benchmarks'] = run_others(args.seed)
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        if compare(old, report, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
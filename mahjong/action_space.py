@@ -0,0 +1,229 @@
+"""A fixed, flat numbering of every choice a player can make, so that an
+agent picks an int out of N_ACTIONS under a legal-action mask instead of
+an item of a Player's action_list.
+
+    0-33   discard the tile in that Hand slot
+    34     NOACT: pass on a discard, or discard rather than call
+    35     RIICHI
+    36     TSUMO
+    37     RON
+    38     RYUUKYOKU, 九種九牌
+    39-41  CHII with the called tile lowest, in the middle or highest
+    42     PON
+    43     DAMINKAN
+    44-77  ANKAN or CHAKAN of the tile in that Hand slot
+
+legal_on_discard and legal_on_draw work out every action a player may
+take on a tile in one pass over the hand's counts, with the hand's machi
+computed once, as the LegalActions that Player.get_input offers.
+"""
+from array import array
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from .components import (
+    Action, Huro, Naki, Stack, Tile, Jihai, SLOT_OF_INDEX, N_SLOTS,
+    TILE_INDICES
+)
+from .helpers import nine_yaochuus
+from .naki_and_actions import check_tenpai, check_yaku
+if TYPE_CHECKING:
+    from .player import Player
+
+DISCARD = 0
+NOACT = N_SLOTS
+RIICHI = NOACT + 1
+TSUMO = NOACT + 2
+RON = NOACT + 3
+RYUUKYOKU = NOACT + 4
+CHII = NOACT + 5  # + position of the called tile in the chii
+PON = CHII + 3
+DAMINKAN = PON + 1
+KAN = DAMINKAN + 1  # + Hand slot of the kan tile
+N_ACTIONS = KAN + N_SLOTS
+
+_SINGLE_ACTIONS = {
+    Action.NOACT: NOACT,
+    Action.RIICHI: RIICHI,
+    Action.TSUMO: TSUMO,
+    Action.RON: RON,
+    Action.RYUUKYOKU: RYUUKYOKU,
+}
+
+# an action_list item, or a tile for discards
+Choice = Union[Tuple[Action, Naki, List[Tile]], Tile]
+
+
+def encode_action_list(
+    action_list: List[Tuple[Action, Naki, List[List[Tile]]]],
+    new_tile: Tile,
+) -> Dict[int, Choice]:
+    """Number every choice of an action_list, as Player.get_input offers it.
+    Args:
+        action_list: (action, naki, possible huros) items
+        new_tile: the tile the actions are about
+    Returns:
+        action id -> (action, naki, huro) to return from UserInput.actions
+    """
+    choices = {}
+    for action, naki, huros in action_list:
+        if action != Action.NAKI:
+            choices[_SINGLE_ACTIONS[action]] = (action, naki, [])
+            continue
+        for huro in huros:
+            if naki == Naki.CHII:
+                action_id = CHII + huro.index(new_tile)
+            elif naki == Naki.PON:
+                action_id = PON
+            elif naki == Naki.DAMINKAN:
+                action_id = DAMINKAN
+            else:  # ANKAN or CHAKAN
+                action_id = KAN + SLOT_OF_INDEX[huro[0].index]
+            choices[action_id] = (action, naki, huro)
+    return choices
+
+
+def encode_discards(tiles: List[Tile]) -> Dict[int, Choice]:
+    """Number the tiles a player can discard.
+    Returns:
+        action id -> tile to return from UserInput.discard
+    """
+    return {DISCARD + SLOT_OF_INDEX[tile.index]: tile for tile in tiles}
+
+
+def action_mask(choices: Dict[int, Choice]) -> array:
+    """N_ACTIONS flags, 1 where the action is legal."""
+    mask = array('b', bytes(N_ACTIONS))
+    for action_id in choices:
+        mask[action_id] = 1
+    return mask
+
+
+class LegalActions(list):
+    """The actions a player may take on a tile, the action_list that
+    UserInput.actions is given. Agents picking action ids get its choices
+    and mask, worked out the first time they are asked for, so the
+    engine's own players don't pay for them.
+    """
+    __slots__ = ('new_tile', '_choices')
+
+    def __init__(self, new_tile: Tile):
+        super().__init__([(Action.NOACT, Naki.NONE, [])])
+        self.new_tile = new_tile
+        self._choices: Optional[Dict[int, Choice]] = None
+
+    def add(self, action: Action, naki: Naki = Naki.NONE,
+            huros: List[List[Tile]] = ()) -> None:
+        self.append((action, naki, list(huros)))
+        self._choices = None
+
+    @property
+    def choices(self) -> Dict[int, Choice]:
+        """action id -> choice, see encode_action_list"""
+        if self._choices is None:
+            self._choices = encode_action_list(self, self.new_tile)
+        return self._choices
+
+    @property
+    def mask(self) -> array:
+        return action_mask(self.choices)
+
+
+def _is_agari(player: 'Player', tile: Tile, machi: List[Tile],
+              stack: Stack, bakaze: Jihai, is_ron: bool) -> bool:
+    """check_ron or check_tsumo, with the machi of the hand."""
+    if tile not in machi:
+        return False
+    if is_ron and (player.tmp_furiten or player.permanent_furiten or any(
+            t.index in player.furiten_tiles_idx for t in machi)):
+        return False
+    return check_yaku(player, stack, bakaze, is_ron, machi, tile)
+
+
+def legal_on_discard(
+    player: 'Player',
+    tile: Tile,
+    pos: int,
+    stack: Stack,
+    bakaze: Jihai,
+    suukaikan: bool = False,
+) -> LegalActions:
+    """What player may do about a tile discarded by the seat pos, as
+    Player.action_with_discard_tile offers it.
+    """
+    legal = LegalActions(tile)
+    counts = player.hand[tile.index]
+    if not suukaikan and not player.is_riichi and not stack.is_haitei:
+        if counts == 3:
+            legal.add(Action.NAKI, Naki.DAMINKAN, [[tile] * 4])
+        if counts >= 2:
+            legal.add(Action.NAKI, Naki.PON, [[tile] * 3])
+    if (pos == player.get_kamicha() and not player.is_riichi
+            and tile.suit != 0):
+        hand = player.hand
+        index, rank = tile.index, tile.rank
+        chiis = []
+        if rank >= 3 and hand[index - 2] > 0 and hand[index - 1] > 0:
+            chiis.append([Tile.from_index(index - 2),
+                          Tile.from_index(index - 1), tile])
+        if 2 <= rank <= 8 and hand[index - 1] > 0 and hand[index + 1] > 0:
+            chiis.append([Tile.from_index(index - 1), tile,
+                          Tile.from_index(index + 1)])
+        if rank <= 7 and hand[index + 1] > 0 and hand[index + 2] > 0:
+            chiis.append([tile, Tile.from_index(index + 1),
+                          Tile.from_index(index + 2)])
+        if chiis:
+            legal.add(Action.NAKI, Naki.CHII, chiis)
+    machi = check_tenpai(player.hand, player.kabe)
+    if _is_agari(player, tile, machi, stack, bakaze, True):
+        legal.add(Action.RON)
+    return legal
+
+
+def legal_on_draw(
+    player: 'Player',
+    tile: Tile,
+    first_turn: bool,
+    stack: Stack,
+    bakaze: Jihai,
+    suukaikan: bool = False,
+) -> LegalActions:
+    """What player may do with the tile it drew, before discarding, as
+    Player.action_with_new_tile offers it. Riichi is offered after the
+    discard, see Player.call_riichi.
+    """
+    legal = LegalActions(tile)
+    hand = player.hand
+    machi = None
+    if player.is_riichi or not (suukaikan or stack.is_haitei):
+        ankans = []
+        for slot, count in enumerate(hand.counts):
+            index = TILE_INDICES[slot]
+            if count == 4 or (count == 3 and index == tile.index):
+                ankans.append([Tile.from_index(index)] * 4)
+        if player.is_riichi and ankans:
+            # only the kans that keep the machi
+            machi = check_tenpai(hand, player.kabe)
+            valid_kans = []
+            for ankan in ankans:
+                kan_hand = hand.copy()
+                kan_hand[ankan[0].index] -= 4
+                kan_kabe = player.kabe + [Huro(Naki.ANKAN, ankan[0], ankan)]
+                if machi == check_tenpai(kan_hand, kan_kabe):
+                    valid_kans.append(ankan)
+            ankans = valid_kans
+        if ankans:
+            legal.add(Action.NAKI, Naki.ANKAN, ankans)
+    if not (suukaikan or stack.is_haitei or player.is_riichi):
+        chakans = sorted(
+            [huro.tiles[0]] * 4 for huro in player.kabe
+            if huro.naki_type == Naki.PON
+            and (hand[huro.tiles[0].index] == 1 or tile == huro.tiles[0]))
+        if chakans:
+            legal.add(Action.NAKI, Naki.CHAKAN, chakans)
+    if first_turn and nine_yaochuus(hand, tile):
+        legal.add(Action.RYUUKYOKU)
+    if machi is None:
+        machi = check_tenpai(hand, player.kabe)
+    if _is_agari(player, tile, machi, stack, bakaze, False):
+        legal.add(Action.TSUMO)
+    return legal
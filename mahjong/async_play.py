@@ -0,0 +1,146 @@
+"""Play many games concurrently on an asyncio event loop, with agents
+whose decisions are awaited, e.g. remote or batched policies.
+
+A game is played by driving the steps of Game.start_game, see steps, from
+a coroutine: the decisions of AsyncUserInput players are awaited, which
+suspends the game right where its player is asked, and the others are
+answered right away. All the games share the loop's thread, so a slow
+agent only holds up its own game, and thousands of games cost no more
+than their state.
+
+Usage:
+    records = asyncio.run(play_games_async(
+        range(1000), lambda seed: LatencyAgent(0.005, seed)))
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from .components import Action, Naki, Tile
+from .env import legal_discards
+from .game import Game
+from .self_play import GameRecord, KyokuCollector, PLAYER_NAMES
+from .steps import Steps
+from .utils import get_rng
+
+
+class AsyncUserInput(ABC):
+    """UserInput whose decisions are awaited, see UserInput for the
+    arguments. The game is suspended while they are, so the players and
+    their kyoku stay as they are until a decision is returned.
+    """
+
+    @abstractmethod
+    async def actions(
+        self,
+        player,
+        new_tile: Tile,
+        action_list: List,
+        discard: bool,
+    ) -> Tuple[Action, Naki, List[Tile]]:
+        return NotImplemented
+
+    @abstractmethod
+    async def discard(
+        self, player, new_tile: Tile, kuikae_tiles: List[Tile]
+    ) -> Tile:
+        return NotImplemented
+
+
+class LatencyAgent(AsyncUserInput):
+    """Random legal choices, each after a delay, as a remote agent would
+    answer.
+    """
+
+    def __init__(self, latency: float = 0.001, seed=None):
+        """
+        Args:
+            latency: seconds each decision takes
+            seed: seeds the choices, see utils.get_rng
+        """
+        self.latency = latency
+        self.rng = get_rng(seed)
+        self.decisions = 0
+
+    async def actions(self, player, new_tile, action_list, discard):
+        await asyncio.sleep(self.latency)
+        self.decisions += 1
+        action, naki, huros = self.rng.choice(action_list)
+        return action, naki, self.rng.choice(huros) if huros else []
+
+    async def discard(self, player, new_tile, kuikae_tiles):
+        await asyncio.sleep(self.latency)
+        self.decisions += 1
+        return self.rng.choice(
+            legal_discards(player, new_tile, kuikae_tiles))
+
+
+async def run_steps_async(steps: Steps):
+    """Run steps to their end as steps.run_steps does, but awaiting the
+    decisions of the players whose input_method is an AsyncUserInput.
+    Returns:
+        what steps return
+    """
+    decision = None
+    while True:
+        try:
+            ask = steps.send(decision)
+        except StopIteration as stop:
+            return stop.value
+        agent = ask.player.input_method
+        if not isinstance(agent, AsyncUserInput):
+            decision = ask()
+        # no need to ask when the only choice is to let the discard go
+        elif ask.name == 'actions' and ask.args[2] and (
+                ask.args[1] == [(Action.NOACT, Naki.NONE, [])]):
+            decision = Action.NOACT, Naki.NONE, []
+        else:
+            decision = await getattr(agent, ask.name)(ask.player, *ask.args)
+
+
+async def play_game_async(
+    seed: int,
+    agent: AsyncUserInput,
+    config_file: str = 'config_headless.json',
+    player_names: List[str] = PLAYER_NAMES,
+) -> GameRecord:
+    """Play a whole game headless, every player deciding through agent.
+    Args:
+        seed: seeds the walls
+    """
+    collector = KyokuCollector()
+    game = Game(player_names, config_file, renderer=collector, seed=seed)
+    for player in game.players:
+        player.input_method = agent
+    await run_steps_async(game.start_game_steps())
+    return GameRecord(seed,
+                      collector.kyoku_logs,
+                      [player.points for player in game.players])
+
+
+async def play_games_async(
+    seeds: Iterable[int],
+    agent_factory: Callable[[int], AsyncUserInput],
+    concurrency: Optional[int] = None,
+    config_file: str = 'config_headless.json',
+) -> List[GameRecord]:
+    """Play games concurrently on the running loop.
+    Args:
+        agent_factory: the agent of a game, from the game's seed
+        concurrency: games played at once, all of them if None
+    Returns:
+        the records of the games, in the order of seeds
+    """
+    if concurrency is None:
+        return list(await asyncio.gather(*(
+            play_game_async(seed, agent_factory(seed), config_file)
+            for seed in seeds)))
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def play(seed):
+        async with semaphore:
+            return await play_game_async(seed, agent_factory(seed),
+                                         config_file)
+
+    return list(await asyncio.gather(*map(play, seeds)))
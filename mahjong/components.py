@@ -1,9 +1,10 @@
 import itertools
-import random
-from typing import Tuple, List
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from enum import Enum, unique
 
-from .utils import get_values, get_name
+from .utils import get_values, get_name, get_rng
+from .suit_tables import rank_shift
 
 
 @unique
@@ -49,61 +50,70 @@ class Action(Enum):
 
 
 class Tile:
-    def __init__(self, suit: int, rank: int):
-        self.suit = suit
-        self.rank = rank
-        self.index = self.calc_index()
-        self.owner = None
-
-    def __str__(self):
-        if self._suit == Suit.JIHAI.value:
-            return f"{ get_name(Jihai, self._rank) }"
-        else:
-            return f"{ self._rank } { get_name(Suit, self._suit) }"
-
-    @property
-    def suit(self):
-        return self._suit
+    """A kind of tile, e.g. 2 MANZU.
+
+    There are only 34 kinds of tiles, so tiles are interned: Tile(suit, rank)
+    and Tile.from_index return one shared immutable instance per kind, and
+    constructing or comparing tiles never allocates. State of a physical
+    tile, like who discarded it, lives in OwnedTile instead.
+    """
+    __slots__ = ('suit', 'rank', 'index')
+    owner = None  # interned tiles belong to no one, see OwnedTile
+
+    def __new__(cls, suit: int, rank: int):
+        if 0 <= suit < 4 and 0 < rank < 10:
+            tile = _TILES_BY_INDEX[suit * 10 + rank]
+            if tile is not None:
+                return tile
+        return cls._intern(suit, rank)
+
+    def __init__(self, *args):
+        pass
 
-    @suit.setter
-    def suit(self, value: int):
-        if not 0 <= value < 4:
+    @classmethod
+    def _intern(cls, suit: int, rank: int) -> 'Tile':
+        if not 0 <= suit < 4:
             raise ValueError(f"Suit should be in: { get_values(Suit) }")
-        self._suit = value
-
-    @property
-    def rank(self):
-        return self._rank
-
-    @rank.setter
-    def rank(self, value: int):
-        if self._suit == Suit.JIHAI.value:  # Jihai
-            if not 1 <= value < 8:
+        if suit == Suit.JIHAI.value:  # Jihai
+            if not 1 <= rank < 8:
                 raise ValueError(
                     f"Value for Jihai should be in: "
                     f"{ get_values(Jihai) }")
         else:
-            if not 1 <= value < 10:
+            if not 1 <= rank < 10:
                 raise ValueError(
-                    f"Value for { get_name(Suit, self._suit) }"
+                    f"Value for { get_name(Suit, suit) }"
                     f"should be in: 1-9")
-        self._rank = value
+        tile = object.__new__(cls)
+        object.__setattr__(tile, 'suit', suit)
+        object.__setattr__(tile, 'rank', rank)
+        object.__setattr__(tile, 'index', tile.calc_index())
+        _TILES_BY_INDEX[tile.index] = tile
+        return tile
 
-    @property
-    def owner(self):
-        return self._owner
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Tile is immutable, can't set {name}")
 
-    @owner.setter
-    def owner(self, seating_pos: int):
-        if seating_pos is not None:
-            if (not 0 <= seating_pos < 4) and seating_pos is not None:
-                raise ValueError(
-                    "Owner should be seating position (0~3) or None,"
-                    f"Got {seating_pos} instead.")
-        self._owner = seating_pos
+    def __reduce__(self):
+        return Tile.from_index, (self.index,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __str__(self):
+        if self.suit == Suit.JIHAI.value:
+            return f"{ get_name(Jihai, self.rank) }"
+        else:
+            return f"{ self.rank } { get_name(Suit, self.suit) }"
+
+    def __repr__(self):
+        return f"Tile({self.suit}, {self.rank})"
 
     def calc_index(self):
-        return self._suit * 10 + self._rank
+        return self.suit * 10 + self.rank
 
     @staticmethod
     def suit_from_idx(ind):
@@ -115,65 +125,243 @@ class Tile:
 
     @classmethod
     def from_index(cls, ind):
-        suit = cls.suit_from_idx(ind)
-        rank = cls.rank_from_idx(ind)
-        return cls(suit, rank)
+        if 0 < ind < 40 and (tile := _TILES_BY_INDEX[ind]) is not None:
+            return tile
+        return cls._intern(cls.suit_from_idx(ind), cls.rank_from_idx(ind))
 
     @staticmethod
     def get_yaochuuhai() -> Tuple[List, List]:
-        honor_tiles = []
-        terminal_tiles = []
-        for suit in Suit:
-            if suit == Suit.JIHAI:
-                for rank in Jihai:
-                    honor_tiles.append(Tile(suit.value, rank.value))
-            else:
-                terminal_tiles.append(Tile(suit.value, 1))
-                terminal_tiles.append(Tile(suit.value, 9))
-
-        return honor_tiles, terminal_tiles
+        return list(_HONOR_TILES), list(_TERMINAL_TILES)
 
     def akadora(self):
         # red dora setter
         pass
 
     def next_tile(self):
-        if self._suit == Suit.JIHAI.value:
-            if self._rank <= Jihai.CHUN.value:
-                new_rank = (self._rank % 3) + 1  # Sangenpai
-            else:
-                new_rank = (self._rank - 3) % 4 + 4  # Kazehai
-        else:
-            new_rank = (self.rank % 9) + 1  # MANZU, SOUZU, PINZU 1~9
-        return self.from_index(self._suit * 10 + new_rank)
+        return _NEXT_TILE[self.index]
 
     def prev_tile(self):
-        if self._suit == Suit.JIHAI.value:
-            if self._rank <= Jihai.CHUN.value:
-                new_rank = (self._rank + 1) % 3 + 1  # Sangenpai
-            else:
-                new_rank = (self._rank + 3) % 4 + 4  # Kazehai
-        else:
-            new_rank = (self.rank + 7) % 9 + 1  # MANZU, SOUZU, PINZU 1~9
-        return self.from_index(self._suit * 10 + new_rank)
+        return _PREV_TILE[self.index]
+
+    def _next_rank(self):
+        if self.suit == Suit.JIHAI.value:
+            if self.rank <= Jihai.CHUN.value:
+                return (self.rank % 3) + 1  # Sangenpai
+            return (self.rank - 3) % 4 + 4  # Kazehai
+        return (self.rank % 9) + 1  # MANZU, SOUZU, PINZU 1~9
+
+    def _prev_rank(self):
+        if self.suit == Suit.JIHAI.value:
+            if self.rank <= Jihai.CHUN.value:
+                return (self.rank + 1) % 3 + 1  # Sangenpai
+            return (self.rank + 3) % 4 + 4  # Kazehai
+        return (self.rank + 7) % 9 + 1  # MANZU, SOUZU, PINZU 1~9
 
     def __eq__(self, other):
-        return self.rank == other.rank and self.suit == other.suit
+        if not isinstance(other, Tile):
+            return NotImplemented
+        return self.index == other.index
+
+    def __hash__(self):
+        return self.index
 
     def __lt__(self, other):
-        return self.suit < other.suit or (
-            self.suit == other.suit and self.rank < other.rank
-        )
+        if not isinstance(other, Tile):
+            return NotImplemented
+        return self.index < other.index
 
     def __gt__(self, other):
-        return self.suit > other.suit or (
-            self.suit == other.suit and self.rank > other.rank
-        )
+        if not isinstance(other, Tile):
+            return NotImplemented
+        return self.index > other.index
+
+
+class OwnedTile(Tile):
+    """A physical tile together with the seating position it came from,
+    e.g. the discarder of a called tile. Compares and hashes like the
+    interned tile it wraps.
+    """
+    __slots__ = ('owner', )
+
+    def __new__(cls, tile: Tile, owner: int):
+        if owner is not None and not 0 <= owner < 4:
+            raise ValueError(
+                "Owner should be seating position (0~3) or None,"
+                f"Got {owner} instead.")
+        owned = object.__new__(cls)
+        for name in ('suit', 'rank', 'index'):
+            object.__setattr__(owned, name, getattr(tile, name))
+        object.__setattr__(owned, 'owner', owner)
+        return owned
+
+    def __reduce__(self):
+        return OwnedTile, (self.tile, self.owner)
+
+    def __repr__(self):
+        return f"OwnedTile({self.tile!r}, {self.owner})"
+
+    @property
+    def tile(self) -> Tile:
+        return _TILES_BY_INDEX[self.index]
+
+
+_TILES_BY_INDEX: List[Tile] = [None] * 40
+_HONOR_TILES = tuple(Tile(Suit.JIHAI.value, rank.value) for rank in Jihai)
+_TERMINAL_TILES = tuple(
+    Tile(suit.value, rank)
+    for suit in Suit if suit != Suit.JIHAI
+    for rank in (1, 9)
+)
+_NEXT_TILE: Dict[int, Tile] = {}
+_PREV_TILE: Dict[int, Tile] = {}
+for _suit in range(4):
+    for _rank in range(1, 8 if _suit == Suit.JIHAI.value else 10):
+        _tile = Tile(_suit, _rank)
+        _NEXT_TILE[_tile.index] = Tile(_suit, _tile._next_rank())
+        _PREV_TILE[_tile.index] = Tile(_suit, _tile._prev_rank())
+
+
+# Every distinct tile index in sorted order, and its slot in a Hand
+TILE_INDICES: List[int] = [
+    suit * 10 + rank
+    for suit in range(4)
+    for rank in range(1, 8 if suit == Suit.JIHAI.value else 10)
+]
+SLOT_OF_INDEX: Dict[int, int] = {
+    index: slot for slot, index in enumerate(TILE_INDICES)}
+N_SLOTS = len(TILE_INDICES)  # 34
+
+
+class Hand:
+    """Tiles in hand as counts in 34 fixed slots, one per kind of tile.
+
+    Slots follow the order of Tile.index (jihai, manzu, souzu, pinzu), so
+    iterating slots is iterating tiles in sorted order. The hand reads and
+    writes like the defaultdict(int) keyed by Tile.index it replaces:
+    missing tiles count as 0 and only tiles held show up in keys/items.
+    """
+    __slots__ = ('_counts',)
+
+    def __init__(self, tiles: Iterable[Tile] = ()):
+        self._counts = array('b', bytes(N_SLOTS))
+        for tile in tiles:
+            self._counts[SLOT_OF_INDEX[tile.index]] += 1
+
+    @classmethod
+    def from_counts(cls, counts) -> 'Hand':
+        """Build a hand from a mapping of tile index to count, or from a
+        34-slot sequence of counts.
+        """
+        hand = cls()
+        if hasattr(counts, 'items'):
+            for index, count in counts.items():
+                if count:
+                    hand[index] = count
+        else:
+            hand._counts[:] = array('b', counts)
+        return hand
+
+    @classmethod
+    def from_signature(cls, signature: bytes) -> 'Hand':
+        """Rebuild a hand from its signature."""
+        hand = cls.__new__(cls)
+        hand._counts = array('b', signature)
+        return hand
+
+    @property
+    def counts(self) -> array:
+        """The 34-slot count buffer itself, not a copy
+        """
+        return self._counts
+
+    @property
+    def signature(self) -> bytes:
+        """Hashable snapshot of the hand
+        """
+        return self._counts.tobytes()
+
+    def copy(self) -> 'Hand':
+        hand = Hand.__new__(Hand)
+        hand._counts = self._counts[:]
+        return hand
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo) -> 'Hand':
+        return self.copy()
+
+    def add(self, index: int, n: int = 1) -> None:
+        self._counts[SLOT_OF_INDEX[index]] += n
+
+    def remove(self, index: int, n: int = 1) -> None:
+        self._counts[SLOT_OF_INDEX[index]] -= n
+
+    def __getitem__(self, index: int) -> int:
+        slot = SLOT_OF_INDEX.get(index)
+        return 0 if slot is None else self._counts[slot]
+
+    def __setitem__(self, index: int, count: int) -> None:
+        self._counts[SLOT_OF_INDEX[index]] = count
+
+    def get(self, index: int, default: int = 0) -> int:
+        slot = SLOT_OF_INDEX.get(index)
+        return default if slot is None else self._counts[slot]
+
+    def __contains__(self, index: int) -> bool:
+        return self[index] > 0
+
+    def keys(self) -> List[int]:
+        return [TILE_INDICES[slot]
+                for slot, count in enumerate(self._counts) if count > 0]
+
+    def values(self) -> List[int]:
+        return [count for count in self._counts if count > 0]
+
+    def items(self) -> List[Tuple[int, int]]:
+        return [(TILE_INDICES[slot], count)
+                for slot, count in enumerate(self._counts) if count > 0]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return sum(1 for count in self._counts if count > 0)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Hand):
+            return self._counts == other._counts
+        if hasattr(other, 'items'):
+            return dict(self.items()) == {
+                k: v for k, v in other.items() if v != 0}
+        return NotImplemented
+
+    __hash__ = None  # mutable, use signature as a key instead
+
+    def __repr__(self) -> str:
+        return f"Hand({dict(self.items())})"
+
+    def suit_keys(self) -> List[int]:
+        """Suit count signatures used by suit_tables, indexed by Suit value
+        """
+        keys = [0, 0, 0, 0]
+        for slot, count in enumerate(self._counts):
+            if count > 0:
+                index = TILE_INDICES[slot]
+                keys[index // 10] += count << rank_shift(index % 10)
+        return keys
 
 
 class Stack:
     # TODO: maybe rename as Haiyama, which are the tiles arranged in walls?
-    def __init__(self):
+    def __init__(self, seed=None, wall_order: Optional[List[int]] = None):
+        """
+        Args:
+            seed: shuffles the wall, see utils.get_rng
+            wall_order: indices of the 136 tiles from the first draw to the
+                last dora indicators, as given by Stack.wall_order;
+                the wall is not shuffled if given
+        """
+        self.rng = get_rng(seed)
         self.stack = []
 
         self.dora_index = -5
@@ -182,18 +370,35 @@ class Stack:
         self.doras = []
         self.uradoras = []
 
-        self.initiate()
+        self.initiate(wall_order)
         self.playing_wall = self.stack[:122].copy()
         self.rinshanpai = self.stack[-4:][::-1].copy()  # 王牌是最後七墩，嶺上牌是槓可以抽的最後四張
 
-    def initiate(self):
-        for suit in range(0, 4):
-            max_rank = 8 if suit == 0 else 10  # Jihai only have 7 values
-            for rank in range(1, max_rank):
-                for _ in itertools.repeat(None, 4):
-                    self.stack.append(Tile(suit, rank))
+    @classmethod
+    def from_wall_order(cls, wall_order: List[int]) -> 'Stack':
+        """Rebuild the wall of a Stack from its wall_order."""
+        return cls(wall_order=wall_order)
 
-        random.shuffle(self.stack)
+    @property
+    def wall_order(self) -> List[int]:
+        """Indices of the tiles in the wall, as dealt before any draw."""
+        return [tile.index for tile in self.stack]
+
+    def initiate(self, wall_order: Optional[List[int]] = None):
+        if wall_order is None:
+            for suit in range(0, 4):
+                max_rank = 8 if suit == 0 else 10  # Jihai only have 7 values
+                for rank in range(1, max_rank):
+                    for _ in itertools.repeat(None, 4):
+                        self.stack.append(Tile(suit, rank))
+
+            self.rng.shuffle(self.stack)
+        else:
+            self.stack = [Tile.from_index(index) for index in wall_order]
+            counts = Hand(self.stack)
+            if len(counts) != N_SLOTS or set(counts.values()) != {4}:
+                raise ValueError(
+                    "Wall order should have 4 copies of each of the 34 tiles")
         self.add_dora_indicator()
 
     @property
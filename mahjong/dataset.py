@@ -0,0 +1,148 @@
+"""Random access to every action of packed kyoku logs, for training.
+
+A ReplayDataset maps its log files and walks them once to index where
+each kyoku starts and how many actions it has; nothing else is read until
+asked for. Action i of the dataset is found by bisecting the index, and
+the state before it is rebuilt by a KyokuReplay of its kyoku. Replays are
+kept in an LRU cache, and each seeks from its nearest checkpoint, so
+sampling actions of the same kyokus again costs microseconds.
+
+Usage:
+    with ReplayDataset('logs/') as dataset:
+        for _ in range(batch_size):
+            kyoku, action = dataset.sample(rng)
+"""
+import glob
+import mmap
+import os
+import random
+import weakref
+from array import array
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+from .event_logger import ActionLog
+from .kyoku import Kyoku
+from .packed_log import PackedKyoku, kyoku_offsets, read_kyoku
+from .replay import KyokuReplay, CHECKPOINT_EVERY
+from .utils import LRUCache
+
+
+class ReplayDataset:
+    def __init__(
+        self,
+        path: str,
+        pattern: str = '*.log',
+        checkpoint_every: int = CHECKPOINT_EVERY,
+        cache_size: Optional[int] = 256,
+    ):
+        """
+        Args:
+            path: a packed log file, or a directory of them
+            pattern: of the log files in a directory
+            checkpoint_every: see KyokuReplay
+            cache_size: number of kyoku replays kept, None for all
+        """
+        if os.path.isdir(path):
+            self.paths = sorted(glob.glob(os.path.join(path, pattern)))
+        else:
+            self.paths = [path]
+        self.checkpoint_every = checkpoint_every
+        self._files = []
+        self._mmaps: List[mmap.mmap] = []
+        # one item per kyoku
+        self._file_ids = array('I')
+        self._offsets = array('Q')
+        self._n_actions = array('I')
+        # first dataset action of each kyoku, and the total at the end
+        self._starts = array('Q', [0])
+        self._replays = LRUCache(cache_size)
+        # the kyokus handed out, whose views close has to release
+        self._kyokus: 'weakref.WeakSet[PackedKyoku]' = weakref.WeakSet()
+
+        for file_id, file_path in enumerate(self.paths):
+            f = open(file_path, 'rb')
+            self._files.append(f)
+            if not os.fstat(f.fileno()).st_size:
+                self._mmaps.append(None)
+                continue
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mmaps.append(buffer)
+            for offset, n_actions in kyoku_offsets(buffer):
+                self._file_ids.append(file_id)
+                self._offsets.append(offset)
+                self._n_actions.append(n_actions)
+                self._starts.append(self._starts[-1] + n_actions)
+
+    @property
+    def n_kyokus(self) -> int:
+        return len(self._offsets)
+
+    def __len__(self) -> int:
+        """Number of actions in the dataset."""
+        return self._starts[-1]
+
+    def n_actions(self, kyoku_id: int) -> int:
+        return self._n_actions[kyoku_id]
+
+    def kyoku(self, kyoku_id: int) -> PackedKyoku:
+        """The packed records of a kyoku, read from the map. They are
+        released when the dataset is closed.
+        """
+        kyoku = read_kyoku(self._mmaps[self._file_ids[kyoku_id]],
+                           self._offsets[kyoku_id])
+        self._kyokus.add(kyoku)
+        return kyoku
+
+    def replay(self, kyoku_id: int) -> KyokuReplay:
+        """The cached replay of a kyoku."""
+        if (replay := self._replays.get(kyoku_id)) is None:
+            replay = KyokuReplay(self.kyoku(kyoku_id), self.checkpoint_every)
+            self._replays.put(kyoku_id, replay)
+        return replay
+
+    def locate(self, i: int) -> Tuple[int, int]:
+        """The kyoku of action i of the dataset, and its index there."""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('action index out of range')
+        kyoku_id = bisect_right(self._starts, i) - 1
+        return kyoku_id, i - self._starts[kyoku_id]
+
+    def state_at(self, kyoku_id: int, position: int) -> Kyoku:
+        """The kyoku right before its position-th action was taken.
+        The Kyoku belongs to the cached replay and only stays valid until
+        the same kyoku is asked for again.
+        """
+        return self.replay(kyoku_id).seek(position)
+
+    def __getitem__(self, i: int) -> Tuple[Kyoku, ActionLog]:
+        """Action i of the dataset, with the state it was taken in."""
+        kyoku_id, position = self.locate(i)
+        replay = self.replay(kyoku_id)
+        return replay.seek(position), replay.action(position)
+
+    def sample(self, rng=random) -> Tuple[Kyoku, ActionLog]:
+        """A uniformly random action, see __getitem__."""
+        return self[rng.randrange(len(self))]
+
+    def close(self) -> None:
+        # views into the maps have to go before the maps can close
+        self._replays.clear()
+        for kyoku in list(self._kyokus):
+            kyoku.records.release()
+        self._kyokus = weakref.WeakSet()
+        for buffer in self._mmaps:
+            if buffer is not None:
+                buffer.close()
+        self._mmaps = []
+        for f in self._files:
+            f.close()
+        self._files = []
+
+    def __enter__(self) -> 'ReplayDataset':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
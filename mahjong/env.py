@@ -0,0 +1,254 @@
+"""A step environment over a Kyoku for training loops.
+
+The env plays a kyoku by driving the steps of Kyoku.start, see steps. It
+stops at each Ask of a seat it controls, returns that decision to the
+agent, and sends the agent's action back into the steps on step(). The
+Asks of the other seats are answered right away, so a kyoku plays out the
+same as it would without the env.
+
+Usage:
+    env = KyokuEnv(seed=0)
+    observation, mask = env.reset()
+    while True:
+        action = policy(observation, mask)
+        observation, mask, rewards, done, info = env.step(action)
+        if done:
+            break
+"""
+from array import array
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .action_space import (
+    Choice, LegalActions, N_ACTIONS, action_mask, encode_action_list,
+    encode_discards
+)
+from .components import Action, Naki, Tile, Hand, Jihai
+from .helpers import convert_hand
+from .input_handler import DummyInput
+from .kyoku import Kyoku
+from .player import Player
+from .renderer import Renderer
+from .steps import Ask, DrivenInput, Steps
+from .utils import get_rng
+
+ALL_SEATS = (0, 1, 2, 3)
+
+
+class DecisionType(Enum):
+    ACTION = 0  # pick from an action_list
+    DISCARD = 1  # pick a tile to discard
+    DONE = 2  # the kyoku is over
+
+
+class Observation:
+    """What a seat sees when it has to decide, copied out of the kyoku so
+    that it stays valid after the kyoku moves on.
+    """
+
+    def __init__(
+        self,
+        kyoku: Kyoku,
+        seat: int,
+        decision_type: DecisionType,
+        new_tile: Optional[Tile] = None,
+        is_discard: bool = False,
+    ):
+        """
+        Args:
+            seat: the seat deciding
+            new_tile: the drawn or discarded tile the decision is about
+            is_discard: if new_tile was discarded by another seat
+        """
+        player = kyoku.players[seat]
+        stack = kyoku.tile_stack
+        self.seat: int = seat
+        self.decision_type: DecisionType = decision_type
+        self.new_tile: Optional[Tile] = new_tile
+        self.is_discard: bool = is_discard
+        self.hand: Hand = player.hand.copy()
+        self.jikaze: Jihai = player.jikaze
+        self.bakaze: Jihai = kyoku.bakaze
+        self.honba: int = kyoku.honba
+        self.kyotaku: int = kyoku.kyotaku
+        self.kawa: Tuple[Tuple[Tile, ...], ...] = tuple(
+            tuple(p.kawa) for p in kyoku.players)
+        # (naki type, tiles) of each seat's huros
+        self.kabe: Tuple[Tuple[Tuple[Naki, Tuple[Tile, ...]], ...], ...] = \
+            tuple(tuple((huro.naki_type, tuple(huro.tiles))
+                        for huro in p.kabe)
+                  for p in kyoku.players)
+        self.is_riichi: Tuple[bool, ...] = tuple(
+            p.is_riichi for p in kyoku.players)
+        self.points: Tuple[int, ...] = tuple(p.points for p in kyoku.players)
+        self.dora_indicators: Tuple[Tile, ...] = tuple(
+            stack.dora_indicators)
+        self.tiles_left: int = len(stack.playing_wall)
+
+
+def legal_discards(
+    player: Player, new_tile: Optional[Tile], kuikae_tiles: List[Tile]
+) -> List[Tile]:
+    """The tiles player may discard, as UserInput.discard is asked."""
+    if player.is_riichi and new_tile:
+        return [new_tile]  # tsumogiri after riichi
+    tiles = [tile for tile in convert_hand(player.hand)
+             if tile not in kuikae_tiles]
+    if new_tile and new_tile not in kuikae_tiles:
+        tiles.append(new_tile)
+    return tiles
+
+
+class _Decision:
+    def __init__(self, observation: Observation, choices: Dict[int, Choice],
+                 mask: Optional[array] = None):
+        self.observation = observation
+        self.choices = choices
+        self.mask = action_mask(choices) if mask is None else mask
+
+
+class KyokuEnv:
+    def __init__(
+        self,
+        agent_seats: Iterable[int] = ALL_SEATS,
+        bakaze: Jihai = Jihai.TON,
+        custom_rules: Optional[dict] = None,
+        seed=None,
+    ):
+        """
+        Args:
+            agent_seats: seats decided through step(), the others are
+                played by DummyInput
+            seed: seeds the walls of the kyokus and the choices of the
+                other seats, see utils.get_rng
+        """
+        self.agent_seats = set(agent_seats)
+        self.bakaze = bakaze
+        self.custom_rules = custom_rules or {}
+        self.rng = get_rng(seed)
+        self.kyoku: Optional[Kyoku] = None
+        self._input = DrivenInput()
+        self._dummy = DummyInput(Renderer(), self.rng)
+        self._steps: Optional[Steps] = None
+        self._decision: Optional[_Decision] = None
+        self._start_points: List[int] = []
+
+    @property
+    def legal_actions(self) -> List[int]:
+        """Action ids legal at the current decision."""
+        return sorted(self._decision.choices) if self._decision else []
+
+    def reset(
+        self, wall_order: Optional[List[int]] = None
+    ) -> Tuple[Observation, array]:
+        """Deal a new kyoku and play it until the first decision of an
+        agent seat.
+        Args:
+            wall_order: deal this wall instead of a seeded one
+        Returns:
+            observation and legal-action mask of that decision
+        """
+        self.close()
+        renderer = Renderer()
+        players = [
+            Player(f'Seat {seat}', seat,
+                   self._input if seat in self.agent_seats else self._dummy,
+                   renderer)
+            for seat in ALL_SEATS
+        ]
+        self.kyoku = Kyoku(players, self.bakaze,
+                           custom_rules=self.custom_rules, renderer=renderer,
+                           seed=self.rng, wall_order=wall_order)
+        self._start_points = [player.points for player in players]
+        self._steps = self.kyoku.start_steps()
+        observation, mask, _, _, _ = self._play()
+        return observation, mask
+
+    def step(
+        self, action: int
+    ) -> Tuple[Observation, array, List[int], bool, dict]:
+        """Play action and the kyoku up to the next agent decision.
+        Args:
+            action: a legal action id, see action_space
+        Returns:
+            observation, legal-action mask, point change of each seat
+            (all 0 until the kyoku is done), done and an info dict with
+            the kyoku's result once done
+        """
+        if self._decision is None:
+            raise RuntimeError("Call reset() before step()")
+        if action not in self._decision.choices:
+            raise ValueError(f"Action {action} is not legal here, "
+                             f"legal actions: {self.legal_actions}")
+        choice = self._decision.choices[action]
+        self._decision = None
+        return self._play(choice)
+
+    def close(self) -> None:
+        """Stop the kyoku being played, if any."""
+        if self._steps is not None:
+            self._steps.close()
+        self._steps = None
+        self._decision = None
+
+    def _play(
+        self, choice: Optional[Choice] = None
+    ) -> Tuple[Observation, array, List[int], bool, dict]:
+        """Send choice to the pending Ask, if any, and play the kyoku up
+        to the next decision of an agent seat, or to its end.
+        """
+        try:
+            ask = self._steps.send(choice)
+            while True:
+                if ask.player.seating_position not in self.agent_seats:
+                    ask = self._steps.send(ask())
+                elif (decision := self._decision_of(ask)) is None:
+                    ask = self._steps.send((Action.NOACT, Naki.NONE, []))
+                else:
+                    self._decision = decision
+                    return (decision.observation, decision.mask,
+                            [0, 0, 0, 0], False, {})
+        except StopIteration as stop:
+            self._steps = None
+            return self._done(*stop.value)
+
+    def _decision_of(self, ask: Ask) -> Optional[_Decision]:
+        """The decision an Ask of an agent seat puts to the agent, None
+        when the only choice is to let a discard go.
+        """
+        player = ask.player
+        if ask.name == 'discard':
+            new_tile, kuikae_tiles = ask.args
+            tiles = legal_discards(player, new_tile, kuikae_tiles)
+            observation = Observation(
+                self.kyoku, player.seating_position, DecisionType.DISCARD,
+                new_tile)
+            return _Decision(observation, encode_discards(tiles))
+
+        new_tile, action_list, discard = ask.args
+        if (action_list == [(Action.NOACT, Naki.NONE, [])]) and discard:
+            return None
+        if isinstance(action_list, LegalActions):
+            choices, mask = action_list.choices, action_list.mask
+        else:
+            choices, mask = encode_action_list(action_list, new_tile), None
+        observation = Observation(
+            self.kyoku, player.seating_position, DecisionType.ACTION,
+            new_tile, discard)
+        return _Decision(observation, choices, mask)
+
+    def _done(
+        self, renchan: bool, kyotaku: int, honba: int
+    ) -> Tuple[Observation, array, List[int], bool, dict]:
+        rewards = [player.points - start for player, start
+                   in zip(self.kyoku.players, self._start_points)]
+        seat = self.kyoku.winners[0].seating_position \
+            if self.kyoku.winners else self.kyoku.oya_player.seating_position
+        observation = Observation(self.kyoku, seat, DecisionType.DONE)
+        info = {
+            'winners': [p.seating_position for p in self.kyoku.winners],
+            'renchan': renchan,
+            'kyotaku': kyotaku,
+            'honba': honba,
+        }
+        return observation, array('b', bytes(N_ACTIONS)), rewards, True, info
@@ -1,4 +1,6 @@
-from .components import Naki, Action, Tile, Huro
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .components import Naki, Action, Tile, Huro, Jihai
 
 
 class ActionLog:
@@ -38,9 +40,82 @@ class ActionLog:
 class KyokuLogger:
     def __init__(self):
         self.logs = []
+        # how the kyoku started, so that it can be replayed from its logs
+        self.wall_order: Optional[List[int]] = None
+        self.bakaze: Optional[Jihai] = None
+        self.oya: Optional[int] = None
+        self.honba: int = 0
+        self.kyotaku: int = 0
+        self.points: Optional[List[int]] = None
+        # how it ended, see log_end
+        self.han_fu: Dict[int, Tuple[int, int]] = {}
+        self.deltas: Optional[List[int]] = None
+        # told of the start and of every action as they are logged, with
+        # on_start(logger) and on_log(action_log), and of the logs going
+        # back to earlier ones with on_restore(logger), e.g. a VisibleTiles
+        self.listeners: List = []
 
     def log(self, **kwargs):
-        self.logs.append(ActionLog(**kwargs))
+        if (huro := kwargs.get('huro')) is not None:
+            # a pon's Huro turns into a chakan later, log it as it is now
+            kwargs['huro'] = Huro(huro.naki_type, huro.naki_tile,
+                                  list(huro.tiles))
+        action_log = ActionLog(**kwargs)
+        self.logs.append(action_log)
+        for listener in self.listeners:
+            listener.on_log(action_log)
+
+    def log_start(
+        self,
+        wall_order: List[int],
+        bakaze: Jihai,
+        oya: int,
+        honba: int,
+        kyotaku: int,
+        points: List[int],
+    ) -> None:
+        """Record the state a kyoku starts from, before the deal.
+        Args:
+            wall_order: see Stack.wall_order
+            oya: seating position of the oya
+            points: of each seat
+        """
+        self.wall_order = list(wall_order)
+        self.bakaze = bakaze
+        self.oya = oya
+        self.honba = honba
+        self.kyotaku = kyotaku
+        self.points = list(points)
+        for listener in self.listeners:
+            listener.on_start(self)
+
+    def restore(self, logs: List[ActionLog]) -> None:
+        """Go back to logs, the logs of this kyoku up to some earlier
+        action, e.g. those of a KyokuSnapshot.
+        """
+        self.logs = list(logs)
+        for listener in self.listeners:
+            listener.on_restore(self)
+
+    def log_end(
+        self, han_fu: Dict[int, Tuple[int, int]], deltas: List[int]
+    ) -> None:
+        """Record how the kyoku ended, after points are paid.
+        Args:
+            han_fu: seating position -> (han, fu) of every winner
+            deltas: change of each seat's points over the kyoku
+        """
+        self.han_fu = dict(han_fu)
+        self.deltas = list(deltas)
+
+    def __len__(self) -> int:
+        return len(self.logs)
+
+    def __getitem__(self, i: int) -> ActionLog:
+        return self.logs[i]
+
+    def __iter__(self) -> Iterator[ActionLog]:
+        return iter(self.logs)
 
     def __str__(self):
         return "\n".join(map(str, self.logs))
@@ -0,0 +1,187 @@
+"""Encode what a seat sees as fixed-shape NumPy feature planes, in the
+spirit of the paper in the README (Suphx, arXiv:2003.13590): every plane
+has one column per kind of tile, tile counts are spread over 4 binary
+planes (has at least 1, 2, 3, 4), and scalars fill a whole plane.
+
+Seats are relative to the observer, 0 being itself, 1 its shimocha and
+so on. Planes are written in place into a preallocated buffer of shape
+(batch_size, N_PLANES, 34), one row per simultaneous game, so encoding a
+decision allocates nothing.
+
+Needs numpy, which the rest of the game doesn't.
+"""
+from typing import Iterable, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from .components import Huro, Tile, Suit, SLOT_OF_INDEX, N_SLOTS
+if TYPE_CHECKING:
+    from .env import Observation
+    from .kyoku import Kyoku
+
+N_SEATS = 4
+COUNT_PLANES = 4  # has at least 1, 2, 3 and 4 copies
+
+# first plane of each feature
+HAND = 0
+NEW_TILE = HAND + COUNT_PLANES
+KAWA = NEW_TILE + 1  # COUNT_PLANES per seat
+KAWA_ORDER = KAWA + COUNT_PLANES * N_SEATS  # 1 per seat
+KABE = KAWA_ORDER + N_SEATS  # COUNT_PLANES per seat
+DORA_INDICATORS = KABE + COUNT_PLANES * N_SEATS
+RIICHI = DORA_INDICATORS + COUNT_PLANES  # 1 per seat
+POINTS = RIICHI + N_SEATS  # 1 per seat
+BAKAZE = POINTS + N_SEATS
+JIKAZE = BAKAZE + 1
+HONBA = JIKAZE + 1
+KYOTAKU = HONBA + 1
+TILES_LEFT = KYOTAKU + 1
+N_PLANES = TILES_LEFT + 1
+
+# scales that bring the scalar planes to about [0, 1]
+MAX_KAWA = 24
+POINTS_SCALE = 100_000
+HONBA_SCALE = 10
+KYOTAKU_SCALE = 10
+PLAYING_WALL = 122
+
+_THRESHOLDS = np.arange(COUNT_PLANES).reshape(-1, 1)
+
+
+class FeatureEncoder:
+    def __init__(self, batch_size: int = 1, dtype=np.float32):
+        """
+        Args:
+            batch_size: rows of the buffer, e.g. one per concurrent game
+            dtype: of the buffer
+        """
+        self.buffer = np.zeros((batch_size, N_PLANES, N_SLOTS), dtype)
+        self._counts = np.zeros(N_SLOTS, np.int8)
+
+    @property
+    def batch_size(self) -> int:
+        return self.buffer.shape[0]
+
+    def encode_kyoku(
+        self,
+        kyoku: 'Kyoku',
+        seat: int,
+        new_tile: Optional[Tile] = None,
+        index: int = 0,
+    ) -> np.ndarray:
+        """Encode the live state of kyoku as seat sees it.
+        Args:
+            seat: the observer
+            new_tile: the drawn or discarded tile to decide on
+            index: row of the buffer to write
+        Returns:
+            the row, a view into the buffer
+        """
+        players = kyoku.players
+        return self._write(
+            index, seat,
+            hand=players[seat].hand,
+            new_tile=new_tile,
+            kawas=[player.kawa for player in players],
+            kabes=[player.kabe for player in players],
+            dora_indicators=kyoku.tile_stack.dora_indicators,
+            is_riichi=[player.is_riichi for player in players],
+            points=[player.points for player in players],
+            bakaze=kyoku.bakaze,
+            jikaze=players[seat].jikaze,
+            honba=kyoku.honba,
+            kyotaku=kyoku.kyotaku,
+            tiles_left=len(kyoku.tile_stack.playing_wall),
+        )
+
+    def encode(self, observation: 'Observation', index: int = 0
+               ) -> np.ndarray:
+        """Encode an env Observation into row index of the buffer."""
+        return self._write(
+            index, observation.seat,
+            hand=observation.hand,
+            new_tile=observation.new_tile,
+            kawas=observation.kawa,
+            kabes=[[tiles for _, tiles in kabe]
+                   for kabe in observation.kabe],
+            dora_indicators=observation.dora_indicators,
+            is_riichi=observation.is_riichi,
+            points=observation.points,
+            bakaze=observation.bakaze,
+            jikaze=observation.jikaze,
+            honba=observation.honba,
+            kyotaku=observation.kyotaku,
+            tiles_left=observation.tiles_left,
+        )
+
+    def encode_batch(self, observations: Sequence['Observation']
+                     ) -> np.ndarray:
+        """Encode one observation per row, e.g. one per concurrent game.
+        Returns:
+            the first len(observations) rows of the buffer
+        """
+        if len(observations) > self.batch_size:
+            raise ValueError(
+                f"{len(observations)} observations don't fit in a batch "
+                f"of {self.batch_size}")
+        for index, observation in enumerate(observations):
+            self.encode(observation, index)
+        return self.buffer[:len(observations)]
+
+    def _write(
+        self, index, seat, hand, new_tile, kawas, kabes, dora_indicators,
+        is_riichi, points, bakaze, jikaze, honba, kyotaku, tiles_left,
+    ) -> np.ndarray:
+        planes = self.buffer[index]
+        planes.fill(0)
+
+        self._count_planes(planes, HAND,
+                           np.frombuffer(hand.counts, np.int8))
+        if new_tile is not None:
+            planes[NEW_TILE, SLOT_OF_INDEX[new_tile.index]] = 1
+
+        for other in range(N_SEATS):
+            relative = (other - seat) % N_SEATS
+            kawa = kawas[other]
+            self._count_planes(planes, KAWA + COUNT_PLANES * relative,
+                               self._tile_counts(kawa))
+            order = planes[KAWA_ORDER + relative]
+            for i, tile in enumerate(kawa):
+                order[SLOT_OF_INDEX[tile.index]] = (i + 1) / MAX_KAWA
+            self._count_planes(planes, KABE + COUNT_PLANES * relative,
+                               self._huro_counts(kabes[other]))
+            planes[RIICHI + relative] = is_riichi[other]
+            planes[POINTS + relative] = points[other] / POINTS_SCALE
+
+        self._count_planes(planes, DORA_INDICATORS,
+                           self._tile_counts(dora_indicators))
+        for plane, wind in ((BAKAZE, bakaze), (JIKAZE, jikaze)):
+            wind_tile = Tile(Suit.JIHAI.value, wind.value)
+            planes[plane, SLOT_OF_INDEX[wind_tile.index]] = 1
+        planes[HONBA] = honba / HONBA_SCALE
+        planes[KYOTAKU] = kyotaku / KYOTAKU_SCALE
+        planes[TILES_LEFT] = tiles_left / PLAYING_WALL
+        return planes
+
+    @staticmethod
+    def _count_planes(planes: np.ndarray, first: int, counts: np.ndarray
+                      ) -> None:
+        np.greater(counts, _THRESHOLDS,
+                   out=planes[first:first + COUNT_PLANES], casting='unsafe')
+
+    def _tile_counts(self, tiles: Iterable[Tile]) -> np.ndarray:
+        counts = self._counts
+        counts.fill(0)
+        for tile in tiles:
+            counts[SLOT_OF_INDEX[tile.index]] += 1
+        return counts
+
+    def _huro_counts(self, kabe: Iterable) -> np.ndarray:
+        """Counts of the tiles in a kabe, given as Huros or their tiles."""
+        counts = self._counts
+        counts.fill(0)
+        for huro in kabe:
+            tiles = huro.tiles if isinstance(huro, Huro) else huro
+            for tile in tiles:
+                counts[SLOT_OF_INDEX[tile.index]] += 1
+        return counts
@@ -2,45 +2,49 @@ import json
 import os
 from typing import List, Optional
 
-from pyfiglet import Figlet
-
 from .player import Player
 from .components import Jihai
 from .kyoku import Kyoku
 from .helpers import rank_players
+from .renderer import Renderer, renderer_switch
+from .steps import Steps, call, driven
+from .utils import get_rng
 
 
 class Game:
     def __init__(
         self,
         player_names: List[str],
-        config_file: Optional[str] = 'config.json'
+        config_file: Optional[str] = 'config.json',
+        renderer: Optional[Renderer] = None,
+        seed=None
     ):
+        """
+        Args:
+            player_names: names of the four players, in seating order
+            config_file: file name of the game config in configs/
+            renderer: where the game is shown, defaults to the terminal
+                unless "headless" is set in the game config
+            seed: shuffles the walls of every kyoku, see utils.get_rng
+        """
         self.bakaze = Jihai.TON
         self.kyoku_num = 1  # e.g.東1局
         self.config_file = config_file
         self.game_config, self.custom_rules = self.load_config()
+        if renderer is None:
+            renderer = renderer_switch(
+                self.game_config.get('headless', False))
+        self.renderer = renderer
+        self.rng = get_rng(seed)
         self.players = self.get_init_players(player_names,
                                              self.game_config['input'],
                                              self.game_config['A.I. players'])
         self.current_kyoku = Kyoku(self.players,
                                    custom_rules=self.custom_rules,
-                                   debug_mode=self.game_config['debug mode'])
-        figlet = Figlet(font='slant')
-        print(figlet.renderText('Mahjong 4 RL'))
-        print('\n----------------------------------')
-        print('Initiating a game...')
-        print(f"Debug mode: {self.game_config['debug mode']}")
-        print(f"Game type: {self.game_config['game type']}")
-        print('Players in game:')
-        for player in self.players:
-            print(f'    {player.seating_position}-{player.name}')
-        print('Rules in this game:')
-        for k, v in self.custom_rules.items():
-            print(f'    {k}: {v}')
-        if self.game_config['debug mode']:
-            input("\nPress enter to continue...")
-            print(chr(27) + "[2J")
+                                   debug_mode=self.game_config['debug mode'],
+                                   renderer=self.renderer,
+                                   seed=self.rng)
+        self.renderer.game_start(self)
 
     def load_config(self):
         parent_directory = os.path.split(os.path.dirname(__file__))[0]
@@ -55,24 +59,23 @@ class Game:
         players = []
         for i, name in enumerate(player_names):
             if i in ai_players:
-                players.append(Player(name, i, 'dummy'))
+                players.append(Player(name, i, 'dummy', self.renderer))
             else:
-                players.append(Player(name, i, input_method))
+                players.append(Player(name, i, input_method, self.renderer))
         return players
 
-    def start_game(self):
+    def start_game_steps(self) -> Steps:
         while True:
-            print('\n----------------------------------')
-            print('Starting Kyoku...')
-            print(f"{self.bakaze.name} {self.kyoku_num} Kyoku")
-            renchan, kyotaku, honba = self.current_kyoku.start()
+            self.renderer.kyoku_start(self)
+            renchan, kyotaku, honba = yield from call(
+                self.current_kyoku, 'start')
             if self.check_tobu():  # 有人被飛
                 break
             if not renchan:
-                if self.check_lask_kyoku():
+                if self.ckeck_last_kyoku():
                     break  # end game
                 elif self.kyoku_num == 4:
-                    self.bakaze == Jihai.NAN
+                    self.bakaze = Jihai.NAN
                     self.kyoku_num = 1
                 else:
                     self.kyoku_num += 1
@@ -87,19 +90,24 @@ class Game:
                 else:
                     pass
 
-            input("\nPress enter to enter next kyoku...")
-            print(chr(27) + "[2J")
+            self.renderer.pause("\nPress enter to enter next kyoku...")
             for player in self.players:
                 player.reset_state()
 
-            self.current_kyoku = Kyoku(self.players,
-                                       bakaze=self.bakaze,
-                                       honba=honba,
-                                       kyotaku=kyotaku,
-                                       custom_rules=self.custom_rules)
+            self.current_kyoku = Kyoku(
+                self.players,
+                bakaze=self.bakaze,
+                honba=honba,
+                kyotaku=kyotaku,
+                custom_rules=self.custom_rules,
+                debug_mode=self.game_config['debug mode'],
+                renderer=self.renderer,
+                seed=self.rng)
         # 遊戲結束
         self.end_game()
 
+    start_game = driven(start_game_steps)
+
     def check_tobu(self):
         return any(filter(lambda p: p.points < 0, self.players))
 
@@ -127,9 +135,4 @@ class Game:
         return False
 
     def end_game(self):
-        print('\n----------------------------------')
-        print('End Game')
-        ranked_players = rank_players(self.players)
-        for i, player in enumerate(ranked_players):
-            lname = f"No. {i + 1}: player {player.name} ".ljust(30)
-            print(f"{lname}{player.points} points")
+        self.renderer.game_end(self)
@@ -0,0 +1,160 @@
+"""Every way an agari hand splits into sets and a jantou, worked out once
+per agari and shared read-only by all the YakuTypes evaluators of a
+YakuCalculator.
+"""
+import copy
+from functools import lru_cache
+from itertools import product
+from typing import Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from .components import Tile, Hand, Suit
+from .suit_tables import RANK_MASK, hand_to_keys, rank_shift
+if TYPE_CHECKING:
+    from .player import Player
+
+# (koutsus, shuntsus, jantou), the same shape separate_sets returns
+Separation = Tuple[Tuple[Tile, ...], Tuple[Tuple[Tile, Tile, Tile], ...],
+                   Optional[Tile]]
+
+NO_SEPARATION: Separation = ((), (), None)
+
+
+# (koutsu ranks, shuntsu ranks) of one way a suit forms sets
+SuitSplit = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+
+@lru_cache(maxsize=4096)
+def suit_splits(key: int, numbered: bool) -> Tuple[SuitSplit, ...]:
+    """Every way the tiles of one suit form sets, found by backtracking
+    from the lowest rank; the sub-results are memoized by their key.
+    Args:
+        key: suit signature of the tiles, see suit_tables.counts_to_key
+        numbered: if shuntsu are allowed, False for jihai
+    Returns:
+        tuple of (koutsu ranks, shuntsu ranks), empty if no way exists
+    """
+    if key == 0:
+        return (((), ()),)
+    rank = 1
+    while not (key >> rank_shift(rank)) & RANK_MASK:
+        rank += 1
+
+    splits = []
+    koutsu = 3 << rank_shift(rank)
+    if (key >> rank_shift(rank)) & RANK_MASK >= 3:
+        for koutsus, shuntsus in suit_splits(key - koutsu, numbered):
+            splits.append(((rank,) + koutsus, shuntsus))
+    if numbered and rank <= 7:
+        shuntsu = sum(1 << rank_shift(rank + i) for i in range(3))
+        if all((key >> rank_shift(rank + i)) & RANK_MASK for i in (1, 2)):
+            for koutsus, shuntsus in suit_splits(key - shuntsu, numbered):
+                splits.append((koutsus, (rank,) + shuntsus))
+    return tuple(splits)
+
+
+def separations(hand, huro_count: int) -> List[Separation]:
+    """Every split of hand into a jantou and 4 - huro_count sets.
+    Args:
+        hand: tile index -> count, 14 tiles minus 3 per huro
+        huro_count: how many sets are already in kabe
+    Returns:
+        list of (koutsus, shuntsus, jantou), empty if the hand has no
+        standard form, e.g. chiitoitsu or kokushi musou
+    """
+    if sum(v for v in hand.values() if v > 0) != 14 - 3 * huro_count:
+        return []
+    keys = hand.suit_keys() if isinstance(hand, Hand) else hand_to_keys(hand)
+    set_splits = [suit_splits(key, suit != Suit.JIHAI.value)
+                  for suit, key in enumerate(keys)]
+    if sum(not splits for splits in set_splits) > 1:
+        return []  # more than one suit can't be all sets
+
+    results = []
+    for suit, key in enumerate(keys):
+        numbered = suit != Suit.JIHAI.value
+        other_splits = set_splits[:suit] + set_splits[suit + 1:]
+        if not all(other_splits):
+            continue
+        for rank in range(1, 10 if numbered else 8):
+            if (key >> rank_shift(rank)) & RANK_MASK < 2:
+                continue
+            jantou_splits = suit_splits(key - (2 << rank_shift(rank)),
+                                        numbered)
+            suits_splits = set_splits[:suit] + [jantou_splits] \
+                + set_splits[suit + 1:]
+            for combination in product(*suits_splits):
+                results.append(_to_separation(combination, suit, rank))
+    return results
+
+
+def _to_separation(
+    combination: Tuple[SuitSplit, ...], jantou_suit: int, jantou_rank: int
+) -> Separation:
+    koutsus = []
+    shuntsus = []
+    for suit, (koutsu_ranks, shuntsu_ranks) in enumerate(combination):
+        koutsus.extend(Tile(suit, rank) for rank in koutsu_ranks)
+        shuntsus.extend((Tile(suit, rank),
+                         Tile(suit, rank + 1),
+                         Tile(suit, rank + 2)) for rank in shuntsu_ranks)
+    return tuple(koutsus), tuple(shuntsus), Tile(jantou_suit, jantou_rank)
+
+
+def preferred_separation(
+    separations: List[Separation], koutsu_first: bool = True
+) -> Separation:
+    """The separation with the most koutsu, or the most shuntsu if
+    koutsu_first is False, as separate_sets would prefer them.
+    """
+    index = 0 if koutsu_first else 1
+    return max(separations, key=lambda s: len(s[index]),
+               default=NO_SEPARATION)
+
+
+class HandDecomposition:
+    """The agari hand of a player and all of its separations.
+    Evaluators share one instance, so none of its attributes should be
+    modified; copy them first.
+    """
+
+    def __init__(self, player: 'Player', agari_tile: Optional[Tile] = None):
+        """
+        Args:
+            player: the winner, before the agari tile is added to the hand
+            agari_tile: winning tile, player.agari_tile takes precedence
+        """
+        if player.agari_tile:
+            agari_tile = player.agari_tile
+        self.agari_tile: Tile = agari_tile
+
+        self.agari_hand: Hand = Hand.from_counts(player.hand)
+        self.agari_hand[agari_tile.index] += 1
+        self.huro_count: int = len(player.kabe)
+        self.huro_tiles: List[Tile] = [
+            tile for huro in player.kabe for tile in huro.tiles]
+        self.hand_and_kabe: Hand = self.agari_hand.copy()
+        for tile in self.huro_tiles:
+            self.hand_and_kabe[tile.index] += 1
+
+        self.separations: List[Separation] = separations(
+            self.agari_hand, self.huro_count)
+        # the separations evaluators read, e.g. 全帯么九 looks at shuntsu
+        # first when the hand could be read either way
+        self.koutsu_first: Separation = preferred_separation(
+            self.separations, True)
+        self.shuntsu_first: Separation = preferred_separation(
+            self.separations, False)
+
+    def per_separation(self) -> Iterator['HandDecomposition']:
+        """One decomposition per separation of the hand, in which the
+        evaluators read that separation only, so that each reading of the
+        hand can be scored on its own.
+        """
+        if len(self.separations) <= 1:
+            yield self
+            return
+        for separation in self.separations:
+            decomposition = copy.copy(self)
+            decomposition.koutsu_first = separation
+            decomposition.shuntsu_first = separation
+            yield decomposition
@@ -96,7 +96,7 @@ def consists_jantou_and_sets(remain_tiles: DefaultDict[int, int],
     """
     for tile_index in remain_tiles.keys():
         if remain_tiles[tile_index] >= 2:
-            tmp_hand = copy.deepcopy(remain_tiles)
+            tmp_hand = copy.copy(remain_tiles)
             tmp_hand[tile_index] -= 2
             if check_remains_are_sets(tmp_hand, took_out_sets_n):
                 return True
@@ -142,7 +142,7 @@ def separate_sets(
 
     for possible_jantou in hand.keys():
         if hand[possible_jantou] >= 2:  # try using it as jantou
-            remain_tiles = copy.deepcopy(hand)
+            remain_tiles = copy.copy(hand)
             remain_tiles[possible_jantou] -= 2
 
             koutsu = []
@@ -195,7 +195,7 @@ def get_atamahane_winner(houjuu_pos: int, winners: List[int]) -> int:
     Return:
         winner_pos: int
     """
-    if not houjuu_pos:
+    if houjuu_pos is None:
         return winners[0]
 
     # TODO: use get_shimocha()
@@ -206,6 +206,26 @@ def get_atamahane_winner(houjuu_pos: int, winners: List[int]) -> int:
     return winner_pos
 
 
+def calculate_base_points(han: int, fu: int) -> int:
+    """Base points 基本点 of a hand, before the oya / ko multipliers.
+    """
+    points = fu * 2**(han + 2)
+    if points > 2_000:
+        if han <= 5:  # mangan
+            points = 2_000
+        elif han == 6 or han == 7:
+            points = 3_000
+        elif han >= 8 and han <= 10:
+            points = 4_000
+        elif han == 11 or han == 12:
+            points = 6_000
+        elif han == 13:
+            points = 8_000
+        elif han == 26:
+            points = 16_000
+    return points
+
+
 def get_wind_tiles() -> List[Tile]:
     """return a list of four wind tiles
     """
@@ -0,0 +1,225 @@
+"""Batched inference for neural-network players across concurrent games.
+
+play_batched_games plays many games on one thread by driving their steps,
+see steps. A game is played up to the next decision its policy has to
+make, and waits there, suspended at its Ask; once every game being
+played waits, or batch_size of them do, the waiting decisions are encoded
+by a FeatureEncoder, the policy runs once on all of them and those games
+go on with the chosen actions. A waiting game is stopped, so its kyoku is
+encoded as it stands, without being copied.
+
+NumpyPolicy stands in for a real network, a small MLP on the CPU, so
+that the throughput of the whole setup can be measured without one.
+
+Needs numpy, as features does.
+
+Usage:
+    inference = BatchedInference(NumpyPolicy(seed=0), batch_size=32)
+    records = play_batched_games(range(64), inference)
+"""
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .action_space import (
+    Choice, N_ACTIONS, encode_action_list, encode_discards
+)
+from .components import Action, Naki, Tile, N_SLOTS
+from .env import legal_discards
+from .features import FeatureEncoder, N_PLANES
+from .game import Game
+from .kyoku import Kyoku
+from .self_play import GameRecord, KyokuCollector, PLAYER_NAMES
+from .steps import Ask, DrivenInput
+
+# (batch, N_PLANES, 34) features -> (batch, N_ACTIONS) logits
+Policy = Callable[[np.ndarray], np.ndarray]
+
+
+class NumpyPolicy:
+    """A random two-layer MLP, standing in for a trained policy."""
+
+    def __init__(self, n_hidden: int = 256, seed=None, dtype=np.float32):
+        rng = np.random.default_rng(seed)
+        n_inputs = N_PLANES * N_SLOTS
+        self.w1 = (rng.standard_normal((n_inputs, n_hidden))
+                   / np.sqrt(n_inputs)).astype(dtype)
+        self.b1 = np.zeros(n_hidden, dtype)
+        self.w2 = (rng.standard_normal((n_hidden, N_ACTIONS))
+                   / np.sqrt(n_hidden)).astype(dtype)
+        self.b2 = np.zeros(N_ACTIONS, dtype)
+
+    def __call__(self, features: np.ndarray) -> np.ndarray:
+        hidden = features.reshape(len(features), -1) @ self.w1 + self.b1
+        np.maximum(hidden, 0, out=hidden)
+        return hidden @ self.w2 + self.b2
+
+
+def masked_argmax(logits: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    """The legal action with the highest logit, per row."""
+    return np.where(masks, logits, -np.inf).argmax(axis=1)
+
+
+class _Request:
+    __slots__ = ('kyoku', 'seat', 'new_tile', 'choices')
+
+    def __init__(self, kyoku: Kyoku, seat: int, new_tile: Optional[Tile],
+                 choices: Dict[int, Choice]):
+        self.kyoku = kyoku
+        self.seat = seat
+        self.new_tile = new_tile
+        self.choices = choices
+
+
+class BatchedInference:
+    def __init__(self, policy: Policy, batch_size: int = 32):
+        """
+        Args:
+            policy: maps a batch of feature planes to action logits
+            batch_size: most decisions evaluated at once
+        """
+        self.policy = policy
+        self.batch_size = batch_size
+        self.encoder = FeatureEncoder(batch_size)
+        self.masks = np.zeros((batch_size, N_ACTIONS), bool)
+        self.n_batches = 0
+        self.n_decisions = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.n_decisions / self.n_batches if self.n_batches else 0.0
+
+    def evaluate(self, batch: List[_Request]) -> List[int]:
+        """Run the policy on a batch of at most batch_size decisions.
+        Returns:
+            the chosen action id of each decision
+        """
+        masks = self.masks[:len(batch)]
+        masks.fill(False)
+        for i, request in enumerate(batch):
+            self.encoder.encode_kyoku(request.kyoku, request.seat,
+                                      request.new_tile, i)
+            masks[i, list(request.choices)] = True
+        logits = self.policy(self.encoder.buffer[:len(batch)])
+        actions = masked_argmax(logits, masks)
+        self.n_batches += 1
+        self.n_decisions += len(batch)
+        return [int(action) for action in actions]
+
+
+class _BatchedGame:
+    """A game of play_batched_games, and the decision it waits on."""
+
+    def __init__(self, seed: int, config_file: str, player_names: List[str]):
+        self.seed = seed
+        self.collector = KyokuCollector()
+        self.game = Game(player_names, config_file, renderer=self.collector,
+                         seed=seed)
+        driven = DrivenInput()
+        for player in self.game.players:
+            player.input_method = driven
+        self.steps = self.game.start_game_steps()
+        self.request: Optional[_Request] = None
+
+    def play(self, decision=None) -> bool:
+        """Send decision to the Ask waiting for it, if any, and play up to
+        the next decision of the policy.
+        Returns:
+            False once the game is over
+        """
+        try:
+            ask = self.steps.send(decision)
+            while (request := self._request(ask)) is None:
+                ask = self.steps.send(self._forced(ask))
+        except StopIteration:
+            self.request = None
+            return False
+        self.request = request
+        return True
+
+    def record(self) -> GameRecord:
+        return GameRecord(self.seed,
+                          self.collector.kyoku_logs,
+                          [player.points for player in self.game.players])
+
+    def _request(self, ask: Ask) -> Optional[_Request]:
+        """The decision ask puts to the policy, None if it has only one
+        choice.
+        """
+        kyoku = self.game.current_kyoku
+        seat = ask.player.seating_position
+        if ask.name == 'actions':
+            new_tile, action_list, _ = ask.args
+            if action_list == [(Action.NOACT, Naki.NONE, [])]:
+                return None
+            return _Request(kyoku, seat, new_tile,
+                            encode_action_list(action_list, new_tile))
+        new_tile, kuikae_tiles = ask.args
+        tiles = legal_discards(ask.player, new_tile, kuikae_tiles)
+        if len(tiles) == 1:
+            return None
+        return _Request(kyoku, seat, new_tile, encode_discards(tiles))
+
+    @staticmethod
+    def _forced(ask: Ask):
+        """The only choice of ask, see _request."""
+        if ask.name == 'actions':
+            return Action.NOACT, Naki.NONE, []
+        new_tile, kuikae_tiles = ask.args
+        return legal_discards(ask.player, new_tile, kuikae_tiles)[0]
+
+
+def play_batched_game(
+    seed: int,
+    inference: BatchedInference,
+    config_file: str = 'config_headless.json',
+    player_names: List[str] = PLAYER_NAMES,
+) -> GameRecord:
+    """Play a whole game headless, every player deciding through
+    inference.
+    """
+    return play_batched_games([seed], inference, None, config_file,
+                              player_names)[0]
+
+
+def play_batched_games(
+    seeds: Iterable[int],
+    inference: BatchedInference,
+    n_games: Optional[int] = None,
+    config_file: str = 'config_headless.json',
+    player_names: List[str] = PLAYER_NAMES,
+) -> List[GameRecord]:
+    """Play games on this thread, batching their decisions.
+    Args:
+        n_games: games played at once, all of them if None
+    Returns:
+        the records of the games, in the order of seeds
+    """
+    seeds = list(seeds)
+    to_start = deque(enumerate(seeds))
+    records: List[Optional[GameRecord]] = [None] * len(seeds)
+    waiting: deque = deque()  # games waiting on their request, by id
+
+    def start_games(n_playing: int) -> None:
+        while to_start and (n_games is None or n_playing < n_games):
+            game_id, seed = to_start.popleft()
+            game = _BatchedGame(seed, config_file, player_names)
+            if game.play():
+                waiting.append((game_id, game))
+                n_playing += 1
+            else:
+                records[game_id] = game.record()
+
+    start_games(0)
+    while waiting:
+        batch = [waiting.popleft()
+                 for _ in range(min(inference.batch_size, len(waiting)))]
+        actions = inference.evaluate([game.request for _, game in batch])
+        for (game_id, game), action in zip(batch, actions):
+            if game.play(game.request.choices[action]):
+                waiting.append((game_id, game))
+            else:
+                records[game_id] = game.record()
+        start_games(len(waiting))
+    return records
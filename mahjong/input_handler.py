@@ -1,13 +1,13 @@
 from typing import List, Optional, Tuple, TYPE_CHECKING
 from abc import ABC, abstractmethod
-from random import randrange
 
 import pyinputplus as pyinput
 
 from forked_inquirer.forked_inquirer import inquirer, InquirerList, BlueTheme
 from .helpers import convert_hand
-from .utils import unicode_block
+from .utils import get_rng, rand_index, unicode_block
 from .components import Tile, Action, Naki, Huro
+from .renderer import Renderer, CliRenderer
 if TYPE_CHECKING:
     from .player import Player
 
@@ -313,12 +313,22 @@ class UserInquirerInput(CliInput):
 
 class DummyInput(CliInput):
 
+    def __init__(self, renderer: Optional[Renderer] = None, seed=None):
+        """
+        Args:
+            renderer: where the moves are shown, the terminal if None
+            seed: seeds the choices, see utils.get_rng
+        """
+        self.renderer = renderer if renderer else CliRenderer()
+        self.rng = get_rng(seed)
+
     def actions_with_new_tile(self, action_list):
         # pick a random action
-        action, naki, huro_list = action_list[randrange(len(action_list))]
+        action, naki, huro_list = action_list[
+            rand_index(self.rng, len(action_list))]
         if huro_list:
             # pick a random huro
-            huro = huro_list[randrange(len(huro_list))]
+            huro = huro_list[rand_index(self.rng, len(huro_list))]
         else:
             huro = None
         return action, naki, huro
@@ -328,49 +338,40 @@ class DummyInput(CliInput):
             return Action.NOACT, Naki.NONE, []
         else:
             if not discard:
-                print("\n----------------------------------")
-                print(f"A.I. player {player.name} draw a tile")
+                self.renderer.ai_draw(player)
             return self.actions_with_new_tile(action_list)
 
     def select_discard(self, hand_tiles, kuikae_tiles):
         hand_tiles = [tile for tile in hand_tiles
                       if tile not in kuikae_tiles]
         # pick a random tile to discard
-        discard_tile = hand_tiles[randrange(len(hand_tiles))]
-        print(f"Tile to discard: \n{unicode_block[discard_tile.index]}")
-
-        return discard_tile
+        return hand_tiles[rand_index(self.rng, len(hand_tiles))]
 
     def discard(self, player, new_tile, kuikae_tiles):
         hand_tiles = convert_hand(player.hand)
         if new_tile:
             hand_tiles.append(new_tile)
 
-        print(f"----------------------------------\nPlayer: {player.name}")
-        print(f"Jikaze: {player.jikaze.name}")
-        hand_representation = ""
-        if player.kawa:
-            hand_representation += "----- Tiles in kawa -----\n"
-            for tile in player.kawa:
-                hand_representation += f"{unicode_block[tile.index]}"
-            hand_representation += "\n"
-        if player.kabe:
-            hand_representation += "----- Kabe -----\n"
-            for huro in player.kabe:
-                for tile in huro.tiles:
-                    hand_representation += f"{unicode_block[tile.index]}"
-            hand_representation += "\n"
-        print(hand_representation)
+        discard_tile = self.select_discard(hand_tiles, kuikae_tiles)
+        self.renderer.ai_discard(player, hand_tiles, discard_tile)
 
-        return self.select_discard(hand_tiles, kuikae_tiles)
+        return discard_tile
 
 
-def input_switch(input_method):
-    if input_method == 'raw_input':
+def input_switch(input_method, renderer: Optional[Renderer] = None):
+    """Get the UserInput of an input method.
+    Args:
+        input_method: raw_input, inquirer or dummy, or a UserInput to use
+            as is, e.g. an agent's
+        renderer: where A.I. players show their moves, the terminal if None
+    """
+    if isinstance(input_method, UserInput):
+        return input_method
+    elif input_method == 'raw_input':
         return UserRawInput()
     elif input_method == 'inquirer':
         return UserInquirerInput()
     elif input_method == 'dummy':
-        return DummyInput()
+        return DummyInput(renderer)
     else:
         raise ValueError('input method should be raw_input, inquirer or dummy')
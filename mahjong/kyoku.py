@@ -4,8 +4,12 @@ from .player import Player
 from .components import Stack, Tile, Action, Huro, Naki, Jihai
 from .event_logger import KyokuLogger
 from .helpers import (
-    get_atamahane_winner, get_wind_tiles, check_all_equal, show_tiles)
-from .utils import roundup, unicode_block
+    get_atamahane_winner, get_wind_tiles, check_all_equal,
+    calculate_base_points)
+from .payments import payment_deltas
+from .renderer import Renderer, CliRenderer
+from .snapshot import KyokuSnapshot
+from .steps import Steps, call, driven
 from .naki_and_actions import check_tenpai
 from .yaku_calculator import YakuCalculator
 
@@ -39,9 +43,9 @@ class Turn:
         self.winners_pos = []
         self.logger = logger
 
-    def discard_flow(
+    def discard_flow_steps(
         self, discard_tile: Tile, discard_pos: int
-    ) -> Tuple[int, Tile, int, Action]:
+    ) -> Steps:
         """ An event flow starting with a discard tile. It contains two flows,
         Naki and Draw.
         Args:
@@ -59,8 +63,8 @@ class Turn:
         state = 0
         discarder = self.players[discard_pos]
 
-        player_pos, (action, naki) = self.ensemble_actions(
-            discard_tile, discard_pos)
+        player_pos, (action, naki) = yield from call(
+            self, 'ensemble_actions', discard_tile, discard_pos)
 
         if action == Action.NOACT:
             if self.stack.is_haitei:
@@ -72,8 +76,8 @@ class Turn:
                 )
                 state = -1
             else:
-                state, discard_tile, discard_pos, action = self.draw_flow(
-                    self.players[discarder.get_shimocha()])
+                state, discard_tile, discard_pos, action = yield from call(
+                    self, 'draw_flow', self.players[discarder.get_shimocha()])
 
         elif action == Action.NAKI:
             # log Naki here
@@ -82,19 +86,21 @@ class Turn:
                 action=action,
                 action_tile=discard_tile,
                 naki_type=naki,
+                huro=self.players[player_pos].tmp_huro,
             )
 
             discarder.furiten_tiles_idx.add(discard_tile.index)
-            state, discard_tile, discard_pos, act = self.naki_flow(
-                self.players[player_pos], naki)
+            state, discard_tile, discard_pos, act = yield from call(
+                self, 'naki_flow', self.players[player_pos], naki)
 
         elif action == Action.RON:
-            # log Ron here
-            self.logger.log(
-                p_pos=player_pos,
-                action=action,
-                action_tile=discard_tile,
-            )
+            # log a Ron for every winner
+            for winner_pos in self.winners_pos:
+                self.logger.log(
+                    p_pos=winner_pos,
+                    action=action,
+                    action_tile=discard_tile,
+                )
             state = 1
             discard_tile = None
 
@@ -102,9 +108,9 @@ class Turn:
 
         return state, discard_tile, discard_pos, action
 
-    def naki_flow(
-        self, player: Player, naki: Naki
-    ) -> Tuple[int, Tile, int]:
+    discard_flow = driven(discard_flow_steps)
+
+    def naki_flow_steps(self, player: Player, naki: Naki) -> Steps:
         """An event flow deals with Naki process
         Args:
           player: The player that calls naki
@@ -125,11 +131,12 @@ class Turn:
         discard_pos = player.seating_position
         if naki == Naki.DAMINKAN:
             self.check_suukaikan(player.kabe)
-            state, discard_tile, discard_pos, _ = self.draw_flow(
-                player, from_rinshan=True)
+            state, discard_tile, discard_pos, _ = yield from call(
+                self, 'draw_flow', player, from_rinshan=True)
         elif naki in (Naki.CHII, Naki.PON):
             # TODO: add test when finish discard_after_naki()
-            discard_tile = player.discard_after_naki(kuikae_tiles)
+            discard_tile = yield from call(
+                player, 'discard_after_naki', kuikae_tiles)
             # Log discard after naki
             self.logger.log(
                 p_pos=discard_pos,
@@ -143,9 +150,11 @@ class Turn:
 
         return state, discard_tile, discard_pos, Action.NOACT
 
-    def ensemble_actions(
+    naki_flow = driven(naki_flow_steps)
+
+    def ensemble_actions_steps(
         self, discard_tile: Tile, discard_pos: int
-    ) -> Tuple[bool, int, Action]:
+    ) -> Steps:
         """This function ensembles the action from each player and return
         the highest priority action.
         Return:
@@ -153,12 +162,13 @@ class Turn:
           action: the action from the player
           naki: Naki
         """
-        naki_actions = [
-            (i, self.players[i].action_with_discard_tile(
-                discard_tile, discard_pos,
-                self.stack, self.bakaze, self.suukaikan))
-            for i in range(0, 4) if i != discard_pos
-        ]
+        naki_actions = []
+        for i in range(0, 4):
+            if i != discard_pos:
+                naki_actions.append((i, (yield from call(
+                    self.players[i], 'action_with_discard_tile',
+                    discard_tile, discard_pos,
+                    self.stack, self.bakaze, self.suukaikan))))
 
         def sort_action(naki_actions):
             (action, naki) = naki_actions[1]
@@ -183,6 +193,8 @@ class Turn:
 
         return pos, (action, naki)
 
+    ensemble_actions = driven(ensemble_actions_steps)
+
     def kan_flow(self, kan_player: Player, kan_tile: Tile, kan_type: Naki):
         """ An event flow followed by a player ankans or chakans
         Other players could Chankan. There are only two posible actions,
@@ -211,9 +223,9 @@ class Turn:
             return 1, kan_tile, kan_player.seating_position, act
         return 0
 
-    def draw_flow(
+    def draw_flow_steps(
         self, player, from_rinshan: bool = False
-    ) -> Tuple[int, Tile, int, Action]:
+    ) -> Steps:
         """ An event flow that triggers a player to draw a tile and ends with
         that player discarding a tile.
         Args:
@@ -245,9 +257,9 @@ class Turn:
             action_tile=new_tile,
         )
 
-        new_tile.owner = player.seating_position
         player.tmp_furiten = False
-        (action, naki), action_tile = player.action_with_new_tile(
+        (action, naki), action_tile = yield from call(
+            player, 'action_with_new_tile',
             new_tile, self.first_turn, self.stack, self.bakaze, self.suukaikan
         )
         state = 0
@@ -267,8 +279,8 @@ class Turn:
                 if kan_state := self.kan_flow(player, new_tile, naki):
                     return kan_state, action_tile, discard_pos
                 self.check_suukaikan(player.kabe)
-            state, action_tile, discard_pos, act = self.draw_flow(
-                player, from_rinshan=True)
+            state, action_tile, discard_pos, act = yield from call(
+                self, 'draw_flow', player, from_rinshan=True)
 
         elif action == Action.RYUUKYOKU:
             self.logger.log(
@@ -309,6 +321,8 @@ class Turn:
 
         return state, action_tile, discard_pos, action
 
+    draw_flow = driven(draw_flow_steps)
+
     def check_suukaikan(self, kabe: List[Huro]) -> bool:
         if len(self.stack.doras) >= 4:  # 場上已經有三或四個槓子
             kan_types = [Naki.CHAKAN, Naki.ANKAN, Naki.DAMINKAN]
@@ -342,8 +356,16 @@ class Kyoku:
         honba: Optional[int] = 0,
         kyotaku: Optional[int] = 0,
         custom_rules: Optional[dict] = {},
-        debug_mode: Optional[bool] = False
+        debug_mode: Optional[bool] = False,
+        renderer: Optional[Renderer] = None,
+        seed=None,
+        wall_order: Optional[List[int]] = None
     ):
+        """
+        Args:
+            seed: shuffles the wall, see utils.get_rng
+            wall_order: deal this wall instead, see Stack.wall_order
+        """
         self.winners: List[Player] = []
         self.players: List[Player] = players
         self.oya_player: Player = self.get_oya_player()
@@ -351,8 +373,9 @@ class Kyoku:
         self.kyotaku: int = kyotaku  # 供託
         self.bakaze: Jihai = bakaze
         self.debug_mode: bool = debug_mode
-        self.tile_stack: Stack = Stack()
+        self.tile_stack: Stack = Stack(seed, wall_order)
         self.logger: KyokuLogger = KyokuLogger()
+        self.renderer: Renderer = renderer if renderer else CliRenderer()
 
         # Atamahane 「頭跳ね」 is more known as the "head bump" rule.
         # http://arcturus.su/wiki/Atamahane
@@ -385,6 +408,18 @@ class Kyoku:
     def get_oya_player(self):
         return next(filter(lambda p: p.jikaze == Jihai.TON, self.players))
 
+    def snapshot(self, turn: Optional[Turn] = None) -> KyokuSnapshot:
+        """Capture the state of the kyoku, and of turn if given, to
+        restore it later, e.g. to search from the same state many times.
+        """
+        return KyokuSnapshot(self, turn)
+
+    def restore(
+        self, snapshot: KyokuSnapshot, turn: Optional[Turn] = None
+    ) -> None:
+        """Go back to the state captured by snapshot, in place."""
+        snapshot.restore(self, turn)
+
     def deal(self) -> None:
         for player in self.players:
             player.hand = [self.tile_stack.draw() for _ in range(13)]
@@ -398,82 +433,50 @@ class Kyoku:
         """
         machi_tiles = check_tenpai(winner.hand, winner.kabe)
         yaku_calculator = YakuCalculator(
-            winner, self.tile_stack, self.bakaze, not tsumo, machi_tiles)
+            winner, self.tile_stack, self.bakaze, not tsumo, machi_tiles,
+            winner.agari_tile)
         final_hans, fu = yaku_calculator.calculate()
         return final_hans, fu
 
-    def start(self):
+    def start_steps(self) -> Steps:
         """
         Return:
             renchan: bool, if the oya is same player or not
             kyotaku: int, how many kyotakus still exist
             honba: int, what's the honba for next Kyoku
         """
+        start_points = [player.points for player in self.players]
+        self.logger.log_start(
+            self.tile_stack.wall_order, self.bakaze,
+            self.oya_player.seating_position, self.honba, self.kyotaku,
+            start_points)
         # initialize players' hand
         self.deal()
 
         # 莊家 oya draw flow
-        print('\n----------------------------------')
-        print('Initial state')
-        dora_indi = unicode_block[self.tile_stack.dora_indicators[0].index]
-        print(f'Dora indicator: {dora_indi}')
-        print(f"Current Honba: {self.honba}")
-        print(f"Current Kyotaku: {self.kyotaku}")
-        print('\n----------------------------------')
-        for player in self.players:
-            lname = f"Player {player.name}:".ljust(15)
-            print(f"{lname}{player.points} points")
-            if self.debug_mode:
-                show_tiles(player)
-                print('----------------------------------')
-        if self.debug_mode:
-            input("Press enter to continue...")
-            print(chr(27) + "[2J")
-        print('\n----------------------------------')
-        print('Star game: oya draw flow')
+        self.renderer.deal(self)
         turn = Turn(self.players, self.tile_stack, self.bakaze, self.logger)
-        state, discard_tile, discard_pos, act = turn.draw_flow(self.oya_player)
+        state, discard_tile, discard_pos, act = yield from call(
+            turn, 'draw_flow', self.oya_player)
         # Tenhoo
         while state == 0:
-            print('\n----------------------------------')
-            print('Current state')
-            playing_wall_len = len(self.tile_stack.playing_wall)
-            print(f'Remaining tiles in playing wall: {playing_wall_len}')
-            doras = "".join([unicode_block[t.index]
-                            for t in self.tile_stack.dora_indicators])
-            print(f'Dora Indicators: {doras}')
-            if self.debug_mode:
-                for player in self.players:
-                    show_tiles(player)
-            print('\n----------------------------------')
-            print('Enter next turn')
-            state, discard_tile, discard_pos, act = turn.discard_flow(
-                discard_tile, discard_pos)
+            self.renderer.turn(self)
+            state, discard_tile, discard_pos, act = yield from call(
+                turn, 'discard_flow', discard_tile, discard_pos)
             if act == Action.RIICHI:
                 self.kyotaku += 1
 
-        if self.debug_mode:
-            print('\n----------------------------------')
-            print(f'Exit trun loop with state: {state}')
-            print('\n----------------------------------')
-            if state == 1:
-                print('Current state')
-                print(f'Winner: {self.players[turn.winners_pos[0]]}')
-                for player in self.players:
-                    show_tiles(player)
-                    if player.agari_tile:
-                        print('----- Agari tile -----')
-                        print(f'{unicode_block[player.agari_tile.index]}')
-                print('\n----------------------------------')
+        self.renderer.kyoku_end(self, state, turn)
 
         if state == -1:
             renchen = self.handle_ryuukyoku(turn.stack.is_haitei)
+            self.log_end({}, start_points)
             return renchen, self.kyotaku, self.honba + 1
 
         else:
             tsumo = act == Action.TSUMO
             loser = None
-            if discard_pos:
+            if discard_pos is not None:
                 loser = self.players[discard_pos]
             self.winners = [self.players[pos] for pos in turn.winners_pos]
             winner_data = {}
@@ -481,11 +484,28 @@ class Kyoku:
                 han, fu = self.calculate_yaku(winner, tsumo)
                 winner_data[winner] = (han, fu)
             self.apply_points(tsumo, winner_data, loser)
+            self.log_end(winner_data, start_points)
             if self.oya_player in self.winners:
                 # return next oya, kyotaku, honba
                 return True, 0, self.honba + 1
             return False, 0, 0
 
+    start = driven(start_steps)
+
+    def log_end(
+        self,
+        winner_data: Dict[Player, Tuple[int, int]],
+        start_points: List[int],
+    ) -> None:
+        """Log the han and fu of the winners and what each seat's points
+        changed by, riichi sticks included.
+        """
+        self.logger.log_end(
+            {winner.seating_position: han_fu
+             for winner, han_fu in winner_data.items()},
+            [player.points - points
+             for player, points in zip(self.players, start_points)])
+
     def handle_ryuukyoku(self, is_haitei: bool):
         """
         區別海底流局和中途流局
@@ -532,7 +552,7 @@ class Kyoku:
         Return: the nagashi mangan player, or None
         """
         honor_tiles, terminal_tiles = Tile.get_yaochuuhai()
-        yaochuuhai = honor_tiles + terminal_tiles
+        yaochuuhai = set(honor_tiles + terminal_tiles)
 
         naki_tile_owners = set()
         for player in self.players:
@@ -562,21 +582,7 @@ class Kyoku:
             noten[0].points -= 3_000
 
     def calculate_base_points(self, han: int, fu: int) -> int:
-        points = fu * 2**(han + 2)
-        if points > 2_000:
-            if han <= 5:  # mangan
-                points = 2_000
-            elif han == 6 or han == 7:
-                points = 3_000
-            elif han >= 8 and han <= 10:
-                points = 4_000
-            elif han == 11 or han == 12:
-                points = 6_000
-            elif han == 13:
-                points = 8_000
-            elif han == 26:
-                points = 16_000
-        return points
+        return calculate_base_points(han, fu)
 
     def apply_points(self,
                      tsumo: bool,
@@ -587,48 +593,22 @@ class Kyoku:
         discard_pos = loser.seating_position if loser else None
         winners_pos = [p.seating_position for p in self.winners]
         atamahane_winner_pos = get_atamahane_winner(discard_pos, winners_pos)
-        atamahane_winner = self.players[atamahane_winner_pos]
-
-        if tsumo:
-            winner = self.winners[0]
+        oya_pos = self.oya_player.seating_position
+        # 流し満貫 doesn't count as a win, so no honba or kyotaku
+        honba = 0 if ryuukyoku else self.honba
+        kyotaku = 0 if ryuukyoku else self.kyotaku
+
+        # tsumo has a single winner, ron can have many
+        winners = self.winners[:1] if tsumo else self.winners
+        for winner in winners:
             han, fu = winner_data[winner]
-            pt = self.calculate_base_points(han, fu)
-            ignore = 0 if ryuukyoku else 1
-            if winner == self.oya_player:
-                winner.points += (
-                    roundup(pt * 2) * 3 + 300 * self.honba * ignore)
-                for i in range(4):
-                    if self.players[i] != self.oya_player:
-                        self.players[i].points -= (
-                            roundup(pt * 2) + 100 * self.honba * ignore)
-            else:  # 子家
-                tmp_pt = 0
-                for player in self.players:
-                    if player == self.oya_player:
-                        player.points -= (
-                            roundup(pt * 2) + 100 * self.honba * ignore)
-                        tmp_pt += (
-                            roundup(pt * 2) + 100 * self.honba * ignore)
-                    elif player != winner:
-                        player.points -= (
-                            roundup(pt) + 100 * self.honba * ignore)
-                        tmp_pt += (
-                            roundup(pt) + 100 * self.honba * ignore)
-                winner.points += tmp_pt
-
-        else:  # ron, can have many winners
-            for winner in self.winners:
-                han, fu = winner_data[winner]
-                pt = self.calculate_base_points(han, fu)
-                if winner == self.oya_player:
-                    winner.points += roundup(pt * 6)
-                    loser.points -= roundup(pt * 6)
-                else:  # 子家
-                    winner.points += roundup(pt * 4)
-                    loser.points -= roundup(pt * 4)
-            atamahane_winner.points += 300 * self.honba
-            loser.points -= 300 * self.honba
-
-        if not ryuukyoku and self.kyotaku > 0:
-            atamahane_winner.points += self.kyotaku * 1_000
+            winner_pos = winner.seating_position
+            if winner_pos == atamahane_winner_pos:
+                deltas = payment_deltas(
+                    han, fu, winner_pos, oya_pos, discard_pos, honba, kyotaku)
+            else:
+                deltas = payment_deltas(
+                    han, fu, winner_pos, oya_pos, discard_pos)
+            for player, delta in zip(self.players, deltas):
+                player.points += delta
         return
@@ -1,13 +1,23 @@
-import copy
-from typing import List, DefaultDict, TYPE_CHECKING
-from itertools import groupby
-
-from .components import Tile, Stack, Suit, Naki, Huro, Jihai
-from .helpers import check_remains_are_sets
-from .yaku_calculator import YakuCalculator
+from typing import (
+    List, DefaultDict, Dict, Optional, Set, Tuple, TYPE_CHECKING
+)
+
+from .components import Tile, Stack, Naki, Huro, Jihai, Hand
+from .shanten import chiitoitsu_shanten, kokushi_shanten
+from .suit_tables import machi_after_discards, machi_from_keys
+from .yaku_calculator import YakuCalculator, has_common_yaku
+from .utils import LRUCache
 if TYPE_CHECKING:
     from .player import Player
 
+YAOCHUU_IDX = sorted(
+    tile.index for tile in sum(Tile.get_yaochuuhai(), []))
+
+# check_tenpai results by (hand signature, huro count), see
+# tenpai_cache.cache_info() for its hit rate
+TENPAI_CACHE_SIZE = 4096
+tenpai_cache = LRUCache(TENPAI_CACHE_SIZE)
+
 
 def check_ron(
     player: 'Player',
@@ -86,6 +96,10 @@ def check_yaku(
     Returns:
         bool: True for Yaku >= 1, False otherwise.
     """
+    # most agari have one of the common yaku, found without evaluating
+    # every yaku of every separation
+    if has_common_yaku(player, bakaze, is_ron, agari_tile):
+        return True
     yaku_calculator = YakuCalculator(
         player, stack, bakaze, is_ron, machi_tiles, agari_tile)
 
@@ -295,6 +309,8 @@ def check_riichi(player: 'Player', machi: List[Tile], stack: Stack) -> bool:
 def check_tenpai(hand: DefaultDict, kabe: List[Huro]) -> List[Tile]:
     """Helper function to check if player can declare tenpai with current
     tiles in hand. If so, return Machi tile(s) (waiting patterns)
+    Results are cached in tenpai_cache by hand signature and huro count,
+    since the same hand is checked many times within a turn.
 
     Args:
         hand: 手牌
@@ -304,55 +320,95 @@ def check_tenpai(hand: DefaultDict, kabe: List[Huro]) -> List[Tile]:
         possible_tiles:
             every possible tiles that could complete the hand
     """
-    possible_tiles = []
-    huro_count = len(kabe)
-
-    def check_chiitoitsu(current_hand: DefaultDict) -> Tile:
-        machi_tile = None
-        if len([k for k, v in current_hand.items() if v == 2]) == 6:
-            machi_idx = [k for k, v in current_hand.items() if v == 1][0]
-            machi_tile = Tile.from_index(machi_idx)
-            possible_tiles.append(machi_tile)
-
-    def check_kokushi_musou(current_hand: DefaultDict) -> List[Tile]:
-        honor_tiles, terminal_tiles = Tile.get_yaochuuhai()
-        yaochuuhai = honor_tiles + terminal_tiles
-        machi_tiles = []
-
-        yaochuu_in_hand = {k: v for (k, v) in current_hand.items()
-                           if Tile.from_index(k) in yaochuuhai}
-        single_yaochuu_n = sum(v == 1 for v in yaochuu_in_hand.values())
-        if single_yaochuu_n == 13:  # 13-way wait
-            machi_tiles = yaochuuhai
-        elif single_yaochuu_n == 11:  # single wait
-            if len([v for v in yaochuu_in_hand.values() if v == 2]) == 1:
-                machi_tiles = [i for i in yaochuuhai
-                               if i.index not in yaochuu_in_hand.keys()]
-
-        return machi_tiles
-
-    def check_machi(machi_tile: Tile, current_hand: DefaultDict) -> bool:
-        machi_found = False
-        for tile_index in current_hand.keys():
-            new_hand = copy.deepcopy(current_hand)
-            new_hand[machi_tile.index] += 1
-            if new_hand[tile_index] >= 2:
-                new_hand[tile_index] -= 2
-                if check_remains_are_sets(new_hand, huro_count):
-                    machi_found = True
-                    break
-        return machi_found
-
-    for suit in Suit:
-        max_rank = 8 if suit == Suit.JIHAI else 10
-        for rank in range(1, max_rank):
-            machi_tile = Tile(suit.value, rank)
-            if check_machi(machi_tile, hand):
-                possible_tiles.append(machi_tile)
+    if not isinstance(hand, Hand):
+        hand = Hand.from_counts(hand)
+    key = (hand.signature, len(kabe))
+    machi_tiles = tenpai_cache.get(key)
+    if machi_tiles is None:
+        machi_tiles = compute_tenpai(hand, len(kabe))
+        tenpai_cache.put(key, machi_tiles)
+    return list(machi_tiles)
+
+
+def compute_tenpai(hand: Hand, huro_count: int) -> Tuple[Tile, ...]:
+    """check_tenpai without the cache.
+    The standard form is looked up in the precomputed suit tables, one
+    lookup per suit, instead of trying every tile as a machi.
+    """
+    machi_idx = set()
+    if sum(v for v in hand.values() if v > 0) == 13 - 3 * huro_count:
+        machi_idx.update(machi_from_keys(hand.suit_keys()))
 
     if huro_count == 0:
-        check_chiitoitsu(hand)
-        if machi_tiles := check_kokushi_musou(hand):
-            possible_tiles += machi_tiles
+        machi_idx.update(_chiitoitsu_machi(hand))
+        machi_idx.update(_kokushi_machi(hand))
+
+    return tuple(Tile.from_index(idx) for idx in sorted(machi_idx))
+
+
+def _chiitoitsu_machi(hand: DefaultDict) -> List[int]:
+    pairs = [k for k, v in hand.items() if v == 2]
+    singles = [k for k, v in hand.items() if v == 1]
+    if len(pairs) == 6 and singles:
+        return [singles[0]]
+    return []
+
+
+def _kokushi_machi(hand: DefaultDict) -> List[int]:
+    yaochuu_in_hand = {k: hand[k] for k in YAOCHUU_IDX
+                       if hand.get(k, 0) > 0}
+    single_yaochuu_n = sum(v == 1 for v in yaochuu_in_hand.values())
+    if single_yaochuu_n == 13:  # 13-way wait
+        return YAOCHUU_IDX
+    if single_yaochuu_n == 11:  # single wait
+        if len([v for v in yaochuu_in_hand.values() if v == 2]) == 1:
+            return [k for k in YAOCHUU_IDX if k not in yaochuu_in_hand]
+    return []
+
+
+def tenpai_discards(
+    hand: DefaultDict,
+    kabe: List[Huro],
+    visible: Optional[Dict[int, int]] = None,
+) -> List[Tuple[Tile, List[Tuple[Tile, int]]]]:
+    """Every discard that leaves a hand of 14 tiles (minus 3 per huro)
+    tenpai, e.g. to choose the discard of a riichi, with the machi each
+    leaves.
+    The hand is looked up in the suit tables once for all its discards,
+    instead of once per discard with check_tenpai.
 
-    return [k for k, v in groupby(sorted(possible_tiles))]
+    Args:
+        hand: 手牌, with the drawn tile
+        kabe: 副露
+        visible: tile index -> copies seen outside of the hand, as for
+            calculate_ukeire
+
+    Returns:
+        list of (discard, [(machi tile, remaining copies), ...]), where
+        remaining copies are the ones not in the hand, the discard
+        included, nor visible
+    """
+    if not isinstance(hand, Hand):
+        hand = Hand.from_counts(hand)
+    found: Dict[int, Set[int]] = {}
+    if sum(v for v in hand.values() if v > 0) == 14 - 3 * len(kabe):
+        found = machi_after_discards(hand.suit_keys())
+
+    if not kabe and (chiitoitsu_shanten(hand) <= 0
+                     or kokushi_shanten(hand) <= 0):
+        discarded = hand.copy()
+        for index in hand.keys():
+            discarded[index] -= 1
+            machi = _chiitoitsu_machi(discarded) + _kokushi_machi(discarded)
+            discarded[index] += 1
+            if machi:
+                found.setdefault(index, set()).update(machi)
+
+    return [
+        (Tile.from_index(index), [
+            (Tile.from_index(machi_index),
+             max(0, 4 - hand[machi_index]
+                 - (visible.get(machi_index, 0) if visible else 0)))
+            for machi_index in sorted(machi)])
+        for index, machi in sorted(found.items())
+    ]
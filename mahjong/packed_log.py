@@ -0,0 +1,304 @@
+"""A packed binary format for KyokuLogger, to store millions of kyoku.
+
+Every ActionLog packs into one fixed-width RECORD:
+
+    seat            int8
+    action          int8   Action value
+    action tile     uint8  Tile.index, 0 if none
+    naki type       int8   Naki value, -1 if none
+    huro naki type  int8   Naki value, -1 if no huro
+    huro naki tile  uint8  Tile.index
+    huro owner      int8   seat the naki tile came from, -1 if unknown
+    (padding)
+    huro tiles      4 x uint8, Tile.index, 0 past the last tile
+
+A log file starts with FILE_HEADER and holds kyokus back to back, each a
+KYOKU_HEADER followed by its records. The header keeps the number of
+records, the state the kyoku started from, see KyokuLogger.log_start,
+with a wall of zeros if it wasn't recorded, and how it ended, see
+KyokuLogger.log_end. Appending to a file never rewrites what is already
+there.
+
+Reading maps the file and hands out memoryview slices of it, so a kyoku's
+records are only decoded when one is asked for.
+"""
+import mmap
+import os
+import struct
+import weakref
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .components import Action, Naki, Tile, Huro, OwnedTile, Jihai
+from .event_logger import ActionLog, KyokuLogger
+
+MAGIC = b'MJ4L'
+VERSION = 3
+FILE_HEADER = struct.Struct('<4sHH')  # magic, version, record size
+N_WALL = 136
+# number of records, bakaze, oya, honba, kyotaku, points, wall order,
+# if it has ended, han and fu of each seat, point deltas
+KYOKU_HEADER = struct.Struct(f'<IbbHH4i{N_WALL}Bb4b4B4i')
+RECORD = struct.Struct('<bbBbbBbx4B')
+
+NO_TILE = 0
+NO_SEAT = -1
+NO_NAKI = -1
+NO_OWNER = -1
+NO_HAN = -1
+
+# the raw fields of a RECORD
+Record = Tuple[int, ...]
+
+
+def pack_action(log: ActionLog) -> bytes:
+    return RECORD.pack(*_fields(log))
+
+
+def _fields(log: ActionLog) -> Record:
+    huro = log.huro
+    if huro is None:
+        huro_fields = (NO_NAKI, NO_TILE, NO_OWNER, NO_TILE, NO_TILE,
+                       NO_TILE, NO_TILE)
+    else:
+        tiles = [tile.index for tile in huro.tiles]
+        tiles += [NO_TILE] * (4 - len(tiles))
+        naki_tile = huro.naki_tile
+        owner = getattr(naki_tile, 'owner', None)
+        huro_fields = (
+            huro.naki_type.value,
+            naki_tile.index if naki_tile else NO_TILE,
+            NO_OWNER if owner is None else owner,
+            *tiles,
+        )
+    return (
+        log.p_pos,
+        log.action.value,
+        log.action_tile.index if log.action_tile else NO_TILE,
+        log.naki_type.value if log.naki_type is not None else NO_NAKI,
+        *huro_fields,
+    )
+
+
+def unpack_action(record: Record) -> ActionLog:
+    """Rebuild the ActionLog of the raw fields of a RECORD."""
+    (seat, action, action_tile, naki_type,
+     huro_naki_type, huro_naki_tile, huro_owner, *huro_tiles) = record
+    huro = None
+    if huro_naki_type != NO_NAKI:
+        naki_tile = None
+        if huro_naki_tile != NO_TILE:
+            naki_tile = Tile.from_index(huro_naki_tile)
+            if huro_owner != NO_OWNER:
+                naki_tile = OwnedTile(naki_tile, huro_owner)
+        huro = Huro(Naki(huro_naki_type), naki_tile,
+                    [Tile.from_index(index) for index in huro_tiles
+                     if index != NO_TILE])
+    return ActionLog(
+        p_pos=seat,
+        action=Action(action),
+        action_tile=(Tile.from_index(action_tile)
+                     if action_tile != NO_TILE else None),
+        naki_type=Naki(naki_type) if naki_type != NO_NAKI else None,
+        huro=huro,
+    )
+
+
+def _header_fields(logger: KyokuLogger) -> tuple:
+    return (
+        len(logger.logs),
+        logger.bakaze.value if logger.bakaze else 0,
+        NO_SEAT if logger.oya is None else logger.oya,
+        logger.honba,
+        logger.kyotaku,
+        *(logger.points or (0, 0, 0, 0)),
+        *(logger.wall_order or (NO_TILE,) * N_WALL),
+        logger.deltas is not None,
+        *(logger.han_fu.get(seat, (NO_HAN, 0))[0] for seat in range(4)),
+        *(logger.han_fu.get(seat, (NO_HAN, 0))[1] for seat in range(4)),
+        *(logger.deltas or (0, 0, 0, 0)),
+    )
+
+
+def pack_kyoku(logger: KyokuLogger) -> bytes:
+    """A kyoku block: its header and one record per ActionLog."""
+    buffer = bytearray(KYOKU_HEADER.size + RECORD.size * len(logger.logs))
+    KYOKU_HEADER.pack_into(buffer, 0, *_header_fields(logger))
+    offset = KYOKU_HEADER.size
+    for log in logger.logs:
+        RECORD.pack_into(buffer, offset, *_fields(log))
+        offset += RECORD.size
+    return bytes(buffer)
+
+
+def append_kyokus(path: str, loggers: Iterable[KyokuLogger]) -> int:
+    """Append kyokus to a log file, creating it if needed.
+    Returns:
+        number of kyokus appended
+    """
+    blocks = [pack_kyoku(logger) for logger in loggers]
+    with open(path, 'ab') as f:
+        if f.tell() == 0:
+            f.write(FILE_HEADER.pack(MAGIC, VERSION, RECORD.size))
+        f.write(b''.join(blocks))
+    return len(blocks)
+
+
+class PackedKyoku:
+    """The records of one kyoku, a view into the packed bytes."""
+
+    def __init__(self, header: tuple, records: memoryview):
+        """
+        Args:
+            header: the unpacked KYOKU_HEADER
+            records: the kyoku's records
+        """
+        (_, bakaze, oya, self.honba, self.kyotaku, *rest) = header
+        self.bakaze: Optional[Jihai] = Jihai(bakaze) if bakaze else None
+        self.oya: Optional[int] = None if oya == NO_SEAT else oya
+        self.points: List[int] = rest[:4]
+        wall_order = rest[4:4 + N_WALL]
+        self.wall_order: Optional[List[int]] = (
+            wall_order if wall_order[0] != NO_TILE else None)
+        ended, *end = rest[4 + N_WALL:]
+        hans, fus, deltas = end[:4], end[4:8], end[8:]
+        self.han_fu: Dict[int, Tuple[int, int]] = {
+            seat: (han, fu) for seat, (han, fu) in enumerate(zip(hans, fus))
+            if han != NO_HAN}
+        self.deltas: Optional[List[int]] = deltas if ended else None
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.records) // RECORD.size
+
+    def raw(self, i: int) -> Record:
+        """The raw fields of record i, without building an ActionLog."""
+        if not 0 <= i < len(self):
+            raise IndexError('record index out of range')
+        return RECORD.unpack_from(self.records, i * RECORD.size)
+
+    def __getitem__(self, i: int) -> ActionLog:
+        if i < 0:
+            i += len(self)
+        return unpack_action(self.raw(i))
+
+    def __iter__(self) -> Iterator[ActionLog]:
+        for record in RECORD.iter_unpack(self.records):
+            yield unpack_action(record)
+
+    def to_logger(self) -> KyokuLogger:
+        logger = KyokuLogger()
+        if self.wall_order is not None:
+            logger.log_start(self.wall_order, self.bakaze, self.oya,
+                             self.honba, self.kyotaku, self.points)
+        if self.deltas is not None:
+            logger.log_end(self.han_fu, self.deltas)
+        logger.logs = list(self)
+        return logger
+
+
+def kyoku_offsets(buffer) -> Iterator[Tuple[int, int]]:
+    """Walk the kyoku blocks of a packed log without reading them.
+    Args:
+        buffer: the whole file, any object supporting the buffer protocol
+    Yields:
+        (offset of the block, its number of records)
+    """
+    with memoryview(buffer) as view:
+        if len(view) < FILE_HEADER.size:
+            return
+        magic, version, record_size = FILE_HEADER.unpack_from(view, 0)
+        if (magic != MAGIC or version != VERSION
+                or record_size != RECORD.size):
+            raise ValueError(
+                "Not a packed kyoku log, or of another version")
+        size = len(view)
+        offset = FILE_HEADER.size
+        while offset < size:
+            if offset + KYOKU_HEADER.size > size:
+                raise ValueError(f"Truncated kyoku at byte {offset}")
+            (n_records,) = struct.unpack_from('<I', view, offset)
+            end = offset + KYOKU_HEADER.size + n_records * RECORD.size
+            if end > size:
+                raise ValueError(f"Truncated kyoku at byte {offset}")
+            yield offset, n_records
+            offset = end
+
+
+def read_kyoku(buffer, offset: int) -> PackedKyoku:
+    """The kyoku block at offset, as found by kyoku_offsets."""
+    view = memoryview(buffer)
+    header = KYOKU_HEADER.unpack_from(view, offset)
+    start = offset + KYOKU_HEADER.size
+    return PackedKyoku(header, view[start:start + header[0] * RECORD.size])
+
+
+def iter_kyokus(buffer) -> Iterator[Tuple[int, PackedKyoku]]:
+    """Walk the kyoku blocks of a packed log.
+    Args:
+        buffer: the whole file, any object supporting the buffer protocol
+    Yields:
+        (offset of the block, its records)
+    """
+    for offset, _ in kyoku_offsets(buffer):
+        yield offset, read_kyoku(buffer, offset)
+
+
+class PackedLogReader:
+    """Reads a packed log file through mmap, without copying it.
+
+    Only the offsets of the kyokus are kept; a PackedKyoku is built over
+    the map when it is asked for.
+
+    Usage:
+        with PackedLogReader(path) as reader:
+            for kyoku in reader:
+                for log in kyoku:
+                    ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._offsets = array('Q')
+        # the kyokus handed out, whose views close has to release
+        self._kyokus: 'weakref.WeakSet[PackedKyoku]' = weakref.WeakSet()
+        if os.fstat(self._file.fileno()).st_size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+            self._offsets.extend(
+                offset for offset, _ in kyoku_offsets(self._mmap))
+        else:
+            self._mmap = None
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, i: int) -> PackedKyoku:
+        return self._read(self._offsets[i])
+
+    def __iter__(self) -> Iterator[PackedKyoku]:
+        for offset in self._offsets:
+            yield self._read(offset)
+
+    def _read(self, offset: int) -> PackedKyoku:
+        kyoku = read_kyoku(self._mmap, offset)
+        self._kyokus.add(kyoku)
+        return kyoku
+
+    def close(self) -> None:
+        # views into the map have to go before the map can close
+        for kyoku in list(self._kyokus):
+            kyoku.records.release()
+        self._kyokus = weakref.WeakSet()
+        self._offsets = array('Q')
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> 'PackedLogReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,113 @@
+"""Point payments of a win as a four-seat delta, looked up from a table
+computed once at import time instead of redoing the base point limits and
+roundups for every payer of every win.
+"""
+from itertools import product
+from typing import Dict, Optional, Tuple
+
+from .helpers import calculate_base_points
+from .utils import roundup
+
+# point change of the players in seats 0 to 3
+Deltas = Tuple[int, int, int, int]
+
+# every han a win can score, 13 and 26 being single and double yakuman
+HANS = tuple(range(1, 14)) + (26,)
+# every fu calculate_fu can round to, 25 being chiitoitsu
+FUS = (20, 25) + tuple(range(30, 120, 10))
+SEATS = range(4)
+
+HONBA_POINTS = 300
+KYOTAKU_POINTS = 1_000
+
+
+def _deltas(
+    han: int, fu: int, winner: int, oya: int, loser: Optional[int]
+) -> Deltas:
+    """Deltas of a win without honba and kyotaku."""
+    pt = calculate_base_points(han, fu)
+    deltas = [0, 0, 0, 0]
+    if loser is None:  # tsumo
+        for seat in SEATS:
+            if seat == winner:
+                continue
+            if winner == oya or seat == oya:
+                payment = roundup(pt * 2)
+            else:
+                payment = roundup(pt)
+            deltas[seat] -= payment
+            deltas[winner] += payment
+    else:
+        payment = roundup(pt * 6) if winner == oya else roundup(pt * 4)
+        deltas[loser] -= payment
+        deltas[winner] += payment
+    return tuple(deltas)
+
+
+def _honba_deltas(winner: int, loser: Optional[int]) -> Deltas:
+    """Deltas of a single honba, paid by the loser or split by the
+    three other players on a tsumo.
+    """
+    deltas = [0, 0, 0, 0]
+    deltas[winner] = HONBA_POINTS
+    if loser is None:
+        for seat in SEATS:
+            if seat != winner:
+                deltas[seat] = -HONBA_POINTS // 3
+    else:
+        deltas[loser] = -HONBA_POINTS
+    return tuple(deltas)
+
+
+def _losers(winner: int):
+    return [None] + [seat for seat in SEATS if seat != winner]
+
+
+# (han, fu, winner seat, oya seat, loser seat or None for tsumo) -> deltas
+PAYMENT_TABLE: Dict[Tuple[int, int, int, int, Optional[int]], Deltas] = {
+    (han, fu, winner, oya, loser): _deltas(han, fu, winner, oya, loser)
+    for han, fu, winner, oya in product(HANS, FUS, SEATS, SEATS)
+    for loser in _losers(winner)
+}
+
+# (winner seat, loser seat or None for tsumo) -> deltas of one honba
+HONBA_TABLE: Dict[Tuple[int, Optional[int]], Deltas] = {
+    (winner, loser): _honba_deltas(winner, loser)
+    for winner in SEATS for loser in _losers(winner)
+}
+
+
+def payment_deltas(
+    han: int,
+    fu: int,
+    winner: int,
+    oya: int,
+    loser: Optional[int] = None,
+    honba: int = 0,
+    kyotaku: int = 0,
+) -> Deltas:
+    """Point change of every seat for one winner.
+    Args:
+        han, fu: of the winning hand
+        winner: seat of the winner
+        oya: seat of the oya
+        loser: seat of the player who dealt in, None for tsumo
+        honba: 本場 paid to this winner, 0 for all but the atamahane winner
+        kyotaku: 供託 sticks collected by this winner
+    Returns:
+        deltas of seats 0 to 3, the table's own tuple if there is no honba
+        or kyotaku
+    """
+    deltas = PAYMENT_TABLE.get((han, fu, winner, oya, loser))
+    if deltas is None:  # a han or fu outside the table
+        deltas = _deltas(han, fu, winner, oya, loser)
+    if not honba and not kyotaku:
+        return deltas
+
+    honba_deltas = HONBA_TABLE[(winner, loser)]
+    return tuple(
+        delta + honba * honba_delta
+        + (kyotaku * KYOTAKU_POINTS if seat == winner else 0)
+        for seat, (delta, honba_delta) in enumerate(zip(deltas,
+                                                        honba_deltas))
+    )
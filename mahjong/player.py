@@ -1,16 +1,13 @@
-import copy
-
-from typing import Tuple, List, Set, DefaultDict, Optional
-from collections import defaultdict
+from typing import Tuple, List, Set, Optional
 
 from .utils import get_name
-from .helpers import nine_yaochuus
-from .components import Huro, Tile, Stack, Action, Jihai, Naki
-from .naki_and_actions import (
-    check_tenpai, check_ron, check_tsumo, check_ankan, check_chakan,
-    check_daminkan, check_pon, check_chii, check_riichi
+from .action_space import LegalActions, legal_on_discard, legal_on_draw
+from .components import (
+    Huro, Tile, OwnedTile, Stack, Action, Jihai, Naki, Hand
 )
-from .input_handler import input_switch
+from .naki_and_actions import check_tenpai, check_riichi
+from .steps import Ask, Steps, call, driven
+from .renderer import Renderer
 
 
 class Player:
@@ -18,16 +15,18 @@ class Player:
         self,
         name,
         seating_position,
-        input_method: Optional[str] = 'raw_input'
+        input_method: Optional[str] = 'raw_input',
+        renderer: Optional[Renderer] = None
     ):
         self.name: str = name
         self._seating_position = seating_position  # 固定座位順序 (0~3)
         self.input_method = input_method
+        self.renderer = renderer
         # jikaze 自風, dealer seat (東風) rotates among players
         self.jikaze: Jihai = Jihai[get_name(Jihai, seating_position + 4)]
         self.points: int = 25_000
         self.is_riichi: bool = False
-        self.hand: DefaultDict[int] = defaultdict(int)
+        self.hand: Hand = Hand()
         self.kabe: List[Huro] = []  # 副露/鳴き
         self.kawa: List[Tile] = []  # 河 is formed by the discarded tiles.
         self.menzenchin: bool = True
@@ -45,7 +44,7 @@ class Player:
 
     def reset_state(self) -> None:
         self.is_riichi = False
-        self.hand = defaultdict(int)
+        self.hand = Hand()
         self.kabe = []
         self.kawa = []
         self.menzenchin = True
@@ -68,10 +67,13 @@ class Player:
 
     @hand.setter
     def hand(self, tiles: List[Tile]) -> None:
-        self._hand = defaultdict(int)
         # TODO: raise error when len(hand) > 13
-        for tile in tiles:
-            self._hand[tile.index] += 1
+        if isinstance(tiles, Hand):
+            self._hand = tiles.copy()
+        elif hasattr(tiles, 'items'):  # tile index -> count
+            self._hand = Hand.from_counts(tiles)
+        else:
+            self._hand = Hand(tiles)
 
     @property
     def agari_tile(self):
@@ -111,64 +113,33 @@ class Player:
     def get_shimocha(self) -> int:
         return (self.seating_position + 1) % 4
 
-    def get_naki_action_list(self,
-                             is_drawer,
-                             hand,
-                             kabe,
-                             tile,
-                             haiteihai=False):
-        """Check player's eligible action to a tile.
-        Args:
-          is_drawer: bool, if the player drew the tile or other player
-                  discarded it.
-          hand: player's hand
-          kabe: player's huro
-          tile: the tile to check against the hand
-          haiteihai: bool, if the tile is the last availble tile
-        Returns:
-          action_list (list of tuples): Naki type and possible nakis
-        """
-        action_list = [(Action.NOACT, Naki.NONE, []), ]
-
-        if haiteihai:
-            return action_list
-        elif is_drawer:
-            if possible_kans := check_ankan(hand, tile):
-                action_list.append((Action.NAKI, Naki.ANKAN, possible_kans))
-            if possible_kans := check_chakan(hand, kabe, tile):
-                action_list.append((Action.NAKI, Naki.CHAKAN, possible_kans))
-        else:
-            if possible_kans := check_daminkan(hand, tile):
-                action_list.append((Action.NAKI, Naki.DAMINKAN, possible_kans))
-            if possible_pons := check_pon(hand, tile):
-                action_list.append((Action.NAKI, Naki.PON, possible_pons))
-
-        return action_list
-
-    def call_riichi(self, discard_tile, tile, stack):
+    def call_riichi_steps(self, discard_tile, tile, stack) -> Steps:
         action = Action.NOACT
         naki = Naki.NONE
-        tmp_hand = copy.deepcopy(self.hand)
+        tmp_hand = self.hand.copy()
         tmp_hand[tile.index] += 1
         tmp_hand[discard_tile.index] -= 1
         if check_riichi(self, check_tenpai(tmp_hand, self.kabe), stack):
-            action_list = [(Action.NOACT, Naki.NONE, []),
-                           (Action.RIICHI, Naki.NONE, [])]
-            action, naki = self.get_input(tile, action_list, False)
+            legal = LegalActions(tile)
+            legal.add(Action.RIICHI)
+            action, naki = yield from call(
+                self, 'get_input', tile, legal, False)
             if action == Action.RIICHI:
                 self.is_riichi = True
                 self.points -= 1_000
 
         return action, naki
 
-    def action_with_discard_tile(
+    call_riichi = driven(call_riichi_steps)
+
+    def action_with_discard_tile_steps(
         self,
         tile: Tile,
         pos: int,
         stack: Stack,
         bakaze: Jihai,
         suukaikan: bool = False
-    ) -> Tuple[Action, Naki]:
+    ) -> Steps:
         """"Player has to select an action reacting to
           the discarded tile.
         Args:
@@ -178,23 +149,15 @@ class Player:
           action: CHI/PON/DAMINKAN/RON
         """
         self.tmp_huro = None
-        action_list = [(Action.NOACT, Naki.NONE, []), ]
-        if suukaikan:
-            if check_ron(self, tile, stack, bakaze):
-                action_list.append((Action.RON, Naki.NONE, []))
-        elif not self.is_riichi:
-            action_list = self.get_naki_action_list(
-                False, self.hand, self.kabe, tile, stack.is_haitei)
-        if pos == self.get_kamicha() and not self.is_riichi:
-            if possible_chiis := check_chii(self.hand, tile):
-                action_list.append((Action.NAKI, Naki.CHII, possible_chiis))
-        if check_ron(self, tile, stack, bakaze):
-            action_list.append((Action.RON, Naki.NONE, []))
-
-        action, naki = self.get_input(tile, action_list, True)
+        legal = legal_on_discard(self, tile, pos, stack, bakaze, suukaikan)
+
+        action, naki = yield from call(self, 'get_input', tile, legal, True)
 
         # set temporary and permanent furiten
-        if action == Action.NOACT:
+        if action == Action.NAKI:
+            # remember who discarded the called tile
+            self.tmp_huro.naki_tile = OwnedTile(tile, pos)
+        elif action == Action.NOACT:
             if tile in check_tenpai(self.hand, self.kabe):
                 self.tmp_furiten = True
                 if self.is_riichi:
@@ -204,14 +167,16 @@ class Player:
 
         return action, naki
 
-    def action_with_new_tile(
+    action_with_discard_tile = driven(action_with_discard_tile_steps)
+
+    def action_with_new_tile_steps(
         self,
         tile: Tile,
         first_turn: bool,
         stack: Stack,
         bakaze: Jihai,
         suukaikan: bool = False
-    ) -> Tuple[Tuple[Action, Naki], Tile]:
+    ) -> Steps:
         """"Player has to select an action reacting to the new drawn tile.
         Args:
           tile: discarded tile
@@ -219,42 +184,25 @@ class Player:
           (action, naki): TSUMO/ANKAN/CHAKAN
           discard_tile: Tile
         """
-        action_list = [(Action.NOACT, Naki.NONE, []), ]
-        if not suukaikan and not self.is_riichi:
-            action_list = self.get_naki_action_list(
-                True, self.hand, self.kabe, tile, stack.is_haitei)
-        if self.is_riichi:
-            if possible_kans := check_ankan(self.hand, tile):
-                current_machi = check_tenpai(self.hand, self.kabe)
-                valid_kans = []
-                for ankan in possible_kans:
-                    kan_hand = copy.deepcopy(self.hand)
-                    kan_hand[ankan[0].index] -= 4
-                    kan_kabe = copy.deepcopy(self.kabe)
-                    kan_kabe.append(Huro(Naki.ANKAN, ankan[0], ankan))
-                    if current_machi == check_tenpai(kan_hand, kan_kabe):
-                        valid_kans.append(ankan)
-                if valid_kans:
-                    action_list.append(
-                        (Action.NAKI, Naki.ANKAN, valid_kans))
-        if first_turn and nine_yaochuus(self.hand, tile):
-            action_list.append((Action.RYUUKYOKU, Naki.NONE, []))
-        if check_tsumo(self, tile, stack, bakaze):
-            action_list.append((Action.TSUMO, Naki.NONE, []))
-
-        action, naki = self.get_input(tile, action_list, False)
+        legal = legal_on_draw(self, tile, first_turn, stack, bakaze,
+                              suukaikan)
+
+        action, naki = yield from call(self, 'get_input', tile, legal, False)
         if action == Action.TSUMO:
             self.agari_tile = tile
             discard_tile = None
         elif action == Action.NAKI:
             discard_tile = None
         else:
-            discard_tile = self.get_discard(tile)
+            discard_tile = yield from call(self, 'get_discard', tile)
             if not self.is_riichi:
-                action, naki = self.call_riichi(discard_tile, tile, stack)
+                action, naki = yield from call(
+                    self, 'call_riichi', discard_tile, tile, stack)
 
         return (action, naki), discard_tile
 
+    action_with_new_tile = driven(action_with_new_tile_steps)
+
     def action_with_naki(self, naki: Naki) -> List[Tile]:
         """Add Player's naki to kabe
         Returns:
@@ -315,11 +263,14 @@ class Player:
             else:
                 raise ValueError("invalid naki type")
 
-    def discard_after_naki(self, kuikae_tiles: List[Tile]) -> Tile:
-        discard = self.get_discard(kuikae_tiles=kuikae_tiles)
+    def discard_after_naki_steps(self, kuikae_tiles: List[Tile]) -> Steps:
+        discard = yield from call(
+            self, 'get_discard', kuikae_tiles=kuikae_tiles)
 
         return discard
 
+    discard_after_naki = driven(discard_after_naki_steps)
+
     def action_with_chakan(self, kan_tile, kan_type) -> Action:
         """Player reacts with oya player's CHAKAN or ANKAN.
         Returns:
@@ -329,32 +280,34 @@ class Player:
         # can react with RON (CHANKAN)
         return Action.NOACT
 
-    def get_input(
+    def get_input_steps(
         self,
         new_tile: Tile,
         action_list: List[Tuple[Action, Naki, List[Tile]]],
         discard: bool
-    ) -> Tuple[Action, Naki]:
+    ) -> Steps:
         """Gets user input to choose action and sets tmp_huro
         """
-        user_input = input_switch(self.input_method)
-        action, naki, huro = user_input.actions(self,
-                                                new_tile,
-                                                action_list,
-                                                discard)
+        action, naki, huro = yield Ask(self, 'actions',
+                                       new_tile,
+                                       action_list,
+                                       discard)
         if action == Action.NAKI:
             self.tmp_huro = Huro(naki, new_tile, huro)
 
         return action, naki
 
-    def get_discard(
+    get_input = driven(get_input_steps)
+
+    def get_discard_steps(
         self,
         new_tile: Tile = None,
         kuikae_tiles: List[Tile] = []
-    ) -> Tile:
+    ) -> Steps:
         """Add in the newly drawn tile and discard a tile
         """
-        user_input = input_switch(self.input_method)
-        tile_to_discard = user_input.discard(self, new_tile, kuikae_tiles)
+        tile_to_discard = yield Ask(self, 'discard', new_tile, kuikae_tiles)
 
         return tile_to_discard
+
+    get_discard = driven(get_discard_steps)
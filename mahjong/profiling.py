@@ -0,0 +1,197 @@
+"""Opt-in timers and counters around the phases of a game.
+
+While a Profiler runs, it wraps the flows of Turn, the phases of Kyoku,
+the players' decisions, YakuCalculator.calculate and every check_*
+function of naki_and_actions, and counts the logged actions by type.
+Timers keep the number of calls, the total time (recursive calls counted
+once) and the self time, without the time of the profiled calls inside.
+Stopping it puts the original functions back, so a game that isn't
+profiled runs exactly the code it would without this module.
+
+Only one Profiler runs at a time, and only the thread playing the game
+should run while it does.
+
+Usage:
+    with Profiler() as profiler:
+        game.start_game()
+    profiler.as_dict()  # or profiler.export('profile.json')
+"""
+import json
+import sys
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import naki_and_actions
+from .event_logger import KyokuLogger
+from .kyoku import Kyoku, Turn
+from .player import Player
+from .yaku_calculator import YakuCalculator
+
+PACKAGE = __name__.rpartition('.')[0]
+
+# (class, methods) timed under "Class.method"
+PHASES = [
+    (Turn, ('discard_flow', 'naki_flow', 'ensemble_actions', 'kan_flow',
+            'draw_flow')),
+    (Kyoku, ('deal', 'start', 'calculate_yaku', 'apply_points',
+             'handle_ryuukyoku')),
+    (Player, ('get_input', 'get_discard')),  # the agents' decisions
+    (YakuCalculator, ('calculate',)),
+]
+CHECK_PREFIX = 'check_'
+
+
+class Timer:
+    __slots__ = ('calls', 'total', 'self_time', 'running')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.self_time = 0.0
+        self.running = 0  # calls in progress, > 1 when recursing
+
+    def as_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'total_s': self.total,
+            'self_s': self.self_time,
+            'mean_us': self.total / self.calls * 1e6 if self.calls else 0.0,
+        }
+
+
+class Profiler:
+    _active: Optional['Profiler'] = None
+
+    def __init__(self):
+        self.timers: Dict[str, Timer] = defaultdict(Timer)
+        self.counters: Dict[str, int] = defaultdict(int)
+        self._children: List[float] = []  # time of profiled callees
+        self._patches: List[Tuple[object, str, Callable]] = []
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+    def timed(self, name: str, func: Callable) -> Callable:
+        """func, adding the time of each call to the timer name."""
+        timer = self.timers[name]
+        children = self._children
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            children.append(0.0)
+            timer.running += 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                timer.running -= 1
+                timer.calls += 1
+                if not timer.running:
+                    timer.total += elapsed
+                timer.self_time += elapsed - children.pop()
+                if children:
+                    children[-1] += elapsed
+        return wrapper
+
+    def start(self) -> 'Profiler':
+        """Wrap the profiled functions."""
+        if Profiler._active is not None:
+            raise RuntimeError("Another Profiler is running")
+        Profiler._active = self
+        for cls, methods in PHASES:
+            for method in methods:
+                self._patch(cls, method, self.timed(
+                    f'{cls.__name__}.{method}', getattr(cls, method)))
+        self._patch(KyokuLogger, 'log', self._counted_log(KyokuLogger.log))
+
+        # the check_* functions, wherever they were imported by name
+        checks = {
+            func: self.timed(f'naki_and_actions.{name}', func)
+            for name, func in vars(naki_and_actions).items()
+            if name.startswith(CHECK_PREFIX) and callable(func)
+            and getattr(func, '__module__', None) == naki_and_actions.__name__
+        }
+        for module_name, module in list(sys.modules.items()):
+            if module is None or not module_name.startswith(PACKAGE + '.'):
+                continue
+            for name, value in list(vars(module).items()):
+                try:
+                    wrapper = checks.get(value)
+                except TypeError:  # unhashable
+                    continue
+                if wrapper is not None:
+                    self._patch(module, name, wrapper)
+        return self
+
+    def _counted_log(self, log: Callable) -> Callable:
+        counters = self.counters
+
+        @wraps(log)
+        def wrapper(logger, **kwargs):
+            action = kwargs.get('action')
+            counters[f'action.{action.name if action else None}'] += 1
+            return log(logger, **kwargs)
+        return wrapper
+
+    def _patch(self, owner, name: str, value) -> None:
+        self._patches.append((owner, name, vars(owner)[name]))
+        setattr(owner, name, value)
+
+    def stop(self) -> None:
+        """Put the original functions back."""
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches = []
+        if Profiler._active is self:
+            Profiler._active = None
+
+    def __enter__(self) -> 'Profiler':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def reset(self) -> None:
+        self.timers.clear()
+        self.counters.clear()
+
+    def as_dict(self) -> dict:
+        return {
+            'timers': {name: timer.as_dict()
+                       for name, timer in sorted(self.timers.items())
+                       if timer.calls},
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+    def merge(self, profile: dict) -> None:
+        """Add the as_dict() of another profile, e.g. another game's."""
+        for name, stats in profile['timers'].items():
+            timer = self.timers[name]
+            timer.calls += stats['calls']
+            timer.total += stats['total_s']
+            timer.self_time += stats['self_s']
+        for name, n in profile['counters'].items():
+            self.counters[name] += n
+
+    def export(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=2)
+            f.write('\n')
+
+    def report(self) -> str:
+        """A table of the timers, most self time first."""
+        lines = [f'{"timer":<40}{"calls":>10}{"total s":>10}'
+                 f'{"self s":>10}{"mean us":>10}']
+        for name, timer in sorted(self.timers.items(),
+                                  key=lambda item: -item[1].self_time):
+            if timer.calls:
+                stats = timer.as_dict()
+                lines.append(
+                    f'{name:<40}{timer.calls:>10}{timer.total:>10.3f}'
+                    f'{timer.self_time:>10.3f}{stats["mean_us"]:>10.1f}')
+        for name, n in sorted(self.counters.items()):
+            lines.append(f'{name:<40}{n:>10}')
+        return '\n'.join(lines)
@@ -0,0 +1,166 @@
+from typing import List, TYPE_CHECKING
+
+from .components import Tile
+from .helpers import show_tiles, rank_players
+from .utils import unicode_block
+if TYPE_CHECKING:
+    from .game import Game
+    from .kyoku import Kyoku, Turn
+    from .player import Player
+
+
+class Renderer:
+    """Observer of a game's progress, the only place a game talks to the
+    terminal. The base class ignores every event so that a game can run
+    headless, e.g. for A.I. self-play, without touching stdout or stdin.
+    """
+
+    def game_start(self, game: 'Game') -> None:
+        """Called once the players and rules of a game are set up."""
+
+    def kyoku_start(self, game: 'Game') -> None:
+        """Called before each kyoku of a game starts."""
+
+    def deal(self, kyoku: 'Kyoku') -> None:
+        """Called after the starting hands are dealt."""
+
+    def turn(self, kyoku: 'Kyoku') -> None:
+        """Called before each discard flow of a kyoku."""
+
+    def kyoku_end(self, kyoku: 'Kyoku', state: int, turn: 'Turn') -> None:
+        """Called when the turn loop of a kyoku exits.
+        Args:
+            state: -1 -> 流局, 1 -> somebody RON or TSUMO
+            turn: the last turn of the kyoku
+        """
+
+    def game_end(self, game: 'Game') -> None:
+        """Called once the game is over."""
+
+    def ai_draw(self, player: 'Player') -> None:
+        """Called when an A.I. player decides what to do with a drawn tile."""
+
+    def ai_discard(
+        self, player: 'Player', hand_tiles: List[Tile], discard_tile: Tile
+    ) -> None:
+        """Called when an A.I. player discards a tile."""
+
+    def pause(self, message: str) -> None:
+        """Wait for the viewer before moving on."""
+
+
+class CliRenderer(Renderer):
+    """Prints the game to the terminal, as the game always did."""
+
+    def game_start(self, game):
+        # imported here so that headless games don't need pyfiglet
+        from pyfiglet import Figlet
+
+        figlet = Figlet(font='slant')
+        print(figlet.renderText('Mahjong 4 RL'))
+        print('\n----------------------------------')
+        print('Initiating a game...')
+        print(f"Debug mode: {game.game_config['debug mode']}")
+        print(f"Game type: {game.game_config['game type']}")
+        print('Players in game:')
+        for player in game.players:
+            print(f'    {player.seating_position}-{player.name}')
+        print('Rules in this game:')
+        for k, v in game.custom_rules.items():
+            print(f'    {k}: {v}')
+        if game.game_config['debug mode']:
+            self.pause("\nPress enter to continue...")
+
+    def kyoku_start(self, game):
+        print('\n----------------------------------')
+        print('Starting Kyoku...')
+        print(f"{game.bakaze.name} {game.kyoku_num} Kyoku")
+
+    def deal(self, kyoku):
+        print('\n----------------------------------')
+        print('Initial state')
+        dora_indi = unicode_block[kyoku.tile_stack.dora_indicators[0].index]
+        print(f'Dora indicator: {dora_indi}')
+        print(f"Current Honba: {kyoku.honba}")
+        print(f"Current Kyotaku: {kyoku.kyotaku}")
+        print('\n----------------------------------')
+        for player in kyoku.players:
+            lname = f"Player {player.name}:".ljust(15)
+            print(f"{lname}{player.points} points")
+            if kyoku.debug_mode:
+                show_tiles(player)
+                print('----------------------------------')
+        if kyoku.debug_mode:
+            self.pause("Press enter to continue...")
+        print('\n----------------------------------')
+        print('Star game: oya draw flow')
+
+    def turn(self, kyoku):
+        print('\n----------------------------------')
+        print('Current state')
+        playing_wall_len = len(kyoku.tile_stack.playing_wall)
+        print(f'Remaining tiles in playing wall: {playing_wall_len}')
+        doras = "".join([unicode_block[t.index]
+                        for t in kyoku.tile_stack.dora_indicators])
+        print(f'Dora Indicators: {doras}')
+        if kyoku.debug_mode:
+            for player in kyoku.players:
+                show_tiles(player)
+        print('\n----------------------------------')
+        print('Enter next turn')
+
+    def kyoku_end(self, kyoku, state, turn):
+        if not kyoku.debug_mode:
+            return
+        print('\n----------------------------------')
+        print(f'Exit trun loop with state: {state}')
+        print('\n----------------------------------')
+        if state == 1:
+            print('Current state')
+            print(f'Winner: {kyoku.players[turn.winners_pos[0]]}')
+            for player in kyoku.players:
+                show_tiles(player)
+                if player.agari_tile:
+                    print('----- Agari tile -----')
+                    print(f'{unicode_block[player.agari_tile.index]}')
+            print('\n----------------------------------')
+
+    def game_end(self, game):
+        print('\n----------------------------------')
+        print('End Game')
+        ranked_players = rank_players(game.players)
+        for i, player in enumerate(ranked_players):
+            lname = f"No. {i + 1}: player {player.name} ".ljust(30)
+            print(f"{lname}{player.points} points")
+
+    def ai_draw(self, player):
+        print("\n----------------------------------")
+        print(f"A.I. player {player.name} draw a tile")
+
+    def ai_discard(self, player, hand_tiles, discard_tile):
+        print(f"----------------------------------\nPlayer: {player.name}")
+        print(f"Jikaze: {player.jikaze.name}")
+        hand_representation = ""
+        if player.kawa:
+            hand_representation += "----- Tiles in kawa -----\n"
+            for tile in player.kawa:
+                hand_representation += f"{unicode_block[tile.index]}"
+            hand_representation += "\n"
+        if player.kabe:
+            hand_representation += "----- Kabe -----\n"
+            for huro in player.kabe:
+                for tile in huro.tiles:
+                    hand_representation += f"{unicode_block[tile.index]}"
+            hand_representation += "\n"
+        print(hand_representation)
+        print(f"Tile to discard: \n{unicode_block[discard_tile.index]}")
+
+    def pause(self, message):
+        input(message)
+        print(chr(27) + "[2J")
+
+
+def renderer_switch(headless: bool) -> Renderer:
+    if headless:
+        return Renderer()
+    return CliRenderer()
@@ -0,0 +1,200 @@
+"""Rebuild the state of a logged kyoku by replaying its ActionLogs.
+
+A replay deals the logged wall to four Players in a Kyoku and applies
+each ActionLog the way Turn's flows change the Stack and Players, so that
+the state after n actions is the state the kyoku was in when its n-th
+action was logged. The state is a plain Kyoku, so it can be snapshotted,
+encoded or inspected like a live one.
+"""
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .components import Action, Naki, Huro, Jihai, Tile
+from .event_logger import ActionLog, KyokuLogger
+from .kyoku import Kyoku
+from .packed_log import PackedKyoku
+from .player import Player
+from .renderer import Renderer
+from .snapshot import KyokuSnapshot
+
+CALLS = (Naki.CHII, Naki.PON, Naki.DAMINKAN)  # calls on a discard
+CHECKPOINT_EVERY = 16
+
+
+class ReplayError(ValueError):
+    """The logs don't fit the kyoku they are replayed on."""
+
+
+def new_kyoku(
+    kyoku_log: Union[KyokuLogger, PackedKyoku],
+    input_method=None,
+    custom_rules: Optional[dict] = None,
+) -> Kyoku:
+    """A Kyoku in the state a logged kyoku started from, not dealt yet.
+    Args:
+        input_method: of every player, see input_switch
+    """
+    if kyoku_log.wall_order is None:
+        raise ReplayError("The log doesn't have the kyoku's wall")
+    renderer = Renderer()
+    players = []
+    for seat in range(4):
+        player = Player(f'Seat {seat}', seat, input_method, renderer)
+        player.jikaze = Jihai((seat - kyoku_log.oya) % 4 + Jihai.TON.value)
+        player.points = kyoku_log.points[seat]
+        players.append(player)
+    return Kyoku(players, kyoku_log.bakaze, kyoku_log.honba,
+                 kyoku_log.kyotaku, custom_rules=custom_rules or {},
+                 renderer=renderer, wall_order=kyoku_log.wall_order)
+
+
+class KyokuReplay:
+    def __init__(
+        self,
+        kyoku_log: Union[KyokuLogger, PackedKyoku],
+        checkpoint_every: Optional[int] = CHECKPOINT_EVERY,
+    ):
+        """
+        Args:
+            kyoku_log: a kyoku's logs, with the state it started from
+            checkpoint_every: snapshot the kyoku every this many actions
+                to seek back quickly, None to never
+        """
+        self.kyoku_log = kyoku_log
+        self.n_actions = len(kyoku_log)
+        self.checkpoint_every = checkpoint_every
+        self.kyoku: Kyoku = None
+        self.position = 0  # number of actions applied
+        # checkpoints[i] is the state at action i * checkpoint_every
+        self.checkpoints: List[Tuple[KyokuSnapshot, tuple]] = []
+        # each seat's draw_flows that haven't discarded yet, see apply
+        self._draws: List[List[Optional[Tile]]] = [[] for _ in range(4)]
+        self._deal()
+
+    def _deal(self) -> None:
+        self.kyoku = new_kyoku(self.kyoku_log)
+        self.kyoku.deal()
+        self.position = 0
+        self._draws = [[] for _ in range(4)]
+        self._checkpoint()
+
+    def action(self, i: int) -> ActionLog:
+        """The i-th logged action."""
+        return self.kyoku_log[i]
+
+    def step(self) -> ActionLog:
+        """Apply the next logged action.
+        Returns:
+            the action applied
+        """
+        if self.position >= self.n_actions:
+            raise IndexError("The kyoku has no more actions")
+        log = self.action(self.position)
+        self.apply(log)
+        return log
+
+    def seek(self, position: int) -> Kyoku:
+        """The kyoku right before its position-th action was taken.
+        The Kyoku is the replay's own, and changes on the next seek.
+        """
+        if not 0 <= position <= self.n_actions:
+            raise IndexError(f"Position should be in [0, {self.n_actions}]")
+        every = self.checkpoint_every
+        if every and (position < self.position
+                      or position - self.position > every):
+            # the latest checkpoint at or before position, if it helps
+            checkpoint = min(position // every, len(self.checkpoints) - 1)
+            if position < self.position \
+                    or checkpoint * every > self.position:
+                self._restore(checkpoint)
+        elif position < self.position:
+            self._deal()
+        while self.position < position:
+            self.step()
+        return self.kyoku
+
+    def replay(self, logs: Iterable[ActionLog]) -> Kyoku:
+        """Apply logs in order, e.g. a stream read from a file."""
+        for log in logs:
+            self.apply(log)
+        return self.kyoku
+
+    def apply(self, log: ActionLog) -> None:
+        """Change the kyoku as the action it logs did.
+
+        Turn only adds a drawn tile to the hand when the draw_flow that
+        drew it discards. A kan's rinshan draw runs in a draw_flow nested
+        in the kan's own, and when the inner one discards, the outer one
+        discards the same tile again, adding the kan tile. A daminkan's
+        naki_flow adds the discard of its draw_flow to the kawa once more
+        without logging it. The draws of each seat are kept as a stack of
+        the draw_flows still running, None marking a daminkan.
+        """
+        kyoku = self.kyoku
+        stack = kyoku.tile_stack
+        seat = log.p_pos
+        player = kyoku.players[seat]
+        action = log.action
+
+        if action in (Action.DRAW, Action.DRAW_RINSHAN):
+            from_rinshan = action == Action.DRAW_RINSHAN
+            if from_rinshan:  # the kan before it revealed a dora
+                stack.add_dora_indicator()
+            tile = stack.draw(from_rinshan)
+            if tile != log.action_tile:
+                raise ReplayError(
+                    f"Action {self.position}: drew {tile} from the wall, "
+                    f"logged {log.action_tile}")
+            self._draws[seat].append(tile)
+            player.tmp_furiten = False
+
+        elif action == Action.DISCARD:
+            draws = self._draws[seat]
+            if draws:
+                player.hand[draws.pop().index] += 1
+            player.add_kawa(log.action_tile)
+            if draws and draws[-1] is None:
+                draws.pop()
+                player.add_kawa(log.action_tile)
+
+        elif action == Action.NAKI:
+            if log.huro is None:
+                raise ReplayError(
+                    f"Action {self.position}: naki without its huro")
+            huro = log.huro
+            player.tmp_huro = Huro(huro.naki_type, huro.naki_tile,
+                                   list(huro.tiles))
+            if log.naki_type in CALLS:
+                owner = getattr(huro.naki_tile, 'owner', None)
+                if owner is not None:
+                    kyoku.players[owner].furiten_tiles_idx.add(
+                        log.action_tile.index)
+            if log.naki_type == Naki.DAMINKAN:
+                self._draws[seat].append(None)
+            player.action_with_naki(log.naki_type)
+
+        elif action == Action.RIICHI:
+            player.is_riichi = True
+            player.points -= 1_000
+            kyoku.kyotaku += 1  # the riichi stick
+
+        elif action in (Action.TSUMO, Action.RON):
+            player.agari_tile = log.action_tile
+            kyoku.winners.append(player)
+
+        kyoku.logger.logs.append(log)
+        self.position += 1
+        if self.checkpoint_every and \
+                self.position == len(self.checkpoints) * self.checkpoint_every:
+            self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        if self.checkpoint_every:
+            self.checkpoints.append(
+                (KyokuSnapshot(self.kyoku),
+                 tuple(tuple(draws) for draws in self._draws)))
+
+    def _restore(self, checkpoint: int) -> None:
+        snapshot, draws = self.checkpoints[checkpoint]
+        snapshot.restore(self.kyoku)
+        self._draws = [list(seat_draws) for seat_draws in draws]
+        self.position = checkpoint * self.checkpoint_every
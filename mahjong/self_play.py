@@ -0,0 +1,194 @@
+"""Self-play runner that plays many A.I. games across processes.
+
+Every game gets its own seed, drawn up front from the runner's seed, so a
+game plays out the same however the games are sharded across workers.
+Workers play their games headless and send back the KyokuLogger of every
+kyoku in batches.
+
+Usage:
+    python -m mahjong.self_play [n_games] [--workers N] [--seed S]
+                                [--out LOG_FILE] [--profile JSON_FILE]
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List, Optional
+
+from .event_logger import KyokuLogger
+from .game import Game
+from .input_handler import DummyInput
+from .packed_log import append_kyokus
+from .profiling import Profiler
+from .renderer import Renderer
+
+PLAYER_NAMES = ['A.I. 0', 'A.I. 1', 'A.I. 2', 'A.I. 3']
+
+
+class GameRecord:
+    def __init__(
+        self,
+        seed: int,
+        kyoku_logs: List[KyokuLogger],
+        points: List[int],
+        profile: Optional[dict] = None,
+    ):
+        """
+        Args:
+            seed: the seed the game was played with
+            kyoku_logs: log of every kyoku in the game, in order
+            points: final points of each player, by seating position
+            profile: the game's Profiler.as_dict(), if it was profiled
+        """
+        self.seed = seed
+        self.kyoku_logs = kyoku_logs
+        self.points = points
+        self.profile = profile
+
+
+class KyokuCollector(Renderer):
+    """Headless renderer that keeps the log of every finished kyoku."""
+
+    def __init__(self):
+        self.kyoku_logs: List[KyokuLogger] = []
+
+    def kyoku_end(self, kyoku, state, turn):
+        self.kyoku_logs.append(kyoku.logger)
+
+
+def play_game(
+    seed: int,
+    config_file: str = 'config_headless.json',
+    player_names: List[str] = PLAYER_NAMES,
+    profile: bool = False,
+) -> GameRecord:
+    """Play a whole game headless.
+    Args:
+        seed: seeds the walls and the A.I. players' choices
+        config_file: game config, decides which players are A.I.
+        profile: time the phases of the game, see profiling
+    Returns:
+        the record of the game
+    """
+    collector = KyokuCollector()
+    game = Game(player_names, config_file, renderer=collector, seed=seed)
+    # the A.I. players' choices, rather than from the global random module
+    dummy = DummyInput(collector, seed)
+    for player in game.players:
+        if player.input_method == 'dummy':
+            player.input_method = dummy
+    profiler = None
+    if profile:
+        with Profiler() as profiler:
+            game.start_game()
+    else:
+        game.start_game()
+    return GameRecord(seed,
+                      collector.kyoku_logs,
+                      [player.points for player in game.players],
+                      profiler.as_dict() if profiler else None)
+
+
+def play_games(
+    seeds: List[int],
+    config_file: str = 'config_headless.json',
+    player_names: List[str] = PLAYER_NAMES,
+    profile: bool = False,
+) -> List[GameRecord]:
+    """Play a batch of games in one worker."""
+    return [play_game(seed, config_file, player_names, profile)
+            for seed in seeds]
+
+
+class SelfPlayRunner:
+    def __init__(
+        self,
+        n_workers: Optional[int] = None,
+        batch_size: int = 16,
+        seed: Optional[int] = None,
+        config_file: str = 'config_headless.json',
+        player_names: List[str] = PLAYER_NAMES,
+        profile: bool = False,
+    ):
+        """
+        Args:
+            n_workers: number of processes, os.cpu_count() if None
+            batch_size: games played by a worker before sending them back
+            seed: seeds the seed of every game, random if None
+            config_file: game config, should make all players A.I.
+            profile: profile every game and add them up in self.profiler
+        """
+        self.n_workers = n_workers or os.cpu_count()
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        self.config_file = config_file
+        self.player_names = player_names
+        self.profile = profile
+        self.profiler = Profiler()
+        self.games = 0
+        self.kyokus = 0
+        self.elapsed = 0.0
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def run(self, n_games: int) -> Iterator[List[GameRecord]]:
+        """Play n_games and yield their records in batches as the workers
+        finish them, in no particular order.
+        """
+        seeds = [self.rng.getrandbits(64) for _ in range(n_games)]
+        batches = [seeds[i:i + self.batch_size]
+                   for i in range(0, n_games, self.batch_size)]
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(self.n_workers) as executor:
+            futures = [
+                executor.submit(play_games, batch, self.config_file,
+                                self.player_names, self.profile)
+                for batch in batches
+            ]
+            for future in as_completed(futures):
+                records = future.result()
+                self.games += len(records)
+                self.kyokus += sum(len(r.kyoku_logs) for r in records)
+                for record in records:
+                    if record.profile:
+                        self.profiler.merge(record.profile)
+                self.elapsed = time.perf_counter() - start
+                yield records
+        self.elapsed = time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('n_games', type=int, nargs='?', default=1_000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--batch-size', type=int, default=16)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--config', default='config_headless.json')
+    parser.add_argument('--out', default=None,
+                        help='append the kyoku logs to this packed log file')
+    parser.add_argument('--profile', default=None,
+                        help='time the phases of the games, write the '
+                             'totals to this JSON file')
+    args = parser.parse_args()
+
+    runner = SelfPlayRunner(args.workers, args.batch_size,
+                            args.seed, args.config,
+                            profile=args.profile is not None)
+    for records in runner.run(args.n_games):
+        if args.out:
+            append_kyokus(args.out, (log for record in records
+                                     for log in record.kyoku_logs))
+    print(f'{runner.games} games, {runner.kyokus} kyokus '
+          f'in {runner.elapsed:.1f}s with {runner.n_workers} workers: '
+          f'{runner.games_per_sec:.1f} games/sec')
+    if args.profile:
+        runner.profiler.export(args.profile)
+        print(runner.profiler.report())
+
+
+if __name__ == '__main__':
+    main()
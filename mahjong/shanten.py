@@ -0,0 +1,152 @@
+"""Shanten number and ukeire (tile acceptance) of a hand.
+
+The shanten number is how many tiles a hand is away from tenpai: 0 is
+tenpai, -1 is a complete hand. The standard form is computed from the
+per-suit splits cached in suit_tables, so a hand costs one lookup per
+suit once its suits have been seen before.
+"""
+from typing import DefaultDict, Dict, List, Optional, Tuple
+
+from .components import Tile, Huro, Hand
+from .suit_tables import SUIT_TABLES, hand_to_keys, rank_shift
+
+YAOCHUU_IDX = frozenset(
+    tile.index for tile in sum(Tile.get_yaochuuhai(), []))
+
+
+def _suit_keys(hand) -> List[int]:
+    if isinstance(hand, Hand):
+        return hand.suit_keys()
+    return hand_to_keys(hand)
+
+
+def _combine(combined, partials):
+    return {
+        (m + sm, t + st, p + sp)
+        for m, t, p in combined
+        for sm, st, sp in partials
+        if p + sp <= 1
+    }
+
+
+def _best_shanten(combined, sets_needed: int) -> int:
+    best = 8
+    for m, t, p in combined:
+        taatsu = min(t, sets_needed - m)  # only 4 sets can be used
+        shanten = 2 * (sets_needed - m) - taatsu - p
+        if shanten < best:
+            best = shanten
+    return best
+
+
+def standard_shanten(keys: List[int], huro_count: int) -> int:
+    """Shanten number for four sets and a jantou.
+
+    Args:
+        keys: suit signatures of the hand, indexed by Suit value
+        huro_count: how many sets are already in kabe
+
+    Returns:
+        shanten number, -1 for a complete hand
+    """
+    # (sets, taatsu, jantou) combinations over the suits seen so far
+    combined = {(0, 0, 0)}
+    for table, key in zip(SUIT_TABLES, keys):
+        if key:
+            combined = _combine(combined, table.partial_sets(key))
+    return _best_shanten(combined, 4 - huro_count)
+
+
+def chiitoitsu_shanten(hand: DefaultDict[int, int]) -> int:
+    """Shanten number for seven distinct pairs
+    """
+    pairs = sum(1 for v in hand.values() if v >= 2)
+    kinds = sum(1 for v in hand.values() if v > 0)
+    return 6 - pairs + max(0, 7 - kinds)
+
+
+def kokushi_shanten(hand: DefaultDict[int, int]) -> int:
+    """Shanten number for kokushi musou, one of each yaochuuhai plus a pair
+    """
+    kinds = 0
+    has_pair = False
+    for index in YAOCHUU_IDX:
+        count = hand.get(index, 0)
+        if count > 0:
+            kinds += 1
+            if count >= 2:
+                has_pair = True
+    return 13 - kinds - has_pair
+
+
+def calculate_shanten(
+    hand: DefaultDict[int, int], kabe: Optional[List[Huro]] = None
+) -> int:
+    """Shanten number of a hand, the lowest of the standard form,
+    chiitoitsu and kokushi musou (the last two only for a closed hand).
+
+    Args:
+        hand: 手牌, 13 or 14 tiles minus 3 per huro
+        kabe: 副露, none if None
+
+    Returns:
+        shanten number, 0 for tenpai and -1 for a complete hand
+    """
+    shanten = standard_shanten(_suit_keys(hand), len(kabe or ()))
+    if not kabe:
+        shanten = min(shanten,
+                      chiitoitsu_shanten(hand),
+                      kokushi_shanten(hand))
+    return shanten
+
+
+def calculate_ukeire(
+    hand: DefaultDict[int, int],
+    kabe: Optional[List[Huro]] = None,
+    visible: Optional[Dict[int, int]] = None
+) -> List[Tuple[Tile, int]]:
+    """Tiles that lower the shanten number of a 13-tile (minus huro) hand.
+
+    Args:
+        hand: 手牌
+        kabe: 副露, none if None
+        visible: tile index -> copies seen outside of the hand, e.g. in
+            every kawa, kabe and the dora indicators
+
+    Returns:
+        list of (tile, remaining copies) for every accepted tile, where
+        remaining copies are the ones not in hand nor visible
+    """
+    keys = _suit_keys(hand)
+    sets_needed = 4 - len(kabe or ())
+    current = calculate_shanten(hand, kabe)
+    menzen = not kabe
+    tmp_hand = Hand.from_counts(hand)
+
+    ukeire = []
+    for suit, table in enumerate(SUIT_TABLES):
+        # only the suit of the drawn tile changes, combine the others once
+        others = {(0, 0, 0)}
+        for other, key in enumerate(keys):
+            if other != suit and key:
+                others = _combine(others, SUIT_TABLES[other].partial_sets(key))
+
+        for rank in range(1, table.ranks + 1):
+            index = suit * 10 + rank
+            in_hand = hand.get(index, 0)
+            if in_hand >= 4:
+                continue
+            new_key = keys[suit] + (1 << rank_shift(rank))
+            shanten = _best_shanten(
+                _combine(others, table.partial_sets(new_key)), sets_needed)
+            if shanten >= current and menzen:
+                tmp_hand[index] += 1
+                shanten = min(shanten,
+                              chiitoitsu_shanten(tmp_hand),
+                              kokushi_shanten(tmp_hand))
+                tmp_hand[index] -= 1
+            if shanten < current:
+                seen = visible.get(index, 0) if visible else 0
+                ukeire.append(
+                    (Tile.from_index(index), max(0, 4 - in_hand - seen)))
+    return sorted(ukeire)
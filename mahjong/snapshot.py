@@ -0,0 +1,139 @@
+"""Snapshots of a kyoku in progress, for search agents that branch from the
+same state many times.
+
+Tiles are interned and immutable, so a snapshot only copies the containers
+holding them into tuples; hands are kept as their signature and Huros,
+which change on chakan, as (naki_type, naki_tile, tiles). Restoring writes
+the state back into the same Kyoku, Turn and Players in place, so every
+reference between them stays valid.
+"""
+from typing import Optional, Tuple, TYPE_CHECKING
+
+from .components import Hand, Huro
+if TYPE_CHECKING:
+    from .kyoku import Kyoku, Turn
+    from .player import Player
+
+HuroState = Tuple
+
+
+def _huro_state(huro: Optional[Huro]) -> Optional[HuroState]:
+    if huro is None:
+        return None
+    return huro.naki_type, huro.naki_tile, tuple(huro.tiles)
+
+
+def _huro(state: Optional[HuroState]) -> Optional[Huro]:
+    if state is None:
+        return None
+    naki_type, naki_tile, tiles = state
+    return Huro(naki_type, naki_tile, list(tiles))
+
+
+class PlayerSnapshot:
+    __slots__ = ('hand', 'kabe', 'kawa', 'points', 'jikaze', 'is_riichi',
+                 'menzenchin', 'tmp_huro', 'furiten_tiles_idx',
+                 'tmp_furiten', 'permanent_furiten', 'agari_tile')
+
+    def __init__(self, player: 'Player'):
+        self.hand = player.hand.signature
+        self.kabe = tuple(_huro_state(huro) for huro in player.kabe)
+        self.kawa = tuple(player.kawa)
+        self.points = player.points
+        self.jikaze = player.jikaze
+        self.is_riichi = player.is_riichi
+        self.menzenchin = player.menzenchin
+        self.tmp_huro = _huro_state(player.tmp_huro)
+        self.furiten_tiles_idx = frozenset(player.furiten_tiles_idx)
+        self.tmp_furiten = player.tmp_furiten
+        self.permanent_furiten = player.permanent_furiten
+        self.agari_tile = player.agari_tile
+
+    def restore(self, player: 'Player') -> None:
+        player._hand = Hand.from_signature(self.hand)
+        player.kabe = [_huro(state) for state in self.kabe]
+        player.kawa = list(self.kawa)
+        player.points = self.points
+        player.jikaze = self.jikaze
+        player.is_riichi = self.is_riichi
+        player.menzenchin = self.menzenchin
+        player.tmp_huro = _huro(self.tmp_huro)
+        player.furiten_tiles_idx = set(self.furiten_tiles_idx)
+        player.tmp_furiten = self.tmp_furiten
+        player.permanent_furiten = self.permanent_furiten
+        player.agari_tile = self.agari_tile
+
+    def __eq__(self, other):
+        return isinstance(other, PlayerSnapshot) and all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__)
+
+
+class KyokuSnapshot:
+    """The state of a Kyoku, and of its Turn if given, at one moment.
+
+    The wall itself never changes once dealt, so only what is left of the
+    playing wall and rinshanpai and the revealed dora are kept.
+    """
+    __slots__ = ('playing_wall', 'rinshanpai', 'dora_index',
+                 'dora_indicators', 'uradora_indicators', 'doras',
+                 'uradoras', 'players', 'honba', 'kyotaku', 'bakaze',
+                 'winners', 'logs', 'turn')
+
+    def __init__(self, kyoku: 'Kyoku', turn: Optional['Turn'] = None):
+        stack = kyoku.tile_stack
+        self.playing_wall = tuple(stack.playing_wall)
+        self.rinshanpai = tuple(stack.rinshanpai)
+        self.dora_index = stack.dora_index
+        self.dora_indicators = tuple(stack.dora_indicators)
+        self.uradora_indicators = tuple(stack.uradora_indicators)
+        self.doras = tuple(stack.doras)
+        self.uradoras = tuple(stack.uradoras)
+
+        self.players = tuple(PlayerSnapshot(p) for p in kyoku.players)
+        self.honba = kyoku.honba
+        self.kyotaku = kyoku.kyotaku
+        self.bakaze = kyoku.bakaze
+        self.winners = tuple(p.seating_position for p in kyoku.winners)
+        # ActionLogs are never changed once logged
+        self.logs = tuple(kyoku.logger.logs)
+
+        self.turn = None
+        if turn is not None:
+            self.turn = (turn.first_turn, turn.suukaikan, turn.oya_draws,
+                         tuple(turn.winners_pos))
+
+    def restore(self, kyoku: 'Kyoku', turn: Optional['Turn'] = None) -> None:
+        """Write the snapshot back into kyoku and turn.
+        Args:
+            kyoku: the kyoku the snapshot was taken of
+            turn: the turn of that kyoku, if the snapshot has one
+        """
+        stack = kyoku.tile_stack
+        stack.playing_wall = list(self.playing_wall)
+        stack.rinshanpai = list(self.rinshanpai)
+        stack.dora_index = self.dora_index
+        stack.dora_indicators = list(self.dora_indicators)
+        stack.uradora_indicators = list(self.uradora_indicators)
+        stack.doras = list(self.doras)
+        stack.uradoras = list(self.uradoras)
+
+        for snapshot, player in zip(self.players, kyoku.players):
+            snapshot.restore(player)
+        kyoku.honba = self.honba
+        kyoku.kyotaku = self.kyotaku
+        kyoku.bakaze = self.bakaze
+        kyoku.winners = [kyoku.players[pos] for pos in self.winners]
+        kyoku.logger.restore(self.logs)
+
+        if turn is not None:
+            if self.turn is None:
+                raise ValueError("The snapshot was taken without a turn")
+            (turn.first_turn, turn.suukaikan, turn.oya_draws,
+             winners_pos) = self.turn
+            turn.winners_pos = list(winners_pos)
+
+    def __eq__(self, other):
+        return isinstance(other, KyokuSnapshot) and all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__)
@@ -0,0 +1,97 @@
+"""The decision points of the engine, as generators of steps.
+
+Game.start_game, Kyoku.start, the flows of Turn and the Player methods
+that end in a decision each have a generator version, e.g.
+Turn.draw_flow_steps, which yields an Ask wherever a player's input
+decides and is sent back the decision, and delegates with
+yield from call(...) wherever it calls another of them. The plain
+methods run their steps with run_steps, which asks the inputs right
+away, so they play exactly as plain calls would. async_play drives the
+same steps from a coroutine instead, and awaits the decisions of async
+agents on the event loop.
+"""
+from typing import Any, Callable, Dict, Generator
+
+from .input_handler import UserInput, input_switch
+
+
+class Ask:
+    """Ask the input of player for a decision, name being actions or
+    discard of UserInput, args the arguments after the player.
+    """
+    __slots__ = ('player', 'name', 'args')
+
+    def __init__(self, player, name: str, *args):
+        self.player = player
+        self.name = name
+        self.args = args
+
+    def __call__(self):
+        user_input = input_switch(self.player.input_method,
+                                  self.player.renderer)
+        return getattr(user_input, self.name)(self.player, *self.args)
+
+
+class DrivenInput(UserInput):
+    """Input of the players whose Asks the driver of their steps answers
+    itself, e.g. KyokuEnv, so they are never asked directly.
+    """
+
+    def actions(self, player, new_tile, action_list, discard):
+        raise RuntimeError("The driver of the steps decides for this player")
+
+    def discard(self, player, new_tile, kuikae_tiles):
+        raise RuntimeError("The driver of the steps decides for this player")
+
+
+Steps = Generator[Ask, Any, Any]
+
+# plain method -> its steps method, see driven
+_STEPS_METHODS: Dict[Callable, Callable[..., Steps]] = {}
+
+
+def run_steps(steps: Steps):
+    """Run steps to their end, asking the inputs as they come.
+    Returns:
+        what steps return
+    """
+    decision = None
+    while True:
+        try:
+            ask = steps.send(decision)
+        except StopIteration as stop:
+            return stop.value
+        decision = ask()
+
+
+def driven(steps_method: Callable[..., Steps]) -> Callable:
+    """The plain method of steps_method, e.g. draw_flow of
+    draw_flow_steps, which runs its steps with run_steps.
+    """
+    def method(*args, **kwargs):
+        return run_steps(steps_method(*args, **kwargs))
+
+    method.__name__ = steps_method.__name__[:-len('_steps')]
+    method.__qualname__ = steps_method.__qualname__[:-len('_steps')]
+    method.__doc__ = steps_method.__doc__
+    method.__module__ = steps_method.__module__
+    _STEPS_METHODS[method] = steps_method
+    return method
+
+
+def call(obj, name: str, *args, **kwargs) -> Steps:
+    """The steps of obj.name(*args, **kwargs), to delegate to with
+    yield from. Once obj.name is no longer the method driven made, e.g.
+    mocked or profiled, it is called as it is, without steps.
+    """
+    method = getattr(obj, name)
+    try:
+        steps_method = _STEPS_METHODS[method.__func__]
+    except (AttributeError, KeyError):
+        return _returning(method(*args, **kwargs))
+    return steps_method(obj, *args, **kwargs)
+
+
+def _returning(value) -> Steps:
+    return value
+    yield
@@ -0,0 +1,292 @@
+"""Precomputed per-suit decomposition tables.
+
+A suit is described by its count signature: the number of copies held of
+each rank packed into 3 bits per rank (rank 1 in the lowest bits), which
+reads as a 9-digit octal number for the numbered suits and a 7-digit one
+for jihai. Since a winning hand is complete only if every suit is complete
+on its own, the tables below answer every question about a hand with one
+lookup per suit.
+
+For every suit signature we precompute:
+  * whether it splits entirely into sets (koutsu / shuntsu)
+  * whether it splits into sets plus exactly one jantou
+  * which ranks turn it into either of the above when added (its machi)
+and, filled in the first time a signature is seen, the best ways to split
+it into sets, taatsu and a jantou, which the shanten calculation needs.
+"""
+from typing import Dict, List, Set, Tuple
+
+RANK_BITS = 3
+RANK_MASK = (1 << RANK_BITS) - 1
+# A waiting hand may already hold all four copies of its machi (karaten),
+# so a completed signature can count up to five copies of one rank.
+MAX_RANK_COUNT = 5
+
+
+def rank_shift(rank: int) -> int:
+    """Bit offset of a rank (1-based) inside a suit signature
+    """
+    return (rank - 1) * RANK_BITS
+
+
+def counts_to_key(counts: List[int]) -> int:
+    """Pack rank counts (index 0 is rank 1) into a suit signature
+    """
+    key = 0
+    for i, count in enumerate(counts):
+        key |= count << (i * RANK_BITS)
+    return key
+
+
+def key_to_counts(key: int, ranks: int) -> List[int]:
+    """Unpack a suit signature into a list of rank counts
+    """
+    return [(key >> (i * RANK_BITS)) & RANK_MASK for i in range(ranks)]
+
+
+class SuitTable:
+    """Decomposition table for one kind of suit.
+
+    Args:
+        ranks: number of ranks in the suit, 9 for numbered suits, 7 for jihai
+        allow_shuntsu: jihai can only form koutsu
+    """
+
+    def __init__(self, ranks: int, allow_shuntsu: bool):
+        self.ranks = ranks
+        self.allow_shuntsu = allow_shuntsu
+        # signature -> number of sets, for signatures that are all sets
+        self.complete_sets: Dict[int, int] = {}
+        # signature -> number of sets, for sets plus exactly one jantou
+        self.complete_pair: Dict[int, int] = {}
+        # signature -> bitmask of ranks completing it into sets / sets+pair
+        self.sets_waits: Dict[int, int] = {}
+        self.pair_waits: Dict[int, int] = {}
+        # signature -> best (sets, taatsu, jantou) splits, see partial_sets
+        self.partials: Dict[int, Tuple[Tuple[int, int, int], ...]] = {0: (
+            (0, 0, 0), )}
+        self._build()
+
+    def set_patterns(self) -> List[List[int]]:
+        """Every single koutsu and shuntsu of this suit as rank counts
+        """
+        patterns = []
+        for r in range(self.ranks):
+            counts = [0] * self.ranks
+            counts[r] = 3
+            patterns.append(counts)
+        if self.allow_shuntsu:
+            for r in range(self.ranks - 2):
+                counts = [0] * self.ranks
+                counts[r] = counts[r + 1] = counts[r + 2] = 1
+                patterns.append(counts)
+        return patterns
+
+    def _build(self) -> None:
+        patterns = self.set_patterns()
+
+        def add_sets(counts: List[int], start: int, n_sets: int):
+            self.complete_sets[counts_to_key(counts)] = n_sets
+            if n_sets == 4:
+                return
+            for i in range(start, len(patterns)):
+                new_counts = [c + p for c, p in zip(counts, patterns[i])]
+                if max(new_counts) <= MAX_RANK_COUNT:
+                    add_sets(new_counts, i, n_sets + 1)
+
+        add_sets([0] * self.ranks, 0, 0)
+
+        for key, n_sets in self.complete_sets.items():
+            for r in range(1, self.ranks + 1):
+                if (key >> rank_shift(r)) & RANK_MASK <= MAX_RANK_COUNT - 2:
+                    self.complete_pair[key + (2 << rank_shift(r))] = n_sets
+
+        for complete, waits in ((self.complete_sets, self.sets_waits),
+                                (self.complete_pair, self.pair_waits)):
+            for key in complete:
+                for r in range(1, self.ranks + 1):
+                    if (key >> rank_shift(r)) & RANK_MASK:
+                        partial = key - (1 << rank_shift(r))
+                        waits[partial] = waits.get(partial, 0) | (1 << r)
+
+    def partial_sets(self, key: int) -> Tuple[Tuple[int, int, int], ...]:
+        """Best ways to split a suit into sets, taatsu and at most one jantou.
+
+        A taatsu is two tiles one tile away from a set: a pair not used as
+        the jantou, a ryanmen/penchan or a kanchan. Only splits that are
+        not beaten in both set and taatsu count by another split with the
+        same number of jantou are kept, since the shanten number never
+        gets worse with more sets or taatsu.
+
+        Returns:
+            tuple of (sets, taatsu, jantou) counts
+        """
+        partials = self.partials.get(key)
+        if partials is None:
+            partials = self._search_partials(key)
+            self.partials[key] = partials
+        return partials
+
+    def _search_partials(self, key: int) -> Tuple[Tuple[int, int, int], ...]:
+        rank = 1
+        while not (key >> rank_shift(rank)) & RANK_MASK:
+            rank += 1
+        one = 1 << rank_shift(rank)
+        count = (key >> rank_shift(rank)) & RANK_MASK
+        candidates = set()
+
+        def extend(rest: int, sets: int, taatsu: int, jantou: int):
+            for m, t, p in self.partial_sets(rest):
+                if p + jantou <= 1:
+                    candidates.add((m + sets, t + taatsu, p + jantou))
+
+        extend(key - one, 0, 0, 0)  # isolated tile
+        if count >= 3:
+            extend(key - 3 * one, 1, 0, 0)  # koutsu
+        if count >= 2:
+            extend(key - 2 * one, 0, 0, 1)  # jantou
+            extend(key - 2 * one, 0, 1, 0)  # toitsu as taatsu
+        if self.allow_shuntsu:
+            next_1 = (key >> rank_shift(rank + 1)) & RANK_MASK
+            next_2 = (key >> rank_shift(rank + 2)) & RANK_MASK
+            if rank + 2 <= self.ranks and next_1 and next_2:
+                extend(key - one - (one << RANK_BITS)
+                       - (one << 2 * RANK_BITS), 1, 0, 0)  # shuntsu
+            if rank + 1 <= self.ranks and next_1:
+                extend(key - one - (one << RANK_BITS), 0, 1, 0)  # ryanmen
+            if rank + 2 <= self.ranks and next_2:
+                extend(key - one - (one << 2 * RANK_BITS), 0, 1, 0)  # kanchan
+
+        best = []
+        for m, t, p in sorted(candidates, reverse=True):
+            if not any(bp == p and bm >= m and bt >= t
+                       for bm, bt, bp in best):
+                best.append((m, t, p))
+        return tuple(best)
+
+    def status(self, key: int) -> int:
+        """Return 0 for all sets, 1 for sets and a jantou, -1 otherwise
+        """
+        if key in self.complete_sets:
+            return 0
+        if key in self.complete_pair:
+            return 1
+        return -1
+
+    def waits(self, key: int, with_jantou: bool) -> int:
+        """Bitmask of ranks (bit r for rank r) that complete this suit.
+
+        Args:
+            key: suit signature
+            with_jantou: if the completed suit should contain the jantou
+        """
+        if with_jantou:
+            return self.pair_waits.get(key, 0)
+        return self.sets_waits.get(key, 0)
+
+
+JIHAI_TABLE = SuitTable(ranks=7, allow_shuntsu=False)
+NUMBER_TABLE = SuitTable(ranks=9, allow_shuntsu=True)
+# indexed by Suit value: JIHAI, MANZU, SOUZU, PINZU
+SUIT_TABLES: Tuple[SuitTable, ...] = (
+    JIHAI_TABLE, NUMBER_TABLE, NUMBER_TABLE, NUMBER_TABLE)
+
+
+def hand_to_keys(hand) -> List[int]:
+    """Convert a hand keyed by tile index into four suit signatures,
+    indexed by Suit value.
+    """
+    keys = [0, 0, 0, 0]
+    for tile_index, tile_count in hand.items():
+        if tile_count > 0:
+            keys[tile_index // 10] += tile_count << rank_shift(
+                tile_index % 10)
+    return keys
+
+
+def is_agari_keys(keys: List[int]) -> bool:
+    """Check if the suit signatures form four sets (minus huro) and a jantou
+    """
+    pairs = 0
+    for table, key in zip(SUIT_TABLES, keys):
+        status = table.status(key)
+        if status < 0:
+            return False
+        pairs += status
+    return pairs == 1
+
+
+def machi_from_keys(keys: List[int]) -> Set[int]:
+    """Find the tile indices that complete a hand of four sets and a jantou.
+
+    Adding a tile only changes one suit, so every other suit must already
+    be complete; the jantou goes to the changed suit only if no other
+    suit holds it yet.
+
+    Args:
+        keys: the four suit signatures of a hand, indexed by Suit value
+
+    Returns:
+        set of tile indices of the machi tiles
+    """
+    return _machi(keys, [table.status(key)
+                         for table, key in zip(SUIT_TABLES, keys)])
+
+
+def machi_after_discards(keys: List[int]) -> Dict[int, Set[int]]:
+    """machi_from_keys of a hand with one more tile, for every tile it
+    could discard.
+
+    The statuses of the suits are looked up once: a discard only changes
+    its own suit, and no discard of a suit can leave the hand waiting if
+    two other suits are incomplete.
+
+    Args:
+        keys: the four suit signatures of the hand, indexed by Suit value
+
+    Returns:
+        tile index of each discard that leaves the hand waiting -> its
+        machi tile indices
+    """
+    statuses = [table.status(key) for table, key in zip(SUIT_TABLES, keys)]
+    incomplete = [suit for suit, status in enumerate(statuses) if status < 0]
+    found = {}
+    for suit, (table, key) in enumerate(zip(SUIT_TABLES, keys)):
+        if not key or sum(other != suit for other in incomplete) > 1:
+            continue
+        discarded_keys = list(keys)
+        discarded_statuses = list(statuses)
+        for rank in range(1, table.ranks + 1):
+            one = 1 << rank_shift(rank)
+            if not key & (RANK_MASK * one):
+                continue
+            discarded_keys[suit] = key - one
+            discarded_statuses[suit] = table.status(key - one)
+            machi = _machi(discarded_keys, discarded_statuses)
+            if machi:
+                found[suit * 10 + rank] = machi
+    return found
+
+
+def _machi(keys: List[int], statuses: List[int]) -> Set[int]:
+    """machi_from_keys, given the status of every suit."""
+    incomplete = [suit for suit, status in enumerate(statuses) if status < 0]
+    if len(incomplete) > 1:
+        return set()
+    candidates = incomplete if incomplete else range(4)
+    total_pairs = sum(status for status in statuses if status > 0)
+
+    machi = set()
+    for suit in candidates:
+        other_pairs = total_pairs - max(statuses[suit], 0)
+        if other_pairs > 1:
+            continue
+        mask = SUIT_TABLES[suit].waits(keys[suit], other_pairs == 0)
+        rank = 1
+        mask >>= 1
+        while mask:
+            if mask & 1:
+                machi.add(suit * 10 + rank)
+            mask >>= 1
+            rank += 1
+    return machi
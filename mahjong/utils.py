@@ -1,5 +1,9 @@
 import math
+import random
+import threading
+from collections import OrderedDict, namedtuple
 from enum import Enum
+from typing import Hashable, Optional
 
 unicode_block = {1: '\U0001f006 ',
                  2: '\U0001f005 ',
@@ -36,6 +40,8 @@ unicode_block = {1: '\U0001f006 ',
                  38: '\U0001f020 ',
                  39: '\U0001f021 '}
 
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
 
 def get_values(en: Enum):
     return list(en.__members__.keys())
@@ -47,3 +53,91 @@ def get_name(en: Enum, key: str):
 
 def roundup(x):
     return int(math.ceil(x / 100.0)) * 100
+
+
+def get_rng(seed=None):
+    """Get a random number generator to shuffle with.
+    Args:
+        seed: None for the global random module, an int for a new
+            random.Random, or a random.Random / NumPy Generator as is
+    """
+    if seed is None:
+        return random
+    if isinstance(seed, int):
+        return random.Random(seed)
+    if hasattr(seed, 'shuffle'):
+        return seed
+    raise TypeError(
+        "seed should be an int, random.Random or numpy.random.Generator")
+
+
+def rand_index(rng, n: int) -> int:
+    """A random int in [0, n) from an rng of get_rng. The random module
+    and a random.Random draw it with randrange, a NumPy Generator with
+    integers.
+    """
+    if hasattr(rng, 'randrange'):
+        return rng.randrange(n)
+    return int(rng.integers(n))
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry.
+    Unlike functools.lru_cache the key is built by the caller, so that
+    unhashable arguments such as a hand can be keyed by their signature.
+    Games played in threads share it, so every operation holds a lock.
+    """
+    _missing = object()
+
+    def __init__(self, maxsize: Optional[int] = 128):
+        """
+        Args:
+            maxsize: max number of entries, None for no eviction and 0 to
+                not cache anything
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            value = self._data.get(key, self._missing)
+            if value is self._missing:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value) -> None:
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize: Optional[int]) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            if maxsize is not None:
+                while len(self._data) > maxsize:
+                    self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
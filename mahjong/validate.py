@@ -0,0 +1,343 @@
+"""Replay archived kyoku logs through the current engine to catch
+regressions.
+
+Each logged kyoku is played again by a real Kyoku from the state it
+started from, with every player's input scripted from the log: the input
+handler reads the ActionLogs one at a time, answers each decision the
+engine asks for with the choice the log made, and checks what the engine
+logs in turn against the archive. Where they part, a Divergence is
+emitted and the rest of that kyoku is skipped:
+
+    LEGAL     the logged choice isn't offered by the engine anymore
+    ACTION    the engine logged something else, e.g. another draw
+    HAN_FU    a winner's han and fu differ
+    POINTS    a seat's point change differs
+    ERROR     the engine raised
+
+Only the kyoku being played and a few ActionLogs ahead of it are held in
+memory, so files of any size stream through.
+
+Usage:
+    python -m mahjong.validate LOG_FILE [LOG_FILE ...] [--workers N]
+"""
+import argparse
+import mmap
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from enum import Enum
+from typing import Deque, Iterable, Iterator, List, Optional, Union
+
+from .components import Action, Naki, Tile
+from .event_logger import ActionLog, KyokuLogger
+from .helpers import convert_hand
+from .input_handler import UserInput
+from .kyoku import Kyoku
+from .packed_log import PackedKyoku, iter_kyokus
+from .replay import new_kyoku
+
+KyokuLog = Union[KyokuLogger, PackedKyoku]
+
+
+class DivergenceType(Enum):
+    LEGAL = 0
+    ACTION = 1
+    HAN_FU = 2
+    POINTS = 3
+    ERROR = 4
+
+
+class Divergence:
+    def __init__(
+        self,
+        divergence_type: DivergenceType,
+        position: Optional[int],
+        expected,
+        actual,
+        seat: Optional[int] = None,
+    ):
+        """
+        Args:
+            position: index of the ActionLog it was found at, None once
+                the kyoku is over
+            expected: what the log has
+            actual: what the engine does
+            seat: the seat concerned, if any
+        """
+        self.divergence_type = divergence_type
+        self.position = position
+        self.expected = expected
+        self.actual = actual
+        self.seat = seat
+        # where the kyoku is, filled in by validate and validate_files
+        self.path: Optional[str] = None
+        self.kyoku: Optional[int] = None
+
+    def __str__(self):
+        where = f"kyoku {self.kyoku}"
+        if self.path is not None:
+            where = f"{self.path}, {where}"
+        if self.position is not None:
+            where += f", action {self.position}"
+        if self.seat is not None:
+            where += f", seat {self.seat}"
+        return (f"{where}: {self.divergence_type.name} "
+                f"expected {self.expected}, got {self.actual}")
+
+
+class _Diverged(Exception):
+    """Unwinds the kyoku being played at the first divergence."""
+
+    def __init__(self, divergence: Divergence):
+        self.divergence = divergence
+
+
+def same_action(log: ActionLog, other: ActionLog) -> bool:
+    if (log.p_pos, log.action, log.action_tile, log.naki_type) != (
+            other.p_pos, other.action, other.action_tile, other.naki_type):
+        return False
+    if log.huro is None or other.huro is None:
+        return log.huro is other.huro
+    return sorted(log.huro.tiles) == sorted(other.huro.tiles)
+
+
+class ScriptedInput(UserInput):
+    """Input of every player of a kyoku being validated, answering with
+    the choices of the logs.
+    """
+
+    def __init__(self, logs: Iterable[ActionLog]):
+        self._logs = iter(logs)
+        self._ahead: Deque[ActionLog] = deque()
+        self.kyoku: Optional[Kyoku] = None
+        self.position = 0  # ActionLogs matched against the engine's
+
+    def _peek(self, i: int = 0) -> Optional[ActionLog]:
+        """The i-th ActionLog after the matched ones, None past the end."""
+        while len(self._ahead) <= i:
+            if (log := next(self._logs, None)) is None:
+                return None
+            self._ahead.append(log)
+        return self._ahead[i]
+
+    def sync(self) -> None:
+        """Match what the engine logged since the last call against the
+        logs, in order.
+        """
+        engine_logs = self.kyoku.logger.logs
+        while self.position < len(engine_logs):
+            actual = engine_logs[self.position]
+            expected = self._peek()
+            if expected is None or not same_action(expected, actual):
+                raise _Diverged(Divergence(
+                    DivergenceType.ACTION, self.position, expected, actual,
+                    actual.p_pos))
+            self._ahead.popleft()
+            self.position += 1
+
+    def remaining(self) -> List[ActionLog]:
+        """The logs the engine never got to."""
+        return list(self._ahead) + list(self._logs)
+
+    def actions(self, player, new_tile, action_list, discard):
+        self.sync()
+        seat = player.seating_position
+        log = self._peek()
+        if discard:
+            # every ron of a discard is logged one after the other
+            i = 0
+            while log is not None and log.action == Action.RON:
+                if log.p_pos == seat:
+                    return self._choose(player, action_list, log)
+                i += 1
+                log = self._peek(i)
+            expected = (Action.NAKI,)
+        elif any(action == Action.RIICHI for action, _, _ in action_list):
+            expected = (Action.RIICHI,)
+        else:
+            expected = (Action.NAKI, Action.TSUMO, Action.RYUUKYOKU)
+        if log is not None and log.p_pos == seat and log.action in expected:
+            return self._choose(player, action_list, log)
+        return Action.NOACT, Naki.NONE, []
+
+    def _choose(self, player, action_list, log: ActionLog):
+        for action, naki, huros in action_list:
+            if action != log.action:
+                continue
+            if action != Action.NAKI:
+                return action, naki, []
+            if naki != log.naki_type:
+                continue
+            for huro in huros:
+                if sorted(huro) == sorted(log.huro.tiles):
+                    return action, naki, huro
+        raise _Diverged(Divergence(
+            DivergenceType.LEGAL, self.position, log,
+            [(action.name, naki.name if naki else None, huros)
+             for action, naki, huros in action_list],
+            player.seating_position))
+
+    def discard(self, player, new_tile, kuikae_tiles):
+        self.sync()
+        seat = player.seating_position
+        i = 0
+        log = self._peek()
+        if log is not None and log.action == Action.RIICHI:
+            i, log = 1, self._peek(1)
+        if log is None or log.p_pos != seat or log.action != Action.DISCARD:
+            raise _Diverged(Divergence(
+                DivergenceType.ACTION, self.position + i, log,
+                'a discard', seat))
+        tiles = convert_hand(player.hand)
+        if new_tile:
+            tiles.append(new_tile)
+        tile: Tile = log.action_tile
+        if tile not in tiles or tile in kuikae_tiles:
+            raise _Diverged(Divergence(
+                DivergenceType.LEGAL, self.position + i, log,
+                [tile for tile in tiles if tile not in kuikae_tiles], seat))
+        return tile
+
+
+def validate_kyoku(
+    kyoku_log: KyokuLog, custom_rules: Optional[dict] = None
+) -> List[Divergence]:
+    """Play a logged kyoku again and compare it with its log.
+    Args:
+        kyoku_log: with the state it started from, its ActionLogs are
+            read one at a time
+        custom_rules: of the Kyoku, as the logged one was played with
+    Returns:
+        at most one divergence of the play, then those of the result
+    """
+    script = ScriptedInput(kyoku_log)
+    try:
+        kyoku = new_kyoku(kyoku_log, script, custom_rules)
+        script.kyoku = kyoku
+        kyoku.start()
+        script.sync()
+    except _Diverged as diverged:
+        return [diverged.divergence]
+    except Exception as error:
+        return [Divergence(DivergenceType.ERROR, script.position,
+                           None, repr(error))]
+    if remaining := script.remaining():
+        return [Divergence(DivergenceType.ACTION, script.position,
+                           remaining[0], 'the end of the kyoku')]
+
+    divergences = []
+    if kyoku_log.deltas is None:  # the log doesn't have the result
+        return divergences
+    han_fu = kyoku.logger.han_fu
+    for seat in sorted(set(han_fu) | set(kyoku_log.han_fu)):
+        expected = kyoku_log.han_fu.get(seat)
+        if tuple(han_fu.get(seat, ())) != tuple(expected or ()):
+            divergences.append(Divergence(
+                DivergenceType.HAN_FU, None, expected, han_fu.get(seat),
+                seat))
+    for seat, (expected, actual) in enumerate(
+            zip(kyoku_log.deltas, kyoku.logger.deltas)):
+        if expected != actual:
+            divergences.append(Divergence(
+                DivergenceType.POINTS, None, expected, actual, seat))
+    return divergences
+
+
+def validate(
+    kyoku_logs: Iterable[KyokuLog], custom_rules: Optional[dict] = None
+) -> Iterator[Divergence]:
+    """Validate kyokus one after the other, e.g. as read from a file.
+    Yields:
+        divergences as they are found, with the index of their kyoku
+    """
+    for i, kyoku_log in enumerate(kyoku_logs):
+        for divergence in validate_kyoku(kyoku_log, custom_rules):
+            divergence.kyoku = i
+            yield divergence
+
+
+def iter_file(
+    path: str, custom_rules: Optional[dict] = None
+) -> Iterator[Divergence]:
+    """Validate every kyoku of a packed log file, see validate. The file
+    is mapped and walked once, each kyoku read as its turn comes.
+    """
+    with open(path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            kyokus = _each_kyoku(buffer)
+            divergences = validate(kyokus, custom_rules)
+            try:
+                for divergence in divergences:
+                    divergence.path = path
+                    yield divergence
+            finally:
+                # the views into the map have to go before it closes
+                divergences.close()
+                kyokus.close()
+
+
+def _each_kyoku(buffer) -> Iterator[PackedKyoku]:
+    """The kyokus of a packed log, each released once the next is asked
+    for.
+    """
+    blocks = iter_kyokus(buffer)
+    try:
+        for _, kyoku in blocks:
+            try:
+                yield kyoku
+            finally:
+                kyoku.records.release()
+    finally:
+        blocks.close()
+
+
+def validate_file(
+    path: str, custom_rules: Optional[dict] = None
+) -> List[Divergence]:
+    return list(iter_file(path, custom_rules))
+
+
+def validate_files(
+    paths: Iterable[str],
+    n_workers: Optional[int] = None,
+    custom_rules: Optional[dict] = None,
+) -> Iterator[Divergence]:
+    """Validate packed log files across processes, one file per task.
+    Args:
+        n_workers: number of processes, os.cpu_count() if None
+    Yields:
+        divergences of each file as soon as it is done, files in no
+        particular order
+    """
+    with ProcessPoolExecutor(n_workers or os.cpu_count()) as executor:
+        futures = [executor.submit(validate_file, path, custom_rules)
+                   for path in paths]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', nargs='+', metavar='LOG_FILE')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='0 for one per CPU')
+    args = parser.parse_args()
+
+    if args.workers == 1:
+        divergences = (divergence for path in args.paths
+                       for divergence in iter_file(path))
+    else:
+        divergences = validate_files(args.paths, args.workers or None)
+    n_divergences = 0
+    for divergence in divergences:
+        print(divergence)
+        n_divergences += 1
+    print(f'{n_divergences} divergences in {len(args.paths)} files')
+    sys.exit(1 if n_divergences else 0)
+
+
+if __name__ == '__main__':
+    main()
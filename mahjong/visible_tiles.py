@@ -0,0 +1,136 @@
+"""Count the copies of each tile every seat hasn't seen yet, updated one
+logged event at a time.
+
+What a seat sees is its own hand, including the tile it just drew,
+every kawa, every kabe and the dora indicators. Each physical tile is
+counted once: a called discard is seen when it is discarded, not again
+when it joins the caller's kabe, and only the tile added by a chakan is
+new. The deal and the dora indicators aren't logged, but both follow
+from the wall_order of KyokuLogger.log_start: the first indicator is
+shown with the deal, and one more before every rinshan draw.
+
+The engine logs the discard that ends a kan's rinshan draw twice, once
+for the nested draw_flow and once for the kan's own; the repeat is seen
+only once here.
+
+A VisibleTiles follows a kyoku being played when added to the listeners
+of its logger, counting again from the logs when the kyoku is restored
+from a snapshot, or a finished one from its logs:
+    tracker = VisibleTiles()
+    kyoku.logger.listeners.append(tracker)
+    ...
+    tracker.remaining(seat, tile)
+"""
+from array import array
+from typing import Iterable, List, Optional
+
+from .components import Action, Naki, Tile, SLOT_OF_INDEX, N_SLOTS
+from .event_logger import ActionLog
+
+N_SEATS = 4
+N_COPIES = 4
+HAND_SIZE = 13
+FIRST_DORA_INDICATOR = -5  # of the wall_order, the next ones 2 before
+
+
+class VisibleTiles:
+    def __init__(self, wall_order: Optional[List[int]] = None):
+        """
+        Args:
+            wall_order: of the kyoku to follow, see start
+        """
+        self._remaining: List[array] = []
+        self._wall_order: List[int] = []
+        self._next_indicator = FIRST_DORA_INDICATOR
+        self._last: Optional[ActionLog] = None
+        if wall_order is not None:
+            self.start(wall_order)
+
+    @classmethod
+    def from_logs(cls, kyoku_log: Iterable[ActionLog],
+                  wall_order: List[int]) -> 'VisibleTiles':
+        """The counts after the logged actions of a kyoku, e.g. of a
+        KyokuLogger or a PackedKyoku and its wall_order.
+        """
+        tracker = cls(wall_order)
+        for log in kyoku_log:
+            tracker.apply(log)
+        return tracker
+
+    def start(self, wall_order: List[int]) -> None:
+        """Count the deal and the first dora indicator of a kyoku.
+        Args:
+            wall_order: see Stack.wall_order
+        """
+        self._wall_order = list(wall_order)
+        self._remaining = [array('b', [N_COPIES] * N_SLOTS)
+                           for _ in range(N_SEATS)]
+        self._next_indicator = FIRST_DORA_INDICATOR
+        self._last = None
+        for seat in range(N_SEATS):
+            dealt = self._wall_order[HAND_SIZE * seat:HAND_SIZE * (seat + 1)]
+            for index in dealt:
+                self._remaining[seat][SLOT_OF_INDEX[index]] -= 1
+        self._reveal_dora_indicator()
+
+    def apply(self, log: ActionLog) -> None:
+        """Count the tiles a logged action shows."""
+        seat = log.p_pos
+        action = log.action
+        if action in (Action.DRAW, Action.DRAW_RINSHAN):
+            if action == Action.DRAW_RINSHAN:
+                self._reveal_dora_indicator()
+            self._remaining[seat][SLOT_OF_INDEX[log.action_tile.index]] -= 1
+
+        elif action == Action.DISCARD:
+            last = self._last
+            if not (last is not None and last.action == Action.DISCARD
+                    and last.p_pos == seat
+                    and last.action_tile == log.action_tile):
+                self._show(seat, [log.action_tile])
+
+        elif action == Action.NAKI:
+            tiles = list(log.huro.tiles)
+            if log.naki_type == Naki.CHAKAN:
+                tiles = tiles[:1]  # the pon is already seen
+            elif log.naki_type != Naki.ANKAN:
+                tiles.remove(log.action_tile)  # seen as a discard
+            self._show(seat, tiles)
+
+        self._last = log
+
+    # as a KyokuLogger listener
+    def on_start(self, logger) -> None:
+        self.start(logger.wall_order)
+
+    def on_log(self, log: ActionLog) -> None:
+        self.apply(log)
+
+    def on_restore(self, logger) -> None:
+        self.start(logger.wall_order)
+        for log in logger.logs:
+            self.apply(log)
+
+    def remaining(self, seat: int, tile: Tile) -> int:
+        """Copies of tile that seat hasn't seen."""
+        return self._remaining[seat][SLOT_OF_INDEX[tile.index]]
+
+    def remaining_counts(self, seat: int) -> array:
+        """Unseen copies of every tile by seat, one per Hand slot. It's
+        the tracker's own array, kept up to date; copy it to keep it.
+        """
+        return self._remaining[seat]
+
+    def _show(self, seat: int, tiles: List[Tile]) -> None:
+        """Tiles from the hand of seat shown to the other seats."""
+        for other in range(N_SEATS):
+            if other != seat:
+                remaining = self._remaining[other]
+                for tile in tiles:
+                    remaining[SLOT_OF_INDEX[tile.index]] -= 1
+
+    def _reveal_dora_indicator(self) -> None:
+        slot = SLOT_OF_INDEX[self._wall_order[self._next_indicator]]
+        for remaining in self._remaining:
+            remaining[slot] -= 1
+        self._next_indicator -= 2
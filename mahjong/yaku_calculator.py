@@ -1,13 +1,48 @@
-import copy
 import math
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
-from .components import Tile, Naki
-from .helpers import separate_sets
+from .components import Tile, Naki, Jihai
+from .helpers import calculate_base_points, is_yaochuu
+from .hand_decomposition import HandDecomposition, Separation
 from .yaku_types import (
     JouKyouYaku, TeYaku, Yakuhai, Peikou, Chanta, Koutsu, Sanshoku, Somete,
 )
 
+SANGENPAI_IDX = (Jihai.HAKU.value, Jihai.HATSU.value, Jihai.CHUN.value)
+YAOCHUU_IDX = tuple(sorted(
+    tile.index for tile in sum(Tile.get_yaochuuhai(), [])))
+
+
+def has_common_yaku(player, bakaze, is_ron, agari_tile) -> bool:
+    """Check for riichi, menzen tsumo, tanyao or yakuhai, the most common
+    yaku and the cheapest to find, straight from the player's hand.
+    Nothing is built, so it's a fast first check of has_at_least_one_yaku:
+    True means the hand has a yaku, False only that it has none of these.
+    """
+    if player.is_riichi:
+        return True
+    if player.menzenchin and not is_ron:
+        return True
+    if player.agari_tile:
+        agari_tile = player.agari_tile
+    hand = player.hand
+    kabe_tiles = [tile for huro in player.kabe for tile in huro.tiles]
+
+    # tanyao, no terminal or honour anywhere
+    if (not is_yaochuu(agari_tile.suit, agari_tile.rank)
+            and not any(hand[index] for index in YAOCHUU_IDX)
+            and not any(is_yaochuu(tile.suit, tile.rank)
+                        for tile in kabe_tiles)):
+        return True
+
+    # yakuhai, a koutsu or kantsu of a sangenpai or of either wind
+    for index in {*SANGENPAI_IDX, bakaze.value, player.jikaze.value}:
+        count = hand[index] + (agari_tile.index == index)
+        count += sum(tile.index == index for tile in kabe_tiles)
+        if count >= 3:
+            return True
+    return False
+
 
 class YakuCalculator():
     def __init__(self, player, stack, bakaze, is_ron, machi_tiles, agari_tile):
@@ -16,23 +51,11 @@ class YakuCalculator():
         self.bakaze = bakaze
         self.is_ron = is_ron
         self.machi_tiles = machi_tiles
-        self.joukyouyaku_eval = JouKyouYaku(
-            player, stack, machi_tiles, bakaze, is_ron, agari_tile)
-        self.teyaku_eval = TeYaku(
-            player, stack, machi_tiles, bakaze, is_ron, agari_tile)
-        self.yakuhai_eval = Yakuhai(
-            player, stack, machi_tiles, bakaze, is_ron, agari_tile)
-        self.peikou_eval = Peikou(
-            player, stack, machi_tiles, bakaze, is_ron, agari_tile)
-        self.chanta_eval = Chanta(
-            player, stack, machi_tiles, bakaze, is_ron, agari_tile)
-        self.koutsu_eval = Koutsu(
-            player, stack, machi_tiles, bakaze, is_ron, agari_tile)
-        self.sanshoku_eval = Sanshoku(
-            player, stack, machi_tiles, bakaze, is_ron, agari_tile)
-        self.somete_eval = Somete(
-            player, stack, machi_tiles, bakaze, is_ron, agari_tile)
-        self.evaluations = [
+        self.agari_tile = agari_tile
+        # separate the agari hand once for every evaluation
+        self.decomposition = HandDecomposition(player, agari_tile)
+        self.evaluations = self.build_evaluations(self.decomposition)
+        (
             self.joukyouyaku_eval,
             self.teyaku_eval,
             self.yakuhai_eval,
@@ -41,9 +64,63 @@ class YakuCalculator():
             self.koutsu_eval,
             self.sanshoku_eval,
             self.somete_eval,
+        ) = self.evaluations
+
+    def build_evaluations(self, decomposition: HandDecomposition) -> List:
+        """Yaku evaluations reading the hand as decomposition does."""
+        eval_args = (self.player, self.stack, self.machi_tiles, self.bakaze,
+                     self.is_ron, self.agari_tile)
+        eval_kwargs = {'decomposition': decomposition}
+        return [
+            JouKyouYaku(*eval_args, **eval_kwargs),
+            TeYaku(*eval_args, **eval_kwargs),
+            Yakuhai(*eval_args, **eval_kwargs),
+            Peikou(*eval_args, **eval_kwargs),
+            Chanta(*eval_args, **eval_kwargs),
+            Koutsu(*eval_args, **eval_kwargs),
+            Sanshoku(*eval_args, **eval_kwargs),
+            Somete(*eval_args, **eval_kwargs),
         ]
 
+    def evaluations_per_separation(
+            self) -> Iterator[Tuple[Separation, List]]:
+        """The yaku evaluations for every separation of the agari hand,
+        with the separation they read.
+        """
+        for decomposition in self.decomposition.per_separation():
+            if decomposition is self.decomposition:
+                yield decomposition.koutsu_first, self.evaluations
+            else:
+                yield (decomposition.koutsu_first,
+                       self.build_evaluations(decomposition))
+
     def calculate(self):
+        """Score every separation of the agari hand and return the han and
+        fu of the one worth the most, e.g. 111222333m read as three koutsu
+        for 三暗刻 rather than three shuntsu for 一盃口. Fu are those of the
+        separation the han are, dora the same for all of them.
+
+        :return: int, han and fu
+        """
+        dora = self.check_doras()
+        best = None
+        for separation, evaluations in self.evaluations_per_separation():
+            han, fu = self.calculate_evaluations(evaluations, separation,
+                                                 dora)
+            if (
+                best is None
+                or calculate_base_points(han, fu)
+                > calculate_base_points(*best)
+            ):
+                best = han, fu
+        return best
+
+    def calculate_evaluations(
+        self,
+        evaluations: List,
+        separation: Optional[Separation] = None,
+        dora: Optional[int] = None,
+    ):
         """Iterate through yaku evaluations and calculate valid yakus.
 
         Start from the starting node of each type of yaku series, if it matches
@@ -51,12 +128,15 @@ class YakuCalculator():
         the mutually exclusive yakus, finally returning total han and fu.
         If `use_chain` is False, will continute even if current eval is True.
 
+        :param separation: the separation evaluations read, for the fu,
+            the koutsu-first one if None
+        :param dora: number of doras, counted if None
         :return: int, han and fu
         """
         possible_yakus: List[Tuple[str, int]] = []
         yakuman_count: int = 0
 
-        for evaluation in self.evaluations:
+        for evaluation in evaluations:
             all_evals = evaluation.get_all_evals()
             use_chain = evaluation.use_chain
 
@@ -88,9 +168,13 @@ class YakuCalculator():
         final_hans = sum(han for yaku_name, han in final_yakus)
 
         # add doras
-        final_hans += self.check_doras()
+        if dora is None:
+            dora = self.check_doras()
+        final_hans += dora
 
-        fu = self.calculate_fu(final_yakus, final_hans)
+        if separation is None:
+            separation = self.decomposition.koutsu_first
+        fu = self.calculate_fu(final_yakus, final_hans, separation)
         return min(13, final_hans), fu
 
     def has_at_least_one_yaku(self):
@@ -101,11 +185,12 @@ class YakuCalculator():
 
         :return: bool, if player has at least one yaku
         """
-        for evaluation in self.evaluations:
-            all_evals = evaluation.get_all_evals()
-            for current_eval in all_evals:
-                if current_eval():
-                    return True
+        for _, evaluations in self.evaluations_per_separation():
+            for evaluation in evaluations:
+                all_evals = evaluation.get_all_evals()
+                for current_eval in all_evals:
+                    if current_eval():
+                        return True
         return False
 
     def check_doras(self) -> int:
@@ -113,8 +198,8 @@ class YakuCalculator():
 
         :return: number of doras
         """
-        # get all doras
-        all_doras = self.stack.doras
+        # get all doras, without adding to the stack's own list
+        all_doras = list(self.stack.doras)
         dora_count = 0
         # if riichi, add uradora
         if self.player.is_riichi:
@@ -190,7 +275,10 @@ class YakuCalculator():
 
         return list(yakus_han.items())
 
-    def calculate_fu(self, final_yakus: List[Tuple[str, int]], total_han: int):
+    def calculate_fu(self, final_yakus: List[Tuple[str, int]], total_han: int,
+                     separation: Separation):
+        """Fu of the agari hand read as separation, won on the agari tile.
+        """
 
         total_yaku: List[str] = [yaku_name for yaku_name, han in final_yakus]
 
@@ -208,7 +296,7 @@ class YakuCalculator():
             return fu
 
         honor_tiles, terminal_tiles = Tile.get_yaochuuhai()
-        yaochuuhai = honor_tiles + terminal_tiles
+        yaochuuhai = set(honor_tiles + terminal_tiles)
         for huro in self.player.kabe:
             if huro.naki_type == Naki.PON:
                 if huro.tiles[0] in yaochuuhai:
@@ -226,10 +314,12 @@ class YakuCalculator():
                 else:
                     fu += 8
 
-        def calc_wait_pattern_fu(ankous: List[Tile],
-                                 shuntsus: List[Tile],
-                                 jantou: Tile) -> int:
+        def calc_wait_pattern_fu(ankous: Tuple[Tile, ...],
+                                 shuntsus: Tuple[Tuple[Tile, ...], ...],
+                                 jantou: Optional[Tile]) -> int:
             wait_pattern_fu = 0
+            if jantou is None:  # no standard form
+                return wait_pattern_fu
 
             # 暗刻
             for tile in ankous:
@@ -246,17 +336,17 @@ class YakuCalculator():
                     wait_pattern_fu += 2
 
             # 聽牌形式
+            agari_tile = self.decomposition.agari_tile
+
             def tenpai_add_fu() -> bool:
-                if self.player.agari_tile == jantou:  # 單騎聽
+                if agari_tile == jantou:  # 單騎聽
                     return True
                 for shuntsu in shuntsus:
-                    if self.player.agari_tile == shuntsu[1]:  # 坎張聽
+                    if agari_tile == shuntsu[1]:  # 坎張聽
                         return True
                     elif (
-                        (self.player.agari_tile == shuntsu[0]
-                         and shuntsu[2].rank == 9)
-                        or (self.player.agari_tile == shuntsu[2]
-                            and shuntsu[0].rank == 1)
+                        (agari_tile == shuntsu[0] and shuntsu[2].rank == 9)
+                        or (agari_tile == shuntsu[2] and shuntsu[0].rank == 1)
                     ):
                         return True  # 邊張聽
                 return False
@@ -266,24 +356,6 @@ class YakuCalculator():
 
             return wait_pattern_fu
 
-        # separate sets
-        player_huro_n = len(self.player.kabe)
-        wait_patterns = {}
-        for idx, pot_agari_tile in enumerate(self.machi_tiles):
-            tmp_agari_hand = copy.deepcopy(self.player.hand)
-            tmp_agari_hand[pot_agari_tile.index] += 1
-
-            ankous, shuntsus, jantou = separate_sets(tmp_agari_hand,
-                                                     player_huro_n)
-            wait_patterns[idx] = [ankous, shuntsus, jantou]
-
-        wait_pattern_fus = []
-        for idx in wait_patterns.keys():
-            [ankous, shuntsus, jantou] = wait_patterns[idx]
-            wait_pattern_fus.append(
-                calc_wait_pattern_fu(ankous, shuntsus, jantou))
-
-        wait_pattern_fu = max(wait_pattern_fus)
-        fu += wait_pattern_fu
+        fu += calc_wait_pattern_fu(*separation)
         # round up
         return int(math.ceil(fu / 10.0)) * 10
@@ -1,13 +1,13 @@
 import copy
 from typing import List, Optional, Callable, TYPE_CHECKING
-from collections import defaultdict
 from itertools import combinations
 from abc import ABC, abstractmethod
 
-from .helpers import (
-    is_yaochuu, separate_sets, consists_jantou_and_sets
+from .helpers import is_yaochuu, consists_jantou_and_sets
+from .components import Suit, Jihai, Tile, Naki, Stack, Hand
+from .hand_decomposition import (
+    HandDecomposition, preferred_separation, separations
 )
-from .components import Suit, Jihai, Tile, Naki, Stack
 from .utils import get_name
 if TYPE_CHECKING:
     from .player import Player
@@ -18,8 +18,14 @@ class YakuTypes(ABC):
     def __init__(
         self, player: 'Player', stack: Stack, machi_tiles: List[Tile],
         bakaze: Jihai, ron: bool, agari_tile: Optional[Tile] = None,
-        first_turn: Optional[bool] = False
+        first_turn: Optional[bool] = False,
+        decomposition: Optional[HandDecomposition] = None
     ):
+        """
+        Args:
+            decomposition: the separations of the agari hand, shared by
+                every evaluator of an agari; worked out here if None
+        """
         self._total_yaku = []
         self._total_han = []
         self.player = player
@@ -28,15 +34,12 @@ class YakuTypes(ABC):
         self.bakaze = bakaze
         self.is_ron = ron
         self.first_turn = first_turn
-        self.agari_tile = agari_tile
-        self.agari_hand = copy.deepcopy(self.player.hand)
-        self.agari_hand = defaultdict(
-            int, {k: v for k, v in self.agari_hand.items() if v > 0})
-        if self.player.agari_tile:
-            self.agari_tile = self.player.agari_tile
-        self.agari_hand[self.agari_tile.index] += 1
-        self.huro_tiles = [
-            tile for huro in self.player.kabe for tile in huro.tiles]
+        if decomposition is None:
+            decomposition = HandDecomposition(player, agari_tile)
+        self.decomposition = decomposition
+        self.agari_tile = decomposition.agari_tile
+        self.agari_hand = decomposition.agari_hand
+        self.huro_tiles = decomposition.huro_tiles
         self.use_chain = True
 
     @property
@@ -266,9 +269,7 @@ class TeYaku(YakuTypes):
                            Tile(Suit.SOUZU.value, 8).index,
                            Tile(Suit.JIHAI.value, Jihai.HATSU.value).index}
 
-        agari_hand_and_kabe = copy.deepcopy(self.agari_hand)
-        for tile in self.huro_tiles:
-            agari_hand_and_kabe[tile.index] += 1
+        agari_hand_and_kabe = self.decomposition.hand_and_kabe
 
         for tile_idx in agari_hand_and_kabe.keys():
             if tile_idx not in green_tiles_idx:
@@ -286,7 +287,7 @@ class TeYaku(YakuTypes):
         http://arcturus.su/wiki/Kokushi_musou
         """
         honor_tiles, terminal_tiles = Tile.get_yaochuuhai()
-        yaochuuhai = honor_tiles + terminal_tiles
+        yaochuuhai = set(honor_tiles + terminal_tiles)
 
         yaochuu_in_hand = {k: v for (k, v) in self.agari_hand.items()
                            if Tile.from_index(k) in yaochuuhai}
@@ -365,9 +366,7 @@ class TeYaku(YakuTypes):
                    'bakaze': [self.bakaze],
                    'jikaze': [self.player.jikaze]}
 
-        agari_hand_and_kabe = copy.deepcopy(self.agari_hand)
-        for tile in self.huro_tiles:
-            agari_hand_and_kabe[tile.index] += 1
+        agari_hand_and_kabe = self.decomposition.hand_and_kabe
 
         found_yakuhai = False
         for tile_type, tile_list in yakuhai.items():
@@ -427,9 +426,7 @@ class TeYaku(YakuTypes):
         1 han (open)
         http://arcturus.su/wiki/Ikkitsuukan
         """
-        agari_hand_and_kabe = copy.deepcopy(self.agari_hand)
-        for tile in self.huro_tiles:
-            agari_hand_and_kabe[tile.index] += 1
+        agari_hand_and_kabe = self.decomposition.hand_and_kabe
 
         for suit in Suit:
             if suit != Suit.JIHAI:
@@ -457,8 +454,7 @@ class TeYaku(YakuTypes):
         1 han (closed only)
         http://arcturus.su/wiki/Pinfu
         """
-        huro_count = len(self.player.kabe)
-        _, shuntsus, jantou = separate_sets(self.agari_hand, huro_count)
+        _, shuntsus, jantou = self.decomposition.koutsu_first
 
         yakuhai_v = [Jihai.HAKU.value, Jihai.HATSU.value, Jihai.CHUN.value,
                      self.bakaze.value, self.player.jikaze.value]
@@ -466,15 +462,18 @@ class TeYaku(YakuTypes):
         def is_ryanmen() -> bool:  # 两面听牌
             wait_patterns = {}
             for idx, pot_agari_tile in enumerate(self.machi_tiles):
-                tmp_agari_hand = copy.deepcopy(self.player.hand)
+                tmp_agari_hand = Hand.from_counts(self.player.hand)
                 tmp_agari_hand[pot_agari_tile.index] += 1
 
-                _, shuntsus, jantou = separate_sets(tmp_agari_hand, 0)
+                _, shuntsus, jantou = preferred_separation(
+                    separations(tmp_agari_hand, 0))
                 wait_patterns[idx] = [shuntsus, jantou]
 
             ryanmen = False
             for idx in wait_patterns.keys():
                 [shuntsus, jantou] = wait_patterns[idx]
+                if jantou is None:  # not a standard form with this machi
+                    continue
                 if self.agari_tile == jantou:  # 單騎聽
                     continue
                 for shuntsu in shuntsus:
@@ -645,8 +644,7 @@ class Peikou(TeYaku):
         3 han (closed only)
         http://arcturus.su/wiki/Ryanpeikou
         """
-        huro_count = len(self.player.kabe)
-        _, shuntsu, _ = separate_sets(self.agari_hand, huro_count)
+        _, shuntsu, _ = self.decomposition.koutsu_first
 
         peikou = 0
         for i in combinations(shuntsu, 2):
@@ -665,8 +663,7 @@ class Peikou(TeYaku):
         1 han (closed only)
         http://arcturus.su/wiki/Iipeikou
         """
-        huro_count = len(self.player.kabe)
-        _, shuntsu, _ = separate_sets(self.agari_hand, huro_count)
+        _, shuntsu, _ = self.decomposition.koutsu_first
 
         peikou = 0
         for i in combinations(shuntsu, 2):
@@ -742,9 +739,7 @@ class Chanta(TeYaku):
         http://arcturus.su/wiki/Junchantaiyaochuu
         """
         _, terminal_tiles = Tile.get_yaochuuhai()
-        koutsus, shuntsus, jantou = separate_sets(self.agari_hand,
-                                                  len(self.player.kabe),
-                                                  koutsu_first=False)
+        koutsus, shuntsus, jantou = self.decomposition.shuntsu_first
 
         if jantou not in terminal_tiles:
             return False
@@ -786,9 +781,7 @@ class Chanta(TeYaku):
         http://arcturus.su/wiki/Chanta
         """
         honor_tiles, terminal_tiles = Tile.get_yaochuuhai()
-        koutsus, shuntsus, jantou = separate_sets(self.agari_hand,
-                                                  len(self.player.kabe),
-                                                  koutsu_first=False)
+        koutsus, shuntsus, jantou = self.decomposition.shuntsu_first
 
         if jantou not in (terminal_tiles + honor_tiles):
             return False
@@ -844,8 +837,7 @@ class Koutsu(TeYaku):
         yakuman
         http://arcturus.su/wiki/Suuankou
         """
-        huro_count = len(self.player.kabe)
-        koutsus, _, jantou = separate_sets(self.agari_hand, huro_count)
+        koutsus, _, jantou = self.decomposition.koutsu_first
         kantsus = [huro for huro in self.player.kabe
                    if huro.naki_type == Naki.ANKAN]
         ankou = len(koutsus) + len(kantsus)
@@ -881,8 +873,7 @@ class Koutsu(TeYaku):
         2 han
         http://arcturus.su/wiki/Sanankou
         """
-        huro_count = len(self.player.kabe)
-        koutsus, _, jantou = separate_sets(self.agari_hand, huro_count)
+        koutsus, _, jantou = self.decomposition.koutsu_first
         kantsus = [huro for huro in self.player.kabe
                    if huro.naki_type == Naki.ANKAN]
         ankou = len(koutsus) + len(kantsus)
@@ -926,11 +917,9 @@ class Sanshoku(TeYaku):
         2 han
         http://arcturus.su/wiki/Sanshoku_doukou
         """
-        huro_count = len(self.player.kabe)
-        koutsu, _, _ = separate_sets(self.agari_hand, huro_count)
-        for huro in self.player.kabe:
-            if huro.naki_type == Naki.PON:
-                koutsu.append(huro.tiles[0])
+        koutsu, _, _ = self.decomposition.koutsu_first
+        koutsu = list(koutsu) + [huro.tiles[0] for huro in self.player.kabe
+                                 if huro.naki_type == Naki.PON]
 
         counter = {1: [], 2: [], 3: []}
         for tile in koutsu:
@@ -953,11 +942,9 @@ class Sanshoku(TeYaku):
         1 han (open)
         http://arcturus.su/wiki/Sanshoku_doujun
         """
-        huro_count = len(self.player.kabe)
-        _, shuntsu, _ = separate_sets(self.agari_hand, huro_count)
-        for huro in self.player.kabe:
-            if huro.naki_type == Naki.CHII:
-                shuntsu.append(huro.tiles)
+        _, shuntsu, _ = self.decomposition.koutsu_first
+        shuntsu = list(shuntsu) + [huro.tiles for huro in self.player.kabe
+                                   if huro.naki_type == Naki.CHII]
 
         counter = {1: [], 2: [], 3: []}
         for tile_list in shuntsu:
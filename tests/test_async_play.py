@@ -0,0 +1,60 @@
+import asyncio
+import threading
+import unittest
+
+from mahjong.async_play import (
+    AsyncUserInput, LatencyAgent, play_game_async, play_games_async
+)
+from mahjong.env import legal_discards
+
+
+class TestAsyncPlay(unittest.TestCase):
+
+    def test_concurrent_games(self):
+        agents = {}
+
+        def agent_factory(seed):
+            agents[seed] = LatencyAgent(0.0005, seed)
+            return agents[seed]
+
+        records = asyncio.run(
+            play_games_async(range(6), agent_factory, concurrency=6))
+        self.assertEqual([record.seed for record in records], list(range(6)))
+        self.assertTrue(all(agent.decisions for agent in agents.values()))
+
+        # a game plays out the same however many are played with it
+        alone = asyncio.run(play_game_async(4, LatencyAgent(0, 4)))
+        self.assertEqual(alone.points, records[4].points)
+        self.assertEqual(list(map(str, alone.kyoku_logs)),
+                         list(map(str, records[4].kyoku_logs)))
+
+    def test_one_thread(self):
+        class ThreadAgent(LatencyAgent):
+            threads = set()
+
+            async def actions(self, player, new_tile, action_list, discard):
+                self.threads.add(threading.get_ident())
+                return await super().actions(
+                    player, new_tile, action_list, discard)
+
+        threads = threading.active_count()
+        asyncio.run(play_games_async(
+            range(3), lambda seed: ThreadAgent(0, seed), concurrency=2))
+        self.assertEqual(ThreadAgent.threads, {threading.get_ident()})
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_agent_error(self):
+        class FailingAgent(AsyncUserInput):
+            async def actions(self, player, new_tile, action_list, discard):
+                raise ConnectionError("agent unreachable")
+
+            async def discard(self, player, new_tile, kuikae_tiles):
+                return legal_discards(player, new_tile, kuikae_tiles)[0]
+
+        with self.assertRaisesRegex(ConnectionError, "agent unreachable"):
+            asyncio.run(play_games_async(
+                [0, 1], lambda seed: FailingAgent(), concurrency=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,15 @@
+import copy
+import pickle
+import random
 import unittest
 
-from mahjong.components import Suit, Jihai, Naki, Tile, Stack, Huro
+from mahjong.components import (
+    Suit, Jihai, Naki, Tile, OwnedTile, Stack, Huro, Hand)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestTile(unittest.TestCase):
@@ -19,41 +28,60 @@ class TestTile(unittest.TestCase):
         self.assertEqual(self.tile.suit, 1)
         self.assertEqual(self.tile.rank, 2)
 
-    def test_suit_setter(self):
-        self.tile.suit = Suit.PINZU.value
-        self.assertEqual(self.tile.suit, 3)
-        self.assertEqual(self.tile.rank, 2)
+    def test_interned(self):
+        self.assertIs(Tile(Suit.MANZU.value, 2), self.tile)
+        self.assertIs(Tile.from_index(self.tile.index), self.tile)
+        self.assertIs(self.tile.next_tile(), Tile(Suit.MANZU.value, 3))
+        self.assertIs(copy.deepcopy(self.tile), self.tile)
+        self.assertIs(pickle.loads(pickle.dumps(self.tile)), self.tile)
+        self.assertEqual(len({Tile(1, 2), Tile(1, 2), Tile(0, 3)}), 2)
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.tile.suit = Suit.PINZU.value
+        with self.assertRaises(AttributeError):
+            self.tile.owner = 0
+        self.assertEqual(self.tile.suit, 1)
+        self.assertEqual(self.tile.owner, None)
 
-    def test_suit_setter_error(self):
+    def test_suit_error(self):
         with self.assertRaises(ValueError):
-            self.tile.suit = 4
+            Tile(4, 2)
 
-    def test_suit_setter_error2(self):
+    def test_suit_error2(self):
         with self.assertRaises(ValueError):
-            self.tile.suit = -1
+            Tile(-1, 2)
 
-    def test_rank_setter_error(self):
+    def test_rank_error(self):
         with self.assertRaises(ValueError):
-            self.tile.rank = -1
+            Tile(1, -1)
 
-    def test_rank_setter_error2(self):
-        self.tile.suit = 0
+    def test_rank_error2(self):
         with self.assertRaises(ValueError):
-            self.tile.rank = 9
+            Tile(0, 9)
 
-    def test_rank_setter_error3(self):
-        self.tile.suit = 1
+    def test_rank_error3(self):
         with self.assertRaises(ValueError):
-            self.tile.rank = 10
-
-    def test_owner_getter(self):
-        self.tile.owner = 0
-        self.assertEqual(self.tile.owner, 0)
+            Tile(1, 10)
 
-    def test_owner_setter(self):
-        self.tile.owner = 0
+    def test_from_index_error(self):
         with self.assertRaises(ValueError):
-            self.tile.owner = 5
+            Tile.from_index(20)
+
+    def test_owned_tile(self):
+        owned = OwnedTile(self.tile, 0)
+        self.assertEqual(owned.owner, 0)
+        self.assertEqual(owned, self.tile)
+        self.assertEqual(hash(owned), hash(self.tile))
+        self.assertIs(owned.tile, self.tile)
+        self.assertIsInstance(owned, Tile)
+        self.assertEqual(pickle.loads(pickle.dumps(owned)).owner, 0)
+        with self.assertRaises(AttributeError):
+            owned.owner = 1
+
+    def test_owned_tile_error(self):
+        with self.assertRaises(ValueError):
+            OwnedTile(self.tile, 5)
 
     def test_akadora(self):
         self.assertEqual(self.tile.akadora(), None)
@@ -120,6 +148,32 @@ class TestStack(unittest.TestCase):
         self.assertEqual(self.test_stack.draw(from_rinshan=True),
                          self.test_stack.stack[-1])
 
+    def test_seed(self):
+        self.assertEqual(Stack(1).wall_order, Stack(1).wall_order)
+        self.assertNotEqual(Stack(1).wall_order, Stack(2).wall_order)
+        self.assertEqual(Stack(random.Random(1)).wall_order,
+                         Stack(1).wall_order)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_seed(self):
+        stack_1 = Stack(np.random.default_rng(1))
+        stack_2 = Stack(np.random.default_rng(1))
+        self.assertEqual(stack_1.wall_order, stack_2.wall_order)
+
+    def test_from_wall_order(self):
+        stack = Stack.from_wall_order(self.test_stack.wall_order)
+        self.assertEqual(stack.stack, self.test_stack.stack)
+        self.assertEqual(stack.dora_indicators,
+                         self.test_stack.dora_indicators)
+        self.assertEqual(stack.draw(), self.test_stack.draw())
+
+        with self.assertRaises(ValueError):
+            Stack.from_wall_order(self.test_stack.wall_order[:-1])
+        wall_order = sorted(self.test_stack.wall_order)
+        wall_order[0] = wall_order[-1]  # five copies of a tile
+        with self.assertRaises(ValueError):
+            Stack.from_wall_order(wall_order)
+
     def test_add_dora(self):
         self.test_stack.add_dora_indicator()
         self.assertEqual(len(self.test_stack.dora_indicators), 2)
@@ -180,19 +234,19 @@ class TestHuro(unittest.TestCase):
 
     def setUp(self):
         chii_tile = Tile(Suit.MANZU.value, 7)
-        chii_tile.owner = 0
+        chii_tile = OwnedTile(chii_tile, 0)
         self.huro_chii = Huro(Naki.CHII,
                               chii_tile,
                               [Tile(Suit.MANZU.value, 7),
                                Tile(Suit.MANZU.value, 8),
                                Tile(Suit.MANZU.value, 9)])
         pon_tile = Tile(Suit.MANZU.value, 2)
-        pon_tile.owner = 0
+        pon_tile = OwnedTile(pon_tile, 0)
         self.huro_pon = Huro(Naki.PON,
                              pon_tile,
                              [Tile(Suit.MANZU.value, 2) for i in range(3)])
         kan_tile = Tile(Suit.MANZU.value, 5)
-        kan_tile.owner = 0
+        kan_tile = OwnedTile(kan_tile, 0)
         self.huro_kan = Huro(Naki.DAMINKAN,
                              kan_tile,
                              [Tile(Suit.MANZU.value, 5) for i in range(4)])
@@ -220,3 +274,56 @@ class TestHuro(unittest.TestCase):
     def test_add_kan_error(self):
         with self.assertRaises(ValueError):
             self.huro_chii.add_kan(Tile(Suit.MANZU.value, 7))
+
+
+class TestHand(unittest.TestCase):
+
+    def setUp(self):
+        self.hand = Hand([Tile(Suit.MANZU.value, 1),
+                          Tile(Suit.MANZU.value, 1),
+                          Tile(Suit.JIHAI.value, Jihai.CHUN.value)])
+
+    def test_getitem(self):
+        self.assertEqual(self.hand[Tile(Suit.MANZU.value, 1).index], 2)
+        self.assertEqual(self.hand[Tile(Suit.PINZU.value, 1).index], 0)
+        # indices outside of the 34 tiles count as zero, like defaultdict
+        self.assertEqual(self.hand[20], 0)
+        self.assertEqual(self.hand[41], 0)
+
+    def test_setitem(self):
+        self.hand[Tile(Suit.SOUZU.value, 5).index] += 3
+        self.hand[Tile(Suit.MANZU.value, 1).index] -= 2
+        self.assertEqual(self.hand[Tile(Suit.SOUZU.value, 5).index], 3)
+        self.assertEqual(
+            self.hand.keys(),
+            [Tile(Suit.JIHAI.value, Jihai.CHUN.value).index,
+             Tile(Suit.SOUZU.value, 5).index])
+        with self.assertRaises(KeyError):
+            self.hand[20] = 1
+
+    def test_items(self):
+        self.assertEqual(self.hand.items(), [(3, 1), (11, 2)])
+        self.assertEqual(self.hand.values(), [1, 2])
+        self.assertEqual(len(self.hand), 2)
+        self.assertEqual(sum(self.hand.values()), 3)
+
+    def test_copy(self):
+        hand_copy = self.hand.copy()
+        hand_copy[Tile(Suit.MANZU.value, 1).index] += 1
+        self.assertEqual(self.hand[Tile(Suit.MANZU.value, 1).index], 2)
+        self.assertEqual(hand_copy[Tile(Suit.MANZU.value, 1).index], 3)
+        self.assertEqual(copy.deepcopy(self.hand), self.hand)
+
+    def test_signature(self):
+        other = Hand.from_counts({3: 1, 11: 2})
+        self.assertEqual(other, self.hand)
+        self.assertEqual(other.signature, self.hand.signature)
+        self.assertEqual(len(self.hand.signature), 34)
+        self.assertEqual({self.hand.signature: 1}[other.signature], 1)
+
+    def test_eq_dict(self):
+        self.assertEqual(self.hand, {3: 1, 11: 2, 12: 0})
+        self.assertNotEqual(self.hand, {3: 1})
+
+    def test_suit_keys(self):
+        self.assertEqual(self.hand.suit_keys(), [0o100, 0o2, 0, 0])
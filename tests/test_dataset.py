@@ -0,0 +1,92 @@
+import os
+import random
+import tempfile
+import unittest
+
+from mahjong.dataset import ReplayDataset
+from mahjong.packed_log import append_kyokus
+from mahjong.replay import KyokuReplay
+from mahjong.self_play import play_game
+
+
+class TestReplayDataset(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.loggers = []
+        for i, seed in enumerate((1, 2)):
+            loggers = play_game(seed).kyoku_logs
+            append_kyokus(os.path.join(cls.tmpdir.name, f'{i}.log'), loggers)
+            cls.loggers += loggers
+        open(os.path.join(cls.tmpdir.name, '2.log'), 'wb').close()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def setUp(self):
+        self.dataset = ReplayDataset(self.tmpdir.name, cache_size=4)
+
+    def tearDown(self):
+        self.dataset.close()
+
+    def test_index(self):
+        self.assertEqual(len(self.dataset.paths), 3)
+        self.assertEqual(self.dataset.n_kyokus, len(self.loggers))
+        self.assertEqual(len(self.dataset),
+                         sum(len(logger.logs) for logger in self.loggers))
+        last = len(self.loggers) - 1
+        self.assertEqual(self.dataset.locate(-1),
+                         (last, len(self.loggers[last].logs) - 1))
+        with self.assertRaises(IndexError):
+            self.dataset.locate(len(self.dataset))
+
+    def test_getitem(self):
+        i = 0
+        for kyoku_id, logger in enumerate(self.loggers):
+            for position, log in enumerate(logger.logs):
+                if i % 7 == 0:
+                    self.assertEqual(self.dataset.locate(i),
+                                     (kyoku_id, position))
+                    _, action = self.dataset[i]
+                    self.assertEqual(str(action), str(log))
+                i += 1
+
+    def test_state_at(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            kyoku_id = rng.randrange(self.dataset.n_kyokus)
+            position = rng.randrange(self.dataset.n_actions(kyoku_id) + 1)
+            expected = KyokuReplay(
+                self.loggers[kyoku_id]).seek(position).snapshot()
+            # logs are unpacked anew, compare the rest of the state
+            state = self.dataset.state_at(kyoku_id, position).snapshot()
+            self.assertEqual(state.players, expected.players)
+            self.assertEqual(state.playing_wall, expected.playing_wall)
+            self.assertEqual(state.dora_indicators, expected.dora_indicators)
+        self.assertLessEqual(len(self.dataset._replays), 4)
+
+    def test_sample(self):
+        kyoku, action = self.dataset.sample(random.Random(0))
+        self.assertEqual(len(kyoku.players), 4)
+        self.assertIsNotNone(action.action)
+
+    def test_close_with_kyokus(self):
+        kyoku = self.dataset.kyoku(0)
+        replay = self.dataset.replay(1)
+        self.dataset.close()
+        # closing released the views handed out
+        with self.assertRaises(ValueError):
+            kyoku.raw(0)
+        self.assertIsNotNone(replay)
+
+    def test_single_file(self):
+        path = os.path.join(self.tmpdir.name, '0.log')
+        with ReplayDataset(path) as dataset:
+            self.assertEqual(dataset.paths, [path])
+            self.assertGreater(len(dataset), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
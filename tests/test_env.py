@@ -0,0 +1,202 @@
+import random
+import threading
+import unittest
+
+from mahjong.action_space import (
+    N_ACTIONS, NOACT, TSUMO, RON, CHII, PON, DAMINKAN, KAN,
+    encode_action_list, encode_discards, action_mask, legal_on_discard,
+    legal_on_draw
+)
+from mahjong.components import (
+    Action, Naki, Tile, Suit, Stack, Hand, Huro, Jihai, SLOT_OF_INDEX
+)
+from mahjong.env import KyokuEnv, DecisionType
+from mahjong.player import Player
+
+
+def play_kyoku(env, rng, wall_order=None):
+    observation, mask = env.reset(wall_order)
+    steps = 0
+    while True:
+        legal = [i for i, flag in enumerate(mask) if flag]
+        observation, mask, rewards, done, info = env.step(rng.choice(legal))
+        steps += 1
+        if done:
+            return observation, rewards, info, steps
+
+
+class TestActionSpace(unittest.TestCase):
+
+    def test_encode_action_list(self):
+        tile = Tile(Suit.MANZU.value, 3)
+        action_list = [
+            (Action.NOACT, Naki.NONE, []),
+            (Action.NAKI, Naki.PON, [[tile, tile, tile]]),
+            (Action.NAKI, Naki.CHII, [
+                [Tile(Suit.MANZU.value, 1), Tile(Suit.MANZU.value, 2), tile],
+                [tile, Tile(Suit.MANZU.value, 4), Tile(Suit.MANZU.value, 5)],
+            ]),
+            (Action.RON, Naki.NONE, []),
+        ]
+        choices = encode_action_list(action_list, tile)
+        self.assertEqual(sorted(choices), [NOACT, RON, CHII, CHII + 2, PON])
+        self.assertEqual(choices[CHII][2][0], tile)
+
+    def test_encode_kan(self):
+        tile = Tile(Suit.JIHAI.value, 1)
+        choices = encode_action_list(
+            [(Action.NAKI, Naki.ANKAN, [[tile] * 4])], tile)
+        self.assertEqual(list(choices), [KAN])
+
+    def test_mask(self):
+        tiles = [Tile(Suit.JIHAI.value, 1), Tile(Suit.PINZU.value, 9)]
+        mask = action_mask(encode_discards(tiles))
+        self.assertEqual(len(mask), N_ACTIONS)
+        self.assertEqual([i for i, flag in enumerate(mask) if flag], [0, 33])
+
+
+class TestLegalActions(unittest.TestCase):
+
+    def setUp(self):
+        self.stack = Stack(0)
+        self.player = Player('test', 1)
+        # 234m 444m 567p 345s 66s, waiting on 4m or 6s
+        self.player.hand = Hand(
+            [Tile(Suit.MANZU.value, rank) for rank in (2, 3, 4, 4, 4)]
+            + [Tile(Suit.PINZU.value, rank) for rank in (5, 6, 7)]
+            + [Tile(Suit.SOUZU.value, rank) for rank in (3, 4, 5, 6, 6)])
+
+    def legal_ids(self, legal):
+        ids = [i for i, flag in enumerate(legal.mask) if flag]
+        self.assertEqual(ids, sorted(legal.choices))
+        return ids
+
+    def test_on_discard(self):
+        tile = Tile(Suit.MANZU.value, 4)
+        legal = legal_on_discard(self.player, tile, 0, self.stack, Jihai.TON)
+        self.assertEqual(self.legal_ids(legal),
+                         [NOACT, RON, CHII + 2, PON, DAMINKAN])
+        self.assertEqual([action for action, _, _ in legal],
+                         [Action.NOACT, Action.NAKI, Action.NAKI,
+                          Action.NAKI, Action.RON])
+        # only kamicha's discards can be chii'd
+        legal = legal_on_discard(self.player, tile, 2, self.stack, Jihai.TON)
+        self.assertEqual(self.legal_ids(legal), [NOACT, RON, PON, DAMINKAN])
+
+    def test_on_discard_riichi(self):
+        self.player.is_riichi = True
+        legal = legal_on_discard(self.player, Tile(Suit.MANZU.value, 4), 0,
+                                 self.stack, Jihai.TON)
+        self.assertEqual(self.legal_ids(legal), [NOACT, RON])
+        self.player.permanent_furiten = True
+        legal = legal_on_discard(self.player, Tile(Suit.MANZU.value, 4), 0,
+                                 self.stack, Jihai.TON)
+        self.assertEqual(self.legal_ids(legal), [NOACT])
+
+    def test_on_draw(self):
+        ipin, chun = Tile(Suit.PINZU.value, 1), Tile(Suit.JIHAI.value, 3)
+        self.player.hand = Hand(
+            [ipin] * 4 + [Tile(Suit.MANZU.value, rank) for rank in (2, 3, 4)]
+            + [Tile(Suit.PINZU.value, rank) for rank in (5, 6, 7)])
+        self.player.kabe = [Huro(Naki.PON, chun, [chun] * 3)]
+        legal = legal_on_draw(self.player, chun, False, self.stack, Jihai.TON)
+        self.assertEqual(
+            self.legal_ids(legal),
+            sorted([NOACT, KAN + SLOT_OF_INDEX[ipin.index],
+                    KAN + SLOT_OF_INDEX[chun.index]]))
+        self.assertEqual(legal[1],
+                         (Action.NAKI, Naki.ANKAN, [[ipin] * 4]))
+        self.assertEqual(legal[2],
+                         (Action.NAKI, Naki.CHAKAN, [[chun] * 4]))
+
+    def test_choices_follow_add(self):
+        legal = legal_on_discard(self.player, Tile(Suit.MANZU.value, 4), 2,
+                                 self.stack, Jihai.TON)
+        self.assertNotIn(CHII, legal.choices)
+        legal.add(Action.NAKI, Naki.CHII, [[Tile(Suit.MANZU.value, 4),
+                                            Tile(Suit.MANZU.value, 5),
+                                            Tile(Suit.MANZU.value, 6)]])
+        self.assertTrue(legal.mask[CHII])
+        # still the action_list UserInput.actions is given
+        self.assertEqual(legal[0], (Action.NOACT, Naki.NONE, []))
+
+    def test_tsumo(self):
+        tile = Tile(Suit.SOUZU.value, 6)
+        legal = legal_on_draw(self.player, tile, False, self.stack, Jihai.TON)
+        self.assertEqual(legal[-1], (Action.TSUMO, Naki.NONE, []))
+        self.assertEqual(self.legal_ids(legal), [NOACT, TSUMO])
+
+
+class TestKyokuEnv(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+
+    def test_reset(self):
+        env = KyokuEnv(seed=1)
+        observation, mask = env.reset()
+        # oya decides on its first draw
+        self.assertEqual(observation.seat, 0)
+        self.assertEqual(observation.decision_type, DecisionType.ACTION)
+        self.assertEqual(sum(observation.hand.values()), 13)
+        self.assertEqual(len(mask), N_ACTIONS)
+        self.assertTrue(mask[NOACT])
+        self.assertEqual(env.legal_actions,
+                         [i for i, flag in enumerate(mask) if flag])
+        env.close()
+
+    def test_play_to_the_end(self):
+        env = KyokuEnv(seed=2)
+        rng = random.Random(3)
+        for _ in range(10):
+            observation, rewards, info, steps = play_kyoku(env, rng)
+            self.assertEqual(observation.decision_type, DecisionType.DONE)
+            self.assertGreater(steps, 0)
+            if info['winners']:
+                self.assertEqual(sum(rewards), 0)
+                self.assertGreater(rewards[info['winners'][0]], 0)
+
+    def test_replay(self):
+        wall_order = Stack(seed=4).wall_order
+        results = []
+        for _ in range(2):
+            results.append(play_kyoku(KyokuEnv(), random.Random(5),
+                                      wall_order)[1:])
+        self.assertEqual(results[0], results[1])
+
+    def test_seeded_dummy_seats(self):
+        results = []
+        for global_seed in (1, 2):
+            random.seed(global_seed)
+            env = KyokuEnv(agent_seats=[0], seed=0)
+            results.append(play_kyoku(env, random.Random(0))[1:])
+        self.assertEqual(results[0], results[1])
+
+    def test_agent_seats(self):
+        env = KyokuEnv(agent_seats=[2], seed=6)
+        observation, mask = env.reset()
+        self.assertEqual(observation.seat, 2)
+        env.close()
+
+    def test_illegal_action(self):
+        env = KyokuEnv(seed=1)
+        _, mask = env.reset()
+        illegal = next(i for i, flag in enumerate(mask) if not flag)
+        with self.assertRaises(ValueError):
+            env.step(illegal)
+        env.close()
+
+    def test_no_thread(self):
+        threads = threading.active_count()
+        env = KyokuEnv(seed=1)
+        env.reset()
+        env.step(env.legal_actions[0])
+        self.assertEqual(threading.active_count(), threads)
+        env.reset()  # drops the kyoku in progress
+        env.close()
+        with self.assertRaises(RuntimeError):
+            env.step(NOACT)
+
+    def test_step_before_reset(self):
+        with self.assertRaises(RuntimeError):
+            KyokuEnv().step(NOACT)
@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from mahjong.components import Tile, Suit, Huro, Naki, SLOT_OF_INDEX
+from mahjong.kyoku import Kyoku
+from mahjong.player import Player
+from mahjong.renderer import Renderer
+try:
+    import numpy as np
+    from mahjong import features
+    from mahjong.env import KyokuEnv
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestFeatureEncoder(unittest.TestCase):
+
+    def setUp(self):
+        players = [Player(f'player {i}', i) for i in range(4)]
+        self.kyoku = Kyoku(players, renderer=Renderer(), seed=0)
+        self.kyoku.deal()
+        self.players = players
+        self.encoder = features.FeatureEncoder(batch_size=2)
+
+    def plane(self, planes, plane, tile):
+        return planes[plane, SLOT_OF_INDEX[tile.index]]
+
+    def test_shape(self):
+        planes = self.encoder.encode_kyoku(self.kyoku, 0)
+        self.assertEqual(planes.shape, (features.N_PLANES, 34))
+        self.assertEqual(self.encoder.buffer.shape,
+                         (2, features.N_PLANES, 34))
+
+    def test_hand(self):
+        planes = self.encoder.encode_kyoku(self.kyoku, 1)
+        hand = self.players[1].hand
+        self.assertEqual(planes[features.HAND].sum(), len(hand.keys()))
+        self.assertEqual(planes[features.HAND:features.HAND + 4].sum(), 13)
+        for index, count in hand.items():
+            tile = Tile.from_index(index)
+            self.assertEqual(self.plane(planes, features.HAND + count - 1,
+                                        tile), 1)
+
+    def test_relative_seats(self):
+        tile = Tile(Suit.PINZU.value, 5)
+        self.players[3].kawa = [tile]
+        self.players[3].is_riichi = True
+        self.players[3].kabe = [Huro(Naki.PON, tile, [tile] * 3)]
+        planes = self.encoder.encode_kyoku(self.kyoku, 1)
+        # seat 3 is two seats after seat 1
+        self.assertEqual(self.plane(planes, features.KAWA + 4 * 2, tile), 1)
+        self.assertEqual(self.plane(planes, features.KAWA_ORDER + 2, tile),
+                         1 / features.MAX_KAWA)
+        self.assertEqual(self.plane(planes, features.KABE + 4 * 2 + 2, tile),
+                         1)
+        self.assertTrue((planes[features.RIICHI + 2] == 1).all())
+        self.assertTrue((planes[features.RIICHI] == 0).all())
+
+    def test_winds(self):
+        planes = self.encoder.encode_kyoku(self.kyoku, 1)
+        self.assertEqual(self.plane(planes, features.BAKAZE, Tile(0, 4)), 1)
+        self.assertEqual(self.plane(planes, features.JIKAZE, Tile(0, 5)), 1)
+
+    def test_buffer_is_reused(self):
+        tile = Tile(Suit.MANZU.value, 1)
+        first = self.encoder.encode_kyoku(self.kyoku, 0, tile)
+        second = self.encoder.encode_kyoku(self.kyoku, 0)
+        self.assertTrue(np.shares_memory(first, second))
+        self.assertEqual(second[features.NEW_TILE].sum(), 0)
+
+    def test_encode_observation(self):
+        random.seed(0)
+        env = KyokuEnv(seed=1)
+        observation, mask = env.reset()
+        from_observation = self.encoder.encode(observation, 0).copy()
+        from_kyoku = self.encoder.encode_kyoku(
+            env.kyoku, observation.seat, observation.new_tile, 1)
+        self.assertTrue((from_observation == from_kyoku).all())
+
+        batch = self.encoder.encode_batch([observation, observation])
+        self.assertEqual(batch.shape[0], 2)
+        with self.assertRaises(ValueError):
+            self.encoder.encode_batch([observation] * 3)
+        env.close()
@@ -0,0 +1,99 @@
+import unittest
+
+from mahjong.components import Tile, Suit, Jihai, Naki, Huro
+from mahjong.player import Player
+from mahjong.hand_decomposition import (
+    HandDecomposition, separations, NO_SEPARATION
+)
+
+
+class TestSeparations(unittest.TestCase):
+
+    def setUp(self):
+        self.player = Player('test', 0)
+
+    def test_all_separations(self):
+        # 111222333m 789s 55p: three koutsu or three shuntsu
+        for rank in range(1, 4):
+            self.player.hand[Tile(Suit.MANZU.value, rank).index] += 3
+        for rank in range(7, 10):
+            self.player.hand[Tile(Suit.SOUZU.value, rank).index] += 1
+        self.player.hand[Tile(Suit.PINZU.value, 5).index] += 2
+        result = separations(self.player.hand, 0)
+        self.assertEqual(len(result), 2)
+        self.assertEqual(sorted(len(koutsus) for koutsus, _, _ in result),
+                         [0, 3])
+        for _, _, jantou in result:
+            self.assertEqual(jantou, Tile(Suit.PINZU.value, 5))
+
+    def test_jantou_choices(self):
+        # 11123444m: 11m with 123m 444m, or 44m with 111m 234m
+        self.player.hand[Tile(Suit.MANZU.value, 1).index] += 3
+        self.player.hand[Tile(Suit.MANZU.value, 2).index] += 1
+        self.player.hand[Tile(Suit.MANZU.value, 3).index] += 1
+        self.player.hand[Tile(Suit.MANZU.value, 4).index] += 3
+        self.assertEqual(
+            sorted(jantou for _, _, jantou in
+                   separations(self.player.hand, 2)),
+            [Tile(Suit.MANZU.value, 1), Tile(Suit.MANZU.value, 4)])
+        # wrong number of tiles for the huro
+        self.assertEqual(separations(self.player.hand, 1), [])
+
+    def test_chiitoitsu(self):
+        for tile in (Tile(Suit.MANZU.value, 1), Tile(Suit.MANZU.value, 9),
+                     Tile(Suit.SOUZU.value, 1), Tile(Suit.PINZU.value, 5),
+                     Tile(Suit.JIHAI.value, Jihai.TON.value),
+                     Tile(Suit.JIHAI.value, Jihai.NAN.value),
+                     Tile(Suit.JIHAI.value, Jihai.HAKU.value)):
+            self.player.hand[tile.index] += 2
+        self.assertEqual(separations(self.player.hand, 0), [])
+
+
+class TestHandDecomposition(unittest.TestCase):
+
+    def setUp(self):
+        self.player = Player('test', 0)
+        for rank in range(1, 4):
+            self.player.hand[Tile(Suit.MANZU.value, rank).index] += 3
+        self.player.hand[Tile(Suit.PINZU.value, 5).index] += 1
+        self.player.kabe.append(
+            Huro(Naki.CHII, Tile(Suit.SOUZU.value, 7),
+                 [Tile(Suit.SOUZU.value, i) for i in range(7, 10)]))
+
+    def test_agari_hand(self):
+        agari_tile = Tile(Suit.PINZU.value, 5)
+        decomposition = HandDecomposition(self.player, agari_tile)
+        self.assertEqual(decomposition.agari_tile, agari_tile)
+        self.assertEqual(decomposition.agari_hand[agari_tile.index], 2)
+        # the player's hand is left alone
+        self.assertEqual(self.player.hand[agari_tile.index], 1)
+        self.assertEqual(sum(decomposition.hand_and_kabe.values()), 14)
+        self.assertEqual(len(decomposition.huro_tiles), 3)
+
+    def test_preferred_separations(self):
+        decomposition = HandDecomposition(
+            self.player, Tile(Suit.PINZU.value, 5))
+        self.assertEqual(len(decomposition.koutsu_first[0]), 3)
+        self.assertEqual(len(decomposition.shuntsu_first[1]), 3)
+
+    def test_no_separation(self):
+        decomposition = HandDecomposition(
+            self.player, Tile(Suit.PINZU.value, 6))
+        self.assertEqual(decomposition.separations, [])
+        self.assertEqual(decomposition.koutsu_first, NO_SEPARATION)
+
+    def test_per_separation(self):
+        decomposition = HandDecomposition(
+            self.player, Tile(Suit.PINZU.value, 5))
+        views = list(decomposition.per_separation())
+        self.assertEqual(len(views), len(decomposition.separations))
+        for view, separation in zip(views, decomposition.separations):
+            self.assertEqual(view.koutsu_first, separation)
+            self.assertEqual(view.shuntsu_first, separation)
+            self.assertIs(view.agari_hand, decomposition.agari_hand)
+
+    def test_per_separation_single(self):
+        decomposition = HandDecomposition(
+            self.player, Tile(Suit.PINZU.value, 6))
+        self.assertEqual(list(decomposition.per_separation()),
+                         [decomposition])
@@ -1,10 +1,10 @@
 import unittest
 
-from mahjong.components import Suit, Tile, Huro, Naki, Jihai
+from mahjong.components import Suit, Tile, Huro, Naki, Jihai, OwnedTile
 from mahjong.player import Player
 from mahjong.helpers import (
     is_yaochuu, nine_yaochuus, consists_jantou_and_sets, separate_sets,
-    is_chi, is_pon, rank_players
+    is_chi, is_pon, rank_players, calculate_base_points
 )
 
 
@@ -79,7 +79,7 @@ class TestSeparateSets(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 8).index] += 3
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.NAN.value).index] += 3
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.PON,
                  naki_tile,
@@ -165,3 +165,19 @@ class TestRankPlayers(unittest.TestCase):
         expected_rank = [self.player_2, self.player_1,
                          self.player_3, self.player_0]
         self.assertEqual(rank_players(self.players), expected_rank)
+
+
+class TestCalculateBasePoints(unittest.TestCase):
+
+    def test_below_mangan(self):
+        self.assertEqual(calculate_base_points(1, 30), 240)
+        self.assertEqual(calculate_base_points(3, 40), 1_280)
+
+    def test_limits(self):
+        self.assertEqual(calculate_base_points(4, 40), 2_000)
+        self.assertEqual(calculate_base_points(5, 30), 2_000)
+        self.assertEqual(calculate_base_points(7, 30), 3_000)
+        self.assertEqual(calculate_base_points(10, 30), 4_000)
+        self.assertEqual(calculate_base_points(12, 30), 6_000)
+        self.assertEqual(calculate_base_points(13, 20), 8_000)
+        self.assertEqual(calculate_base_points(26, 20), 16_000)
@@ -0,0 +1,82 @@
+import threading
+import unittest
+
+from mahjong.action_space import N_ACTIONS
+from mahjong.components import N_SLOTS
+try:
+    import numpy as np
+    from mahjong.features import N_PLANES
+    from mahjong.inference import (
+        BatchedInference, NumpyPolicy, masked_argmax, play_batched_game,
+        play_batched_games
+    )
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestNumpyPolicy(unittest.TestCase):
+
+    def test_logits(self):
+        policy = NumpyPolicy(n_hidden=16, seed=0)
+        features = np.random.default_rng(0).random((3, N_PLANES, N_SLOTS),
+                                                   np.float32)
+        logits = policy(features)
+        self.assertEqual(logits.shape, (3, N_ACTIONS))
+        np.testing.assert_allclose(policy(features[1:2]), logits[1:2],
+                                   atol=1e-5)
+
+    def test_masked_argmax(self):
+        logits = np.array([[3.0, 2.0, 1.0], [3.0, 2.0, 1.0]])
+        masks = np.array([[False, True, True], [True, False, False]])
+        self.assertEqual(masked_argmax(logits, masks).tolist(), [1, 0])
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestBatchedInference(unittest.TestCase):
+
+    def test_batches(self):
+        inference = BatchedInference(NumpyPolicy(seed=0), batch_size=4)
+        records = play_batched_games(range(4), inference)
+        self.assertEqual([record.seed for record in records], [0, 1, 2, 3])
+        self.assertGreater(inference.mean_batch_size, 1)
+        self.assertLessEqual(inference.mean_batch_size, 4)
+
+        # batching doesn't change the choices
+        inference = BatchedInference(NumpyPolicy(seed=0), batch_size=1)
+        record = play_batched_game(2, inference)
+        self.assertEqual(inference.mean_batch_size, 1)
+        self.assertEqual(record.points, records[2].points)
+        self.assertEqual(list(map(str, record.kyoku_logs)),
+                         list(map(str, records[2].kyoku_logs)))
+
+    def test_policy_error(self):
+        def policy(features):
+            raise ValueError("broken policy")
+
+        with self.assertRaisesRegex(ValueError, "broken policy"):
+            play_batched_game(0, BatchedInference(policy))
+
+    def test_n_games(self):
+        inference = BatchedInference(NumpyPolicy(seed=0), batch_size=4)
+        records = play_batched_games(range(3), inference, n_games=2)
+        self.assertEqual([record.seed for record in records], [0, 1, 2])
+        self.assertLessEqual(inference.mean_batch_size, 2)
+        self.assertEqual(records[2].points,
+                         play_batched_game(2, inference).points)
+
+    def test_no_thread(self):
+        n_threads = threading.active_count()
+        policy = NumpyPolicy(seed=0)
+
+        def counting_policy(features):
+            self.assertEqual(threading.active_count(), n_threads)
+            self.assertIs(threading.current_thread(),
+                          threading.main_thread())
+            return policy(features)
+
+        play_batched_games(range(2), BatchedInference(counting_policy))
+
+
+if __name__ == '__main__':
+    unittest.main()
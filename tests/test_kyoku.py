@@ -1,7 +1,7 @@
 import unittest
 
 from mahjong.player import Player
-from mahjong.components import Jihai, Tile, Suit, Naki, Huro
+from mahjong.components import Jihai, Tile, Suit, Naki, Huro, OwnedTile
 from mahjong.kyoku import Kyoku
 
 
@@ -46,6 +46,17 @@ class TestTurnDrawFlow(unittest.TestCase):
         self.assertEqual(sum(self.kyoku.players[2].hand.values()), 13)
         self.assertEqual(sum(self.kyoku.players[3].hand.values()), 13)
 
+    def test_seed(self):
+        kyoku = Kyoku(self.players, seed=5)
+        kyoku.deal()
+        hands = [player.hand.copy() for player in self.players]
+        Kyoku(self.players, seed=5).deal()
+        self.assertEqual([player.hand for player in self.players], hands)
+
+        wall_order = kyoku.tile_stack.wall_order
+        Kyoku(self.players, wall_order=wall_order).deal()
+        self.assertEqual([player.hand for player in self.players], hands)
+
     def test_calculate_yaku(self):
         ...
 
@@ -89,7 +100,7 @@ class TestRyuukyoku(unittest.TestCase):
         self.player_1.furiten_tiles_idx.add(Tile(Suit.MANZU.value, 1).index)
         self.player_1.furiten_tiles_idx.add(Tile(Suit.MANZU.value, 9).index)
         naki_tile = Tile(Suit.JIHAI.value, Jihai.HAKU.value)
-        naki_tile.owner = self.player_1.seating_position
+        naki_tile = OwnedTile(naki_tile, self.player_1.seating_position)
         huro = Huro(Naki.CHII, naki_tile, [])
         self.player_2.kabe = [huro]
         self.player_2.furiten_tiles_idx.add(Tile(Suit.MANZU.value, 5).index)
@@ -1,13 +1,19 @@
+import random
 import unittest
+from collections import Counter
 import pyinputplus as pyinput
 from unittest.mock import MagicMock
 
-from mahjong.components import Tile, Stack, Suit, Jihai, Naki, Huro, Action
+from mahjong.components import (
+    Tile, Stack, Suit, Jihai, Naki, Huro, Action, OwnedTile, Hand,
+    TILE_INDICES)
 from mahjong.player import Player
 from mahjong.naki_and_actions import (
     check_ron, check_tsumo, check_furiten, check_own_discard_furiten,
     check_ankan, check_chakan, check_daminkan, check_pon, check_chii,
-    check_riichi, check_tenpai, check_remains_are_sets)
+    check_riichi, check_tenpai, check_yaku, tenpai_cache, tenpai_discards)
+from mahjong.helpers import check_remains_are_sets
+from mahjong.yaku_calculator import YakuCalculator, has_common_yaku
 
 
 class TestRon(unittest.TestCase):
@@ -97,7 +103,126 @@ class TestTsumo(unittest.TestCase):
 
 
 class TestYaku(unittest.TestCase):
-    ...
+
+    def setUp(self):
+        # tenpai: 3 MANZU, a penchan with 1 PINZU in the hand
+        self.player = Player('test', 1)
+        self.player.hand = self.hand({
+            Suit.MANZU: (1, 2), Suit.PINZU: (1, 1, 2, 3, 4),
+            Suit.SOUZU: (5, 6, 7, 7, 8, 9)})
+        self.agari_tile = Tile(Suit.MANZU.value, 3)
+        self.stack = Stack()
+        self.bakaze = Jihai.TON
+
+    @staticmethod
+    def hand(ranks):
+        hand = Player('test', 0).hand
+        for suit, suit_ranks in ranks.items():
+            for rank in suit_ranks:
+                hand[Tile(suit.value, rank).index] += 1
+        return hand
+
+    def check(self, is_ron):
+        return check_yaku(self.player, self.stack, self.bakaze, is_ron,
+                          [self.agari_tile], self.agari_tile)
+
+    def test_no_yaku(self):
+        self.assertFalse(has_common_yaku(
+            self.player, self.bakaze, True, self.agari_tile))
+        self.assertFalse(self.check(True))
+
+    def test_riichi_and_menzen_tsumo(self):
+        self.assertTrue(has_common_yaku(
+            self.player, self.bakaze, False, self.agari_tile))
+        self.assertTrue(self.check(False))
+        self.player.is_riichi = True
+        self.assertTrue(has_common_yaku(
+            self.player, self.bakaze, True, self.agari_tile))
+
+    def test_tanyao(self):
+        self.player.hand = self.hand({
+            Suit.MANZU: (4, 5), Suit.PINZU: (5, 5),
+            Suit.SOUZU: (3, 4, 5, 6, 7, 8)})
+        self.player.kabe.append(Huro(
+            Naki.CHII, Tile(Suit.PINZU.value, 2),
+            [Tile(Suit.PINZU.value, rank) for rank in (2, 3, 4)]))
+        self.player.menzenchin = False
+        self.assertTrue(has_common_yaku(
+            self.player, self.bakaze, True, Tile(Suit.MANZU.value, 6)))
+        self.assertTrue(check_yaku(
+            self.player, self.stack, self.bakaze, True,
+            [Tile(Suit.MANZU.value, 6)], Tile(Suit.MANZU.value, 6)))
+        # 78 MANZU waiting on 9 MANZU
+        self.player.hand[Tile(Suit.MANZU.value, 4).index] -= 1
+        self.player.hand[Tile(Suit.MANZU.value, 5).index] -= 1
+        self.player.hand[Tile(Suit.MANZU.value, 7).index] += 1
+        self.player.hand[Tile(Suit.MANZU.value, 8).index] += 1
+        self.assertFalse(has_common_yaku(
+            self.player, self.bakaze, True, Tile(Suit.MANZU.value, 9)))
+
+    def test_yakuhai(self):
+        haku = Tile(Suit.JIHAI.value, Jihai.HAKU.value)
+        self.player.hand[Tile(Suit.PINZU.value, 1).index] -= 2
+        self.player.hand[haku.index] += 2
+        # a pair of haku waiting on the penchan is no yakuhai
+        self.assertFalse(has_common_yaku(
+            self.player, self.bakaze, True, self.agari_tile))
+        # a shanpon on it is
+        self.assertTrue(has_common_yaku(self.player, self.bakaze, True, haku))
+        for rank in (7, 8, 9):
+            self.player.hand[Tile(Suit.SOUZU.value, rank).index] -= 1
+        self.player.kabe.append(Huro(
+            Naki.PON, Tile(Suit.JIHAI.value, Jihai.TON.value),
+            [Tile(Suit.JIHAI.value, Jihai.TON.value)] * 3))
+        self.player.menzenchin = False
+        # ton is the bakaze, then the jikaze
+        self.assertTrue(has_common_yaku(
+            self.player, self.bakaze, True, self.agari_tile))
+        self.assertFalse(has_common_yaku(
+            self.player, Jihai.NAN, True, self.agari_tile))
+        self.player.jikaze = Jihai.TON
+        self.assertTrue(has_common_yaku(
+            self.player, Jihai.NAN, True, self.agari_tile))
+
+    def test_falls_back_to_every_yaku(self):
+        # chiitoitsu, none of the common yaku
+        self.player.hand = Player('test', 1).hand
+        for index in (11, 19, 21, 29, 31, 39):
+            self.player.hand[index] += 2
+        self.player.hand[Jihai.PEI.value] += 1
+        tile = Tile(Suit.JIHAI.value, Jihai.PEI.value)
+        self.assertFalse(has_common_yaku(
+            self.player, self.bakaze, True, tile))
+        self.assertTrue(check_yaku(
+            self.player, self.stack, self.bakaze, True, [tile], tile))
+
+    def test_same_as_every_yaku(self):
+        rng = random.Random(0)
+        for _ in range(100):
+            # four random sets and a jantou, one tile short
+            player = Player('test', rng.randrange(4))
+            tiles = [rng.choice(TILE_INDICES)] * 2
+            for _ in range(4):
+                index = rng.choice(TILE_INDICES)
+                if index // 10 and index % 10 <= 7 and rng.random() < 0.6:
+                    tiles += [index, index + 1, index + 2]
+                else:
+                    tiles += [index] * 3
+            if max(map(tiles.count, tiles)) > 4:
+                continue
+            tiles.remove(rng.choice(tiles))
+            for index in tiles:
+                player.hand[index] += 1
+            machi = check_tenpai(player.hand, player.kabe)
+            for tile in machi:
+                is_ron = rng.random() < 0.8
+                full = YakuCalculator(player, self.stack, self.bakaze, is_ron,
+                                      machi, tile).has_at_least_one_yaku()
+                if has_common_yaku(player, self.bakaze, is_ron, tile):
+                    self.assertTrue(full)
+                self.assertEqual(check_yaku(
+                    player, self.stack, self.bakaze, is_ron, machi, tile),
+                    full)
 
 
 class TestFuriten(unittest.TestCase):
@@ -107,13 +232,11 @@ class TestFuriten(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.TON.value).index] += 2
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.NAN.value).index] += 2
         naki_tile_1 = Tile(Suit.SOUZU.value, 5)
-        naki_tile_1.owner = 0
+        naki_tile_1 = OwnedTile(naki_tile_1, 0)
         naki_tile_2 = Tile(Suit.PINZU.value, 5)
-        naki_tile_2.owner = 3
+        naki_tile_2 = OwnedTile(naki_tile_2, 3)
         naki_tile_3 = Tile(Suit.MANZU.value, 8)
-        naki_tile_3.owner = 0
-        naki_tile_4 = Tile(Suit.MANZU.value, 6)
-        naki_tile_4.owner = 0
+        naki_tile_3 = OwnedTile(naki_tile_3, 0)
         self.player.kabe.append(
             Huro(Naki.PON,
                  naki_tile_1,
@@ -126,12 +249,10 @@ class TestFuriten(unittest.TestCase):
             Huro(Naki.CHII,
                  naki_tile_3,
                  [Tile(Suit.MANZU.value, i) for i in range(7, 10)]))
-        self.player.kabe.append(
-            Huro(Naki.CHII,
-                 naki_tile_4,
-                 [Tile(Suit.MANZU.value, i) for i in range(6, 9)]))
 
     def test_furiten(self):
+        # draw a TON and discard it
+        self.player.hand[Tile(Suit.JIHAI.value, Jihai.TON.value).index] += 1
         self.player.add_kawa(Tile(Suit.JIHAI.value, Jihai.TON.value))
         self.assertEqual(check_furiten(self.player), True)
 
@@ -139,6 +260,8 @@ class TestFuriten(unittest.TestCase):
         self.assertEqual(check_furiten(self.player), False)
 
     def test_own_discard_furiten(self):
+        # draw a TON and discard it
+        self.player.hand[Tile(Suit.JIHAI.value, Jihai.TON.value).index] += 1
         self.player.add_kawa(Tile(Suit.JIHAI.value, Jihai.TON.value))
         self.assertEqual(check_own_discard_furiten(self.player), True)
 
@@ -185,9 +308,9 @@ class TestChakan(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.HATSU.value).index] += 2
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.HAKU.value).index] += 1
         naki_tile_1 = Tile(Suit.PINZU.value, 5)
-        naki_tile_1.owner = 0
+        naki_tile_1 = OwnedTile(naki_tile_1, 0)
         naki_tile_2 = Tile(Suit.MANZU.value, 7)
-        naki_tile_2.owner = 3
+        naki_tile_2 = OwnedTile(naki_tile_2, 3)
         self.player.kabe.append(
             Huro(Naki.PON,
                  naki_tile_1,
@@ -393,7 +516,7 @@ class TestTenpai(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 8).index] += 3
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.NAN.value).index] += 2
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.PON,
                  naki_tile,
@@ -408,11 +531,11 @@ class TestTenpai(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 1).index] += 1
         self.player.hand[Tile(Suit.MANZU.value, 3).index] += 1
         naki_tile_1 = Tile(Suit.SOUZU.value, 5)
-        naki_tile_1.owner = 0
+        naki_tile_1 = OwnedTile(naki_tile_1, 0)
         naki_tile_2 = Tile(Suit.PINZU.value, 5)
-        naki_tile_2.owner = 3
+        naki_tile_2 = OwnedTile(naki_tile_2, 3)
         naki_tile_3 = Tile(Suit.MANZU.value, 8)
-        naki_tile_3.owner = 0
+        naki_tile_3 = OwnedTile(naki_tile_3, 0)
         self.player.kabe.append(
             Huro(Naki.PON,
                  naki_tile_1,
@@ -432,13 +555,13 @@ class TestTenpai(unittest.TestCase):
     def test_tenpai_6(self):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.TON.value).index] += 1
         naki_tile_1 = Tile(Suit.JIHAI.value, Jihai.SHAA.value)
-        naki_tile_1.owner = 3
+        naki_tile_1 = OwnedTile(naki_tile_1, 3)
         naki_tile_2 = Tile(Suit.SOUZU.value, 5)
-        naki_tile_2.owner = 3
+        naki_tile_2 = OwnedTile(naki_tile_2, 3)
         naki_tile_3 = Tile(Suit.PINZU.value, 5)
-        naki_tile_3.owner = 2
+        naki_tile_3 = OwnedTile(naki_tile_3, 2)
         naki_tile_4 = Tile(Suit.MANZU.value, 9)
-        naki_tile_4.owner = 0
+        naki_tile_4 = OwnedTile(naki_tile_4, 0)
         self.player.kabe.append(
             Huro(Naki.PON,
                  naki_tile_1,
@@ -465,7 +588,7 @@ class TestTenpai(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 3).index] += 1
         self.player.hand[Tile(Suit.MANZU.value, 4).index] += 4
         naki_tile = Tile(Suit.JIHAI.value, Jihai.SHAA.value)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.PON,
                  naki_tile,
@@ -576,6 +699,111 @@ class TestTenpai(unittest.TestCase):
         self.assertEqual(check_tenpai(self.player.hand, self.player.kabe), [])
 
 
+class TestTenpaiCache(unittest.TestCase):
+
+    def setUp(self):
+        self.player = Player('test', 1)
+        for rank in range(1, 10):
+            self.player.hand[Tile(Suit.PINZU.value, rank).index] += 1
+        self.player.hand[Tile(Suit.MANZU.value, 3).index] += 2
+        self.player.hand[Tile(Suit.SOUZU.value, 5).index] += 2
+        tenpai_cache.clear()
+
+    def tearDown(self):
+        tenpai_cache.clear()
+
+    def test_hit(self):
+        machi = check_tenpai(self.player.hand, self.player.kabe)
+        self.assertEqual(tenpai_cache.cache_info().misses, 1)
+        self.assertEqual(
+            check_tenpai(self.player.hand, self.player.kabe), machi)
+        self.assertEqual(tenpai_cache.cache_info().hits, 1)
+
+    def test_key(self):
+        check_tenpai(self.player.hand, self.player.kabe)
+        # same tiles given as a dict
+        check_tenpai(dict(self.player.hand.items()), [])
+        self.assertEqual(tenpai_cache.cache_info().hits, 1)
+        # same hand with a huro is a different key
+        self.player.kabe.append(Huro(Naki.PON, Tile(0, 1), [Tile(0, 1)] * 3))
+        self.assertEqual(check_tenpai(self.player.hand, self.player.kabe), [])
+        self.assertEqual(tenpai_cache.cache_info().misses, 2)
+
+    def test_returns_copy(self):
+        machi = check_tenpai(self.player.hand, self.player.kabe)
+        machi.clear()
+        self.assertEqual(
+            len(check_tenpai(self.player.hand, self.player.kabe)), 2)
+
+
+class TestTenpaiDiscards(unittest.TestCase):
+
+    def setUp(self):
+        # 123456789p 33m 55s and a 1s drawn
+        self.player = Player('test', 1)
+        for rank in range(1, 10):
+            self.player.hand[Tile(Suit.PINZU.value, rank).index] += 1
+        self.player.hand[Tile(Suit.MANZU.value, 3).index] += 2
+        self.player.hand[Tile(Suit.SOUZU.value, 5).index] += 2
+        self.player.hand[Tile(Suit.SOUZU.value, 1).index] += 1
+
+    def test_discards(self):
+        self.assertEqual(
+            tenpai_discards(self.player.hand, self.player.kabe),
+            [(Tile(Suit.SOUZU.value, 1), [(Tile(Suit.MANZU.value, 3), 2),
+                                          (Tile(Suit.SOUZU.value, 5), 2)])])
+        visible = {Tile(Suit.MANZU.value, 3).index: 1}
+        self.assertEqual(
+            tenpai_discards(self.player.hand, self.player.kabe, visible)[0][1],
+            [(Tile(Suit.MANZU.value, 3), 1), (Tile(Suit.SOUZU.value, 5), 2)])
+
+    def test_kabe(self):
+        for rank in range(1, 4):
+            self.player.hand[Tile(Suit.PINZU.value, rank).index] -= 1
+        self.player.kabe.append(Huro(
+            Naki.CHII, Tile(Suit.PINZU.value, 1),
+            [Tile(Suit.PINZU.value, rank) for rank in range(1, 4)]))
+        self.assertEqual(
+            [discard for discard, _ in tenpai_discards(
+                self.player.hand, self.player.kabe)],
+            [Tile(Suit.SOUZU.value, 1)])
+        # a tile short
+        self.player.hand[Tile(Suit.SOUZU.value, 1).index] -= 1
+        self.assertEqual(
+            tenpai_discards(self.player.hand, self.player.kabe), [])
+
+    def test_chiitoitsu(self):
+        self.player.hand = Hand()
+        for index in TILE_INDICES[:6]:
+            self.player.hand[index] += 2
+        single_1, single_2 = TILE_INDICES[6], TILE_INDICES[7]
+        self.player.hand[single_1] += 1
+        self.player.hand[single_2] += 1
+        self.assertEqual(
+            tenpai_discards(self.player.hand, self.player.kabe),
+            [(Tile.from_index(single_1), [(Tile.from_index(single_2), 3)]),
+             (Tile.from_index(single_2), [(Tile.from_index(single_1), 3)])])
+
+    def test_same_as_check_tenpai(self):
+        rng = random.Random(0)
+        wall = [index for index in TILE_INDICES for _ in range(4)]
+        for _ in range(200):
+            suits = rng.sample(range(4), rng.choice([1, 2]))
+            pool = [index for index in wall if index // 10 in suits]
+            self.player.hand = Hand.from_counts(
+                Counter(rng.sample(pool, 14)))
+            expected = []
+            for index in self.player.hand.keys():
+                discarded = self.player.hand.copy()
+                discarded[index] -= 1
+                if machi := check_tenpai(discarded, []):
+                    expected.append((Tile.from_index(index), machi))
+            self.assertEqual(
+                [(discard, [tile for tile, _ in machi])
+                 for discard, machi in tenpai_discards(self.player.hand, [])],
+                expected)
+
+
 class TestRiichi(unittest.TestCase):
     def setUp(self):
         # tenpai: 3 MANZU 5 SOUZU
@@ -595,7 +823,7 @@ class TestRiichi(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 1).index] -= 1
         self.player.hand[Tile(Suit.SOUZU.value, 5).index] -= 2
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.PON,
                  naki_tile,
@@ -620,7 +848,7 @@ class TestRiichi(unittest.TestCase):
         self.player.is_riichi = True
 
         ankan_tile = Tile(Suit.MANZU.value, 3)
-        ankan_tile.owner = 1
+        ankan_tile = OwnedTile(ankan_tile, 1)
 
         pyinput.inputNum = MagicMock(side_effect=[1, 0])
         pyinput.inputChoice = MagicMock(return_value=5)
@@ -646,7 +874,7 @@ class TestRiichi(unittest.TestCase):
         self.player.is_riichi = True
 
         ankan_tile = Tile(Suit.SOUZU.value, 1)
-        ankan_tile.owner = 1
+        ankan_tile = OwnedTile(ankan_tile, 1)
 
         pyinput.inputNum = MagicMock(side_effect=[0])
 
@@ -6,7 +6,7 @@ import pyinputplus as pyinput
 
 from mahjong.kyoku import Kyoku, Turn
 from mahjong.player import Player
-from mahjong.components import Naki, Action, Suit, Tile, Jihai, Huro
+from mahjong.components import Naki, Action, Suit, Tile, Jihai, Huro, OwnedTile
 from mahjong.event_logger import KyokuLogger
 
 
@@ -31,7 +31,7 @@ class TestPon(unittest.TestCase):
 
         # change tile in hand to test pon
         pon_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        pon_tile.owner = self.players[0].seating_position
+        pon_tile = OwnedTile(pon_tile, self.players[0].seating_position)
         to_discard_tile = Tile(Suit.JIHAI.value, Jihai.HAKU.value)
 
         self.current_kyoku.players[0].hand = defaultdict(int)
@@ -85,6 +85,9 @@ class TestPon(unittest.TestCase):
             pon_in_kabe.naki_type, self.players[1].kabe[0].naki_type)
         self.assertEqual(
             pon_in_kabe.naki_tile, self.players[1].kabe[0].naki_tile)
+        self.assertEqual(
+            self.players[1].kabe[0].naki_tile.owner,
+            self.players[0].seating_position)
         # test remove_huro_tiles()
         self.assertEqual(self.players[1].hand[pon_tile.index], 0)
         self.assertEqual(pon_in_kabe.tiles, self.players[1].kabe[0].tiles)
@@ -94,7 +97,7 @@ class TestPon(unittest.TestCase):
 
         # change tile in hand to test pon
         pon_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        pon_tile.owner = self.players[0].seating_position
+        pon_tile = OwnedTile(pon_tile, self.players[0].seating_position)
 
         self.current_kyoku.players[0].hand = defaultdict(int)
         self.current_kyoku.players[0].hand[pon_tile.index] = 1
@@ -162,7 +165,7 @@ class TestChii(unittest.TestCase):
 
         # change tile in hand to test chii
         chii_tile = Tile(Suit.MANZU.value, 5)
-        chii_tile.owner = self.players[0].seating_position
+        chii_tile = OwnedTile(chii_tile, self.players[0].seating_position)
         to_discard_tile = Tile(Suit.PINZU.value, 9)
 
         self.current_kyoku.players[0].hand = defaultdict(int)
@@ -244,7 +247,7 @@ class TestKan(unittest.TestCase):
 
         # change tile in hand to test pon
         kan_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        kan_tile.owner = self.players[0].seating_position
+        kan_tile = OwnedTile(kan_tile, self.players[0].seating_position)
         to_discard_tile = Tile(Suit.JIHAI.value, Jihai.HAKU.value)
 
         self.current_kyoku.players[0].hand = defaultdict(int)
@@ -307,7 +310,7 @@ class TestKan(unittest.TestCase):
 
         # change tile in hand to test chakan after pon
         pon_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        pon_tile.owner = self.players[0].seating_position
+        pon_tile = OwnedTile(pon_tile, self.players[0].seating_position)
         to_discard_tile = Tile(Suit.JIHAI.value, Jihai.HAKU.value)
 
         pon_in_kabe = Huro(
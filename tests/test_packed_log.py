@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+
+from mahjong.components import (
+    Action, Naki, Tile, Suit, Huro, OwnedTile, Stack, Jihai
+)
+from mahjong.event_logger import KyokuLogger
+from mahjong.packed_log import (
+    RECORD, FILE_HEADER, KYOKU_HEADER, VERSION, pack_action, unpack_action,
+    pack_kyoku, append_kyokus, iter_kyokus, PackedLogReader
+)
+
+
+def make_logger(n_discards: int = 3) -> KyokuLogger:
+    logger = KyokuLogger()
+    tile = Tile(Suit.SOUZU.value, 5)
+    for i in range(n_discards):
+        logger.log(p_pos=i % 4, action=Action.DRAW,
+                   action_tile=Tile(Suit.MANZU.value, i + 1))
+        logger.log(p_pos=i % 4, action=Action.DISCARD,
+                   action_tile=Tile(Suit.MANZU.value, i + 1))
+    logger.log(p_pos=1, action=Action.NAKI, action_tile=tile,
+               naki_type=Naki.CHAKAN,
+               huro=Huro(Naki.CHAKAN, OwnedTile(tile, 3), [tile] * 4))
+    logger.log(p_pos=2, action=Action.RIICHI)
+    logger.log(p_pos=0, action=Action.RYUUKYOKU)
+    return logger
+
+
+class TestPackedLog(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        os.remove(self.path)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_record_roundtrip(self):
+        for log in make_logger().logs:
+            packed = pack_action(log)
+            self.assertEqual(len(packed), RECORD.size)
+            unpacked = unpack_action(RECORD.unpack(packed))
+            self.assertEqual(str(unpacked), str(log))
+
+    def test_huro_roundtrip(self):
+        log = make_logger().logs[-3]
+        unpacked = unpack_action(RECORD.unpack(pack_action(log)))
+        self.assertEqual(unpacked.huro.naki_type, Naki.CHAKAN)
+        self.assertEqual(unpacked.huro.naki_tile.owner, 3)
+        self.assertEqual(unpacked.huro.tiles, log.huro.tiles)
+
+    def test_pack_kyoku(self):
+        logger = make_logger()
+        packed = pack_kyoku(logger)
+        self.assertEqual(len(packed),
+                         KYOKU_HEADER.size + RECORD.size * len(logger.logs))
+
+    def test_append_and_read(self):
+        loggers = [make_logger(1), make_logger(2)]
+        self.assertEqual(append_kyokus(self.path, loggers), 2)
+        append_kyokus(self.path, [make_logger(3)])
+        loggers.append(make_logger(3))
+
+        with PackedLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 3)
+            for kyoku, logger in zip(reader, loggers):
+                self.assertEqual(len(kyoku), len(logger.logs))
+                self.assertEqual(str(kyoku.to_logger()), str(logger))
+            self.assertEqual(reader[1][-1].action, Action.RYUUKYOKU)
+            self.assertEqual(reader[0].raw(0)[:3], (0, Action.DRAW.value, 11))
+            with self.assertRaises(IndexError):
+                reader[0].raw(len(reader[0]))
+
+    def test_start_state(self):
+        logger = make_logger()
+        wall_order = Stack(seed=0).wall_order
+        logger.log_start(wall_order, Jihai.NAN, 2, 1, 3,
+                         [25_000, 24_000, 26_000, 25_000])
+        append_kyokus(self.path, [logger, make_logger()])
+        with PackedLogReader(self.path) as reader:
+            kyoku = reader[0]
+            self.assertEqual(kyoku.wall_order, wall_order)
+            self.assertEqual(kyoku.bakaze, Jihai.NAN)
+            self.assertEqual((kyoku.oya, kyoku.honba, kyoku.kyotaku),
+                             (2, 1, 3))
+            self.assertEqual(kyoku.points, [25_000, 24_000, 26_000, 25_000])
+            self.assertEqual(kyoku.to_logger().wall_order, wall_order)
+            self.assertIsNone(reader[1].wall_order)
+            self.assertIsNone(reader[1].oya)
+
+    def test_end_state(self):
+        logger = make_logger()
+        logger.log_end({1: (3, 40), 3: (13, 30)},
+                       [-8_000, 3_900, -1_000, 5_100])
+        append_kyokus(self.path, [logger, make_logger()])
+        with PackedLogReader(self.path) as reader:
+            kyoku = reader[0]
+            self.assertEqual(kyoku.han_fu, {1: (3, 40), 3: (13, 30)})
+            self.assertEqual(kyoku.deltas, [-8_000, 3_900, -1_000, 5_100])
+            self.assertEqual(kyoku.to_logger().han_fu, logger.han_fu)
+            self.assertEqual(reader[1].han_fu, {})
+            self.assertIsNone(reader[1].deltas)
+
+    def test_lazy_kyokus(self):
+        append_kyokus(self.path, [make_logger(1), make_logger(2)])
+        with PackedLogReader(self.path) as reader:
+            kyoku = reader[1]
+            # built when asked for, over the same bytes
+            self.assertIsNot(reader[1], kyoku)
+            self.assertEqual(reader[1].raw(0), kyoku.raw(0))
+        # closing released the views handed out
+        with self.assertRaises(ValueError):
+            kyoku.raw(0)
+
+    def test_empty_file(self):
+        open(self.path, 'wb').close()
+        with PackedLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 0)
+
+    def test_bad_file(self):
+        data = FILE_HEADER.pack(b'XXXX', 1, RECORD.size)
+        with self.assertRaises(ValueError):
+            list(iter_kyokus(data))
+
+    def test_truncated(self):
+        data = pack_kyoku(make_logger())
+        header = FILE_HEADER.pack(b'MJ4L', VERSION, RECORD.size)
+        with self.assertRaises(ValueError):
+            list(iter_kyokus(header + data[:-1]))
@@ -0,0 +1,50 @@
+import unittest
+
+from mahjong.payments import (
+    PAYMENT_TABLE, HANS, FUS, payment_deltas
+)
+
+
+class TestPaymentDeltas(unittest.TestCase):
+
+    def test_oya_tsumo(self):
+        self.assertEqual(payment_deltas(1, 30, 0, 0),
+                         (1_500, -500, -500, -500))
+
+    def test_ko_tsumo(self):
+        self.assertEqual(payment_deltas(3, 30, 1, 0),
+                         (-2_000, 4_000, -1_000, -1_000))
+
+    def test_ron(self):
+        self.assertEqual(payment_deltas(3, 70, 0, 0, 1),
+                         (12_000, -12_000, 0, 0))
+        self.assertEqual(payment_deltas(3, 30, 1, 0, 3),
+                         (0, 3_900, 0, -3_900))
+
+    def test_yakuman(self):
+        self.assertEqual(payment_deltas(13, 20, 2, 0, 0),
+                         (-32_000, 0, 32_000, 0))
+        self.assertEqual(payment_deltas(26, 20, 0, 0, 3),
+                         (96_000, 0, 0, -96_000))
+
+    def test_honba_and_kyotaku(self):
+        self.assertEqual(payment_deltas(4, 25, 1, 0, None, 1),
+                         (-3_300, 6_700, -1_700, -1_700))
+        self.assertEqual(payment_deltas(3, 30, 1, 0, 3, 2, 1),
+                         (0, 5_500, 0, -4_500))
+
+    def test_table_is_shared(self):
+        self.assertIs(payment_deltas(2, 40, 3, 1, 2),
+                      PAYMENT_TABLE[(2, 40, 3, 1, 2)])
+
+    def test_outside_table(self):
+        self.assertNotIn((1, 130, 0, 0, 1), PAYMENT_TABLE)
+        self.assertEqual(payment_deltas(1, 130, 0, 0, 1),
+                         (6_300, -6_300, 0, 0))
+
+    def test_zero_sum(self):
+        for han in HANS:
+            for fu in FUS:
+                for loser in (None, 2):
+                    deltas = payment_deltas(han, fu, 1, 0, loser, 3, 2)
+                    self.assertEqual(sum(deltas), 2_000)
@@ -1,7 +1,7 @@
 import unittest
 
 from mahjong.player import Player
-from mahjong.components import Stack, Tile, Suit, Naki, Huro, Jihai
+from mahjong.components import Stack, Tile, Suit, Naki, Huro, Jihai, OwnedTile
 
 
 class TestPlayer(unittest.TestCase):
@@ -102,7 +102,7 @@ class TestPlayer(unittest.TestCase):
 
     def test_action_with_naki(self):
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = self.player.seating_position
+        naki_tile = OwnedTile(naki_tile, self.player.seating_position)
         pon_5_souzu = Huro(Naki.PON,
                            naki_tile,
                            [Tile(Suit.SOUZU.value, 5) for i in range(3)])
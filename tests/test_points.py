@@ -66,3 +66,17 @@ class TestPoints(unittest.TestCase):
         self.assertEqual(self.player_2.points, 18_000)
         self.assertEqual(self.player_3.points, 19_000)
         self.assertEqual(self.player_4.points, 19_000)
+
+    def test_double_ron(self):
+        self.kyoku.winners = [self.player_4, self.player_2]
+        self.kyoku.honba = 1
+        self.kyoku.kyotaku = 1
+        self.kyoku.apply_points(
+            False,
+            {self.player_2: (3, 30), self.player_4: (1, 30)},
+            self.player_1)
+        # player 2 is closest to the discarder, so takes honba and kyotaku
+        self.assertEqual(self.player_1.points, 25_000 - 3_900 - 1_000 - 300)
+        self.assertEqual(self.player_2.points, 25_000 + 3_900 + 300 + 1_000)
+        self.assertEqual(self.player_3.points, 25_000)
+        self.assertEqual(self.player_4.points, 25_000 + 1_000)
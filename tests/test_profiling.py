@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+import unittest
+
+from mahjong import kyoku, naki_and_actions, player
+from mahjong.kyoku import Turn
+from mahjong.profiling import Profiler
+from mahjong.self_play import play_game
+
+
+class TestProfiler(unittest.TestCase):
+
+    def test_profile_game(self):
+        record = play_game(3, profile=True)
+        timers, counters = record.profile['timers'], record.profile['counters']
+        self.assertEqual(timers['Kyoku.start']['calls'],
+                         len(record.kyoku_logs))
+        self.assertEqual(
+            timers['Turn.draw_flow']['calls'],
+            counters['action.DRAW'] + counters.get('action.DRAW_RINSHAN', 0))
+        self.assertGreater(timers['naki_and_actions.check_tenpai']['calls'],
+                           0)
+        self.assertGreaterEqual(timers['Kyoku.start']['total_s'],
+                                timers['Turn.discard_flow']['total_s'])
+        # profiling doesn't change how the game plays out
+        unprofiled = play_game(3)
+        self.assertIsNone(unprofiled.profile)
+        self.assertEqual(record.points, unprofiled.points)
+        self.assertEqual(list(map(str, record.kyoku_logs)),
+                         list(map(str, unprofiled.kyoku_logs)))
+
+    def test_stop_restores(self):
+        originals = (Turn.draw_flow, naki_and_actions.check_tenpai,
+                     kyoku.check_tenpai, player.check_tenpai)
+        with Profiler():
+            self.assertIsNot(Turn.draw_flow, originals[0])
+            self.assertIsNot(kyoku.check_tenpai, originals[2])
+            self.assertIsNot(player.check_tenpai, originals[3])
+        self.assertEqual((Turn.draw_flow, naki_and_actions.check_tenpai,
+                          kyoku.check_tenpai, player.check_tenpai),
+                         originals)
+
+    def test_one_at_a_time(self):
+        with Profiler():
+            with self.assertRaises(RuntimeError):
+                Profiler().start()
+        Profiler().start().stop()
+
+    def test_recursion(self):
+        profiler = Profiler()
+
+        def countdown(n):
+            return n if n == 0 else timed(n - 1)
+        timed = profiler.timed('countdown', countdown)
+        timed(4)
+        stats = profiler.as_dict()['timers']['countdown']
+        self.assertEqual(stats['calls'], 5)
+        # nested calls count once in the total, self times add up to it
+        self.assertAlmostEqual(stats['self_s'], stats['total_s'], places=6)
+
+    def test_merge_and_export(self):
+        profile = play_game(1, profile=True).profile
+        profiler = Profiler()
+        profiler.merge(profile)
+        profiler.merge(profile)
+        self.assertEqual(profiler.counters['action.DISCARD'],
+                         2 * profile['counters']['action.DISCARD'])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'profile.json')
+            profiler.export(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f), profiler.as_dict())
+        self.assertIn('Turn.draw_flow', profiler.report())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from mahjong.game import Game
+from mahjong.renderer import Renderer, CliRenderer, renderer_switch
+
+
+class RecordingRenderer(Renderer):
+
+    def __init__(self):
+        self.events = []
+
+    def game_start(self, game):
+        self.events.append('game_start')
+
+    def kyoku_start(self, game):
+        self.events.append('kyoku_start')
+
+    def deal(self, kyoku):
+        self.events.append('deal')
+
+    def kyoku_end(self, kyoku, state, turn):
+        self.events.append('kyoku_end')
+
+    def game_end(self, game):
+        self.events.append('game_end')
+
+    def ai_discard(self, player, hand_tiles, discard_tile):
+        self.events.append('ai_discard')
+
+
+class TestRenderer(unittest.TestCase):
+
+    def test_renderer_switch(self):
+        self.assertEqual(type(renderer_switch(True)), Renderer)
+        self.assertIsInstance(renderer_switch(False), CliRenderer)
+
+    def test_headless_game(self):
+        names = ['Kelly', 'Leo', 'Ball', 'Hao']
+        stdout = io.StringIO()
+        with redirect_stdout(stdout), \
+                patch('builtins.input', side_effect=AssertionError):
+            game = Game(names, 'config_headless.json')
+            game.start_game()
+        self.assertEqual(type(game.renderer), Renderer)
+        self.assertEqual(stdout.getvalue(), '')
+
+    def test_observer(self):
+        names = ['Kelly', 'Leo', 'Ball', 'Hao']
+        renderer = RecordingRenderer()
+        game = Game(names, 'config_headless.json', renderer=renderer)
+        game.start_game()
+        self.assertEqual(renderer.events[0], 'game_start')
+        self.assertEqual(renderer.events[-1], 'game_end')
+        self.assertIn('ai_discard', renderer.events)
+        self.assertEqual(renderer.events.count('kyoku_start'),
+                         renderer.events.count('kyoku_end'))
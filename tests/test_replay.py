@@ -0,0 +1,92 @@
+import random
+import unittest
+
+from mahjong.components import Action, Tile, Suit
+from mahjong.event_logger import ActionLog, KyokuLogger
+from mahjong.game import Game
+from mahjong.renderer import Renderer
+from mahjong.replay import KyokuReplay, ReplayError
+
+
+def kyoku_state(kyoku):
+    stack = kyoku.tile_stack
+    players = [(p.hand.signature, tuple(p.kawa),
+                tuple((h.naki_type, tuple(h.tiles)) for h in p.kabe),
+                p.points, p.is_riichi, p.menzenchin)
+               for p in kyoku.players]
+    return (players, tuple(stack.playing_wall), tuple(stack.rinshanpai),
+            tuple(stack.dora_indicators))
+
+
+class EndStates(Renderer):
+    """Keeps the log and the final state of every kyoku, before points
+    are paid.
+    """
+
+    def __init__(self):
+        self.kyokus = []
+
+    def kyoku_end(self, kyoku, state, turn):
+        self.kyokus.append((kyoku.logger, kyoku_state(kyoku)))
+
+
+class TestKyokuReplay(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # seeds with ankan, chakan and daminkan among their kyokus
+        cls.kyokus = []
+        for seed in (21, 22):
+            random.seed(seed)
+            renderer = EndStates()
+            Game(['a', 'b', 'c', 'd'], 'config_headless.json',
+                 renderer=renderer, seed=seed).start_game()
+            cls.kyokus += renderer.kyokus
+
+    def test_final_state(self):
+        for logger, state in self.kyokus:
+            replay = KyokuReplay(logger)
+            kyoku = replay.seek(replay.n_actions)
+            self.assertEqual(kyoku_state(kyoku), state)
+            self.assertEqual(str(kyoku.logger), str(logger))
+
+    def test_seek(self):
+        logger = max((logger for logger, _ in self.kyokus),
+                     key=lambda logger: len(logger.logs))
+        replay = KyokuReplay(logger, checkpoint_every=8)
+        expected = []
+        for position in range(replay.n_actions + 1):
+            expected.append(replay.kyoku.snapshot())
+            if position < replay.n_actions:
+                replay.step()
+
+        positions = list(range(replay.n_actions + 1))
+        random.Random(0).shuffle(positions)
+        for position in positions:
+            self.assertEqual(replay.seek(position).snapshot(),
+                             expected[position])
+
+        without_checkpoints = KyokuReplay(logger, checkpoint_every=None)
+        for position in (20, 3, replay.n_actions):
+            self.assertEqual(without_checkpoints.seek(position).snapshot(),
+                             expected[position])
+        with self.assertRaises(IndexError):
+            replay.seek(replay.n_actions + 1)
+
+    def test_no_wall(self):
+        with self.assertRaises(ReplayError):
+            KyokuReplay(KyokuLogger())
+
+    def test_wrong_draw(self):
+        logger, _ = self.kyokus[0]
+        replay = KyokuReplay(logger)
+        first_draw = replay.kyoku.tile_stack.playing_wall[0]
+        other = Tile(Suit.MANZU.value, 1)
+        if other == first_draw:
+            other = Tile(Suit.MANZU.value, 2)
+        with self.assertRaises(ReplayError):
+            replay.apply(ActionLog(logger.oya, Action.DRAW, other))
+
+
+if __name__ == '__main__':
+    unittest.main()
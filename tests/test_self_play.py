@@ -0,0 +1,39 @@
+import random
+import unittest
+
+from mahjong.self_play import SelfPlayRunner, play_game, play_games
+
+
+class TestSelfPlay(unittest.TestCase):
+
+    def test_play_game(self):
+        record = play_game(7)
+        self.assertEqual(record.seed, 7)
+        self.assertGreater(len(record.kyoku_logs), 0)
+        self.assertEqual(len(record.points), 4)
+        # kyotaku left on the table at the end are not paid out
+        self.assertLessEqual(sum(record.points), 100_000)
+
+    def test_reproducible(self):
+        record_1, record_2 = play_games([3, 3])
+        self.assertEqual(record_1.points, record_2.points)
+        self.assertEqual(list(map(str, record_1.kyoku_logs)),
+                         list(map(str, record_2.kyoku_logs)))
+
+    def test_global_random_untouched(self):
+        random.seed(1)
+        state = random.getstate()
+        record_1 = play_game(3)
+        self.assertEqual(random.getstate(), state)
+        random.random()
+        record_2 = play_game(3)
+        self.assertEqual(record_1.points, record_2.points)
+
+    def test_runner(self):
+        runner = SelfPlayRunner(n_workers=2, batch_size=2, seed=0)
+        batches = list(runner.run(5))
+        self.assertEqual(sorted(map(len, batches)), [1, 2, 2])
+        self.assertEqual(runner.games, 5)
+        self.assertEqual(runner.kyokus, sum(
+            len(record.kyoku_logs) for batch in batches for record in batch))
+        self.assertGreater(runner.games_per_sec, 0)
@@ -0,0 +1,99 @@
+import unittest
+
+from mahjong.components import Tile, Suit, Jihai, Naki, Huro, Hand
+from mahjong.shanten import (
+    calculate_shanten, calculate_ukeire, chiitoitsu_shanten, kokushi_shanten
+)
+
+
+def make_hand(manzu='', souzu='', pinzu='', jihai=()):
+    hand = Hand()
+    for suit, ranks in ((Suit.MANZU, manzu), (Suit.SOUZU, souzu),
+                        (Suit.PINZU, pinzu)):
+        for rank in ranks:
+            hand[Tile(suit.value, int(rank)).index] += 1
+    for honor in jihai:
+        hand[Tile(Suit.JIHAI.value, honor.value).index] += 1
+    return hand
+
+
+class TestShanten(unittest.TestCase):
+
+    def test_agari(self):
+        hand = make_hand('123456789', '11', '789')
+        self.assertEqual(calculate_shanten(hand), -1)
+
+    def test_tenpai(self):
+        hand = make_hand('123456789', '11', '78')
+        self.assertEqual(calculate_shanten(hand), 0)
+
+    def test_iishanten(self):
+        hand = make_hand('12345689', '11', '78', [Jihai.CHUN])
+        self.assertEqual(calculate_shanten(hand), 1)
+
+    def test_too_many_taatsu(self):
+        # 5 sets or taatsu at most count towards the hand
+        hand = make_hand('1357', '1357', '1357', [Jihai.TON])
+        self.assertEqual(calculate_shanten(hand), 4)
+
+    def test_chiitoitsu(self):
+        hand = make_hand('1133', '5577', '1199', [Jihai.TON])
+        self.assertEqual(chiitoitsu_shanten(hand), 0)
+        self.assertEqual(calculate_shanten(hand), 0)
+
+    def test_chiitoitsu_four_copies(self):
+        # four of a kind is not two pairs
+        hand = make_hand('11113355', '77', '99', [Jihai.TON])
+        self.assertEqual(chiitoitsu_shanten(hand), 2)
+
+    def test_kokushi(self):
+        hand = make_hand('19', '19', '19', [
+            Jihai.TON, Jihai.NAN, Jihai.SHAA, Jihai.PEI,
+            Jihai.HAKU, Jihai.HATSU, Jihai.HATSU])
+        self.assertEqual(kokushi_shanten(hand), 0)
+        self.assertEqual(calculate_shanten(hand), 0)
+
+    def test_huro(self):
+        kabe = [Huro(Naki.PON, Tile(Suit.JIHAI.value, Jihai.CHUN.value),
+                     [Tile(Suit.JIHAI.value, Jihai.CHUN.value)] * 3)]
+        hand = make_hand('123456', '11', '79')
+        self.assertEqual(calculate_shanten(hand, kabe), 0)
+        # chiitoitsu doesn't count once the hand is opened
+        hand = make_hand('1133', '5577', '9')
+        self.assertEqual(calculate_shanten(hand, kabe), 2)
+
+
+class TestUkeire(unittest.TestCase):
+
+    def test_ryanmen(self):
+        hand = make_hand('123456789', '11', '78')
+        ukeire = calculate_ukeire(hand)
+        self.assertEqual(ukeire, [
+            (Tile(Suit.PINZU.value, 6), 4),
+            (Tile(Suit.PINZU.value, 9), 4),
+        ])
+
+    def test_visible(self):
+        hand = make_hand('123456789', '11', '78')
+        visible = {Tile(Suit.PINZU.value, 6).index: 3,
+                   Tile(Suit.PINZU.value, 9).index: 5}
+        ukeire = calculate_ukeire(hand, visible=visible)
+        self.assertEqual(ukeire, [
+            (Tile(Suit.PINZU.value, 6), 1),
+            (Tile(Suit.PINZU.value, 9), 0),
+        ])
+
+    def test_held_copies(self):
+        # 1112345678999m, junsei chuuren poutou
+        hand = make_hand('1112345678999')
+        ukeire = calculate_ukeire(hand)
+        self.assertEqual([tile.rank for tile, _ in ukeire], list(range(1, 10)))
+        self.assertEqual(ukeire[0][1], 1)
+        self.assertEqual(ukeire[1][1], 3)
+
+    def test_iishanten(self):
+        hand = make_hand('12345689', '11', '78', [Jihai.CHUN])
+        tiles = [tile for tile, _ in calculate_ukeire(hand)]
+        self.assertIn(Tile(Suit.MANZU.value, 7), tiles)
+        self.assertIn(Tile(Suit.PINZU.value, 6), tiles)
+        self.assertNotIn(Tile(Suit.JIHAI.value, Jihai.CHUN.value), tiles)
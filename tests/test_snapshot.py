@@ -0,0 +1,76 @@
+import random
+import unittest
+
+from mahjong.components import Huro, Naki, Tile, Suit
+from mahjong.kyoku import Kyoku, Turn
+from mahjong.player import Player
+from mahjong.renderer import Renderer
+
+
+def play_until(kyoku: Kyoku, turn: Turn, n_turns: int, state=None):
+    """Play n_turns discard flows, or until the kyoku ends."""
+    if state is None:
+        state = turn.draw_flow(kyoku.oya_player)
+    for _ in range(n_turns):
+        if state[0] != 0:
+            break
+        state = turn.discard_flow(state[1], state[2])
+    return state
+
+
+class TestKyokuSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+        renderer = Renderer()
+        self.players = [Player(f'player {i}', i, 'dummy', renderer)
+                        for i in range(4)]
+        self.kyoku = Kyoku(self.players, renderer=renderer, seed=3)
+        self.kyoku.deal()
+        self.turn = Turn(self.players, self.kyoku.tile_stack,
+                         self.kyoku.bakaze, self.kyoku.logger)
+        self.state = play_until(self.kyoku, self.turn, 10)
+
+    def test_restore(self):
+        snapshot = self.kyoku.snapshot(self.turn)
+        hand = self.players[1].hand.copy()
+        playing_wall = list(self.kyoku.tile_stack.playing_wall)
+        n_logs = len(self.kyoku.logger.logs)
+
+        play_until(self.kyoku, self.turn, 100, self.state)
+        self.assertNotEqual(self.kyoku.snapshot(self.turn), snapshot)
+
+        self.kyoku.restore(snapshot, self.turn)
+        self.assertEqual(self.kyoku.snapshot(self.turn), snapshot)
+        self.assertEqual(self.players[1].hand, hand)
+        self.assertEqual(self.kyoku.tile_stack.playing_wall, playing_wall)
+        self.assertEqual(len(self.kyoku.logger.logs), n_logs)
+
+    def test_replay_from_snapshot(self):
+        snapshot = self.kyoku.snapshot(self.turn)
+        ends = []
+        for _ in range(2):
+            self.kyoku.restore(snapshot, self.turn)
+            random.seed(7)
+            end = play_until(self.kyoku, self.turn, 100, self.state)
+            ends.append((end[0], str(self.kyoku.logger),
+                         self.kyoku.snapshot(self.turn).players))
+        self.assertEqual(ends[0], ends[1])
+
+    def test_huro_is_copied(self):
+        pon = Huro(Naki.PON, Tile(Suit.SOUZU.value, 5),
+                   [Tile(Suit.SOUZU.value, 5)] * 3)
+        self.players[2].kabe.append(pon)
+        snapshot = self.kyoku.snapshot()
+        pon.add_kan(Tile(Suit.SOUZU.value, 5))
+
+        self.kyoku.restore(snapshot)
+        huro = self.players[2].kabe[-1]
+        self.assertIsNot(huro, pon)
+        self.assertEqual(huro.naki_type, Naki.PON)
+        self.assertEqual(len(huro.tiles), 3)
+
+    def test_restore_turn_without_turn(self):
+        snapshot = self.kyoku.snapshot()
+        with self.assertRaises(ValueError):
+            self.kyoku.restore(snapshot, self.turn)
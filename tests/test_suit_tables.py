@@ -0,0 +1,74 @@
+import unittest
+
+from mahjong.components import Tile, Suit, Jihai
+from mahjong.suit_tables import (
+    JIHAI_TABLE, NUMBER_TABLE, counts_to_key, key_to_counts, hand_to_keys,
+    is_agari_keys, machi_from_keys
+)
+
+
+class TestSuitKey(unittest.TestCase):
+
+    def test_counts_to_key(self):
+        counts = [3, 1, 1, 1, 0, 0, 0, 2, 4]
+        key = counts_to_key(counts)
+        self.assertEqual(key, 0o420001113)
+        self.assertEqual(key_to_counts(key, 9), counts)
+
+    def test_hand_to_keys(self):
+        hand = {
+            Tile(Suit.MANZU.value, 1).index: 2,
+            Tile(Suit.PINZU.value, 9).index: 1,
+            Tile(Suit.JIHAI.value, Jihai.CHUN.value).index: 3,
+            Tile(Suit.SOUZU.value, 4).index: 0,
+        }
+        self.assertEqual(hand_to_keys(hand), [0o300, 0o2, 0, 0o100000000])
+
+
+class TestSuitTable(unittest.TestCase):
+
+    def test_status(self):
+        self.assertEqual(NUMBER_TABLE.status(0), 0)
+        self.assertEqual(NUMBER_TABLE.status(counts_to_key([1, 1, 1])), 0)
+        self.assertEqual(
+            NUMBER_TABLE.status(counts_to_key([3, 1, 1, 1, 2])), 1)
+        self.assertEqual(NUMBER_TABLE.status(counts_to_key([1, 1])), -1)
+        self.assertEqual(JIHAI_TABLE.status(counts_to_key([1, 1, 1])), -1)
+        self.assertEqual(JIHAI_TABLE.status(counts_to_key([3, 0, 2])), 1)
+
+    def test_waits(self):
+        # 1112345678999: junsei chuuren poutou, waits on every rank
+        key = counts_to_key([3, 1, 1, 1, 1, 1, 1, 1, 3])
+        self.assertEqual(NUMBER_TABLE.waits(key, True), 0b1111111110)
+        # 23: ryanmen waits on 1 and 4
+        key = counts_to_key([0, 1, 1])
+        self.assertEqual(NUMBER_TABLE.waits(key, False), 0b10010)
+        self.assertEqual(NUMBER_TABLE.waits(key, True), 0)
+
+
+class TestAgari(unittest.TestCase):
+
+    def test_is_agari_keys(self):
+        keys = [counts_to_key([0, 0, 0, 2]),
+                counts_to_key([1, 1, 1, 3]),
+                counts_to_key([0, 0, 0, 0, 1, 1, 1]),
+                counts_to_key([0, 0, 0, 0, 0, 0, 1, 1, 1])]
+        self.assertEqual(is_agari_keys(keys), True)
+        keys[0] = counts_to_key([0, 0, 0, 2, 2])
+        self.assertEqual(is_agari_keys(keys), False)
+
+    def test_machi_from_keys(self):
+        # 123m 456s 789p 11m 45s, waits on 3s and 6s
+        keys = [0,
+                counts_to_key([3, 1, 1]),
+                counts_to_key([0, 0, 0, 2, 2, 1]),
+                counts_to_key([0, 0, 0, 0, 0, 0, 1, 1, 1])]
+        self.assertEqual(machi_from_keys(keys), {23, 26})
+
+    def test_machi_from_keys_shanpon(self):
+        keys = [counts_to_key([0, 0, 0, 2, 2]), 0, 0, 0]
+        self.assertEqual(machi_from_keys(keys), {4, 5})
+
+    def test_no_machi(self):
+        keys = [counts_to_key([1, 0, 1]), counts_to_key([1, 0, 1]), 0, 0]
+        self.assertEqual(machi_from_keys(keys), set())
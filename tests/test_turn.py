@@ -3,7 +3,8 @@ from collections import defaultdict
 from unittest.mock import Mock, MagicMock, PropertyMock
 
 from mahjong.player import Player
-from mahjong.components import Stack, Tile, Action, Suit, Jihai, Naki, Huro
+from mahjong.components import (
+    Stack, Tile, Action, Suit, Jihai, Naki, Huro, OwnedTile)
 from mahjong.kyoku import Turn
 from mahjong.event_logger import KyokuLogger
 
@@ -43,7 +44,7 @@ class TestTurnDrawFlow(unittest.TestCase):
 
     def test_ankan(self):
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = self.player_1.seating_position
+        naki_tile = OwnedTile(naki_tile, self.player_1.seating_position)
         kan = Huro(Naki.ANKAN,
                    naki_tile,
                    [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -67,7 +68,7 @@ class TestTurnDrawFlow(unittest.TestCase):
     def test_chakan(self):
         # change type from PON to KAN, what's tmp_huro in this case?
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = self.player_1.seating_position
+        naki_tile = OwnedTile(naki_tile, self.player_1.seating_position)
         kan = Huro(Naki.ANKAN,
                    naki_tile,
                    [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -89,7 +90,7 @@ class TestTurnDrawFlow(unittest.TestCase):
 
     def test_chakan_chankan(self):
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = self.player_1.seating_position
+        naki_tile = OwnedTile(naki_tile, self.player_1.seating_position)
         kan = Huro(Naki.ANKAN,
                    naki_tile,
                    [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -108,9 +109,9 @@ class TestTurnDrawFlow(unittest.TestCase):
 
     def test_ankan_twice(self):
         naki_tile_1 = Tile(Suit.SOUZU.value, 5)
-        naki_tile_1.owner = self.player_1.seating_position
+        naki_tile_1 = OwnedTile(naki_tile_1, self.player_1.seating_position)
         naki_tile_2 = Tile(Suit.SOUZU.value, 6)
-        naki_tile_2.owner = self.player_1.seating_position
+        naki_tile_2 = OwnedTile(naki_tile_2, self.player_1.seating_position)
         kan_1 = Huro(Naki.ANKAN,
                      naki_tile_1,
                      [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -145,7 +146,7 @@ class TestTurnDrawFlow(unittest.TestCase):
         for _ in range(3):
             self.tile_stack.add_dora_indicator()
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = self.player_1.seating_position
+        naki_tile = OwnedTile(naki_tile, self.player_1.seating_position)
 
         kan = Huro(Naki.ANKAN,
                    naki_tile,
@@ -169,13 +170,13 @@ class TestTurnDrawFlow(unittest.TestCase):
         for _ in range(3):
             self.tile_stack.add_dora_indicator()
         naki_tile_1 = Tile(Suit.SOUZU.value, 5)
-        naki_tile_1.owner = self.player_1.seating_position
+        naki_tile_1 = OwnedTile(naki_tile_1, self.player_1.seating_position)
         naki_tile_2 = Tile(Suit.SOUZU.value, 6)
-        naki_tile_2.owner = self.player_1.seating_position
+        naki_tile_2 = OwnedTile(naki_tile_2, self.player_1.seating_position)
         naki_tile_3 = Tile(Suit.SOUZU.value, 7)
-        naki_tile_3.owner = self.player_1.seating_position
+        naki_tile_3 = OwnedTile(naki_tile_3, self.player_1.seating_position)
         naki_tile_4 = Tile(Suit.SOUZU.value, 8)
-        naki_tile_4.owner = self.player_1.seating_position
+        naki_tile_4 = OwnedTile(naki_tile_4, self.player_1.seating_position)
         kan_1 = Huro(Naki.ANKAN,
                      naki_tile_1,
                      [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -211,7 +212,7 @@ class TestTurnDrawFlow(unittest.TestCase):
         for _ in range(3):
             self.tile_stack.add_dora_indicator()
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = self.player_1.seating_position
+        naki_tile = OwnedTile(naki_tile, self.player_1.seating_position)
         kan = Huro(Naki.DAMINKAN,
                    naki_tile,
                    [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -224,7 +225,7 @@ class TestTurnDrawFlow(unittest.TestCase):
         for _ in range(3):
             self.tile_stack.add_dora_indicator()
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = self.player_1.seating_position
+        naki_tile = OwnedTile(naki_tile, self.player_1.seating_position)
         kan = Huro(Naki.DAMINKAN,
                    naki_tile,
                    [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -237,13 +238,13 @@ class TestTurnDrawFlow(unittest.TestCase):
         for _ in range(3):
             self.tile_stack.add_dora_indicator()
         naki_tile_1 = Tile(Suit.SOUZU.value, 5)
-        naki_tile_1.owner = self.player_1.seating_position
+        naki_tile_1 = OwnedTile(naki_tile_1, self.player_1.seating_position)
         naki_tile_2 = Tile(Suit.SOUZU.value, 6)
-        naki_tile_2.owner = self.player_1.seating_position
+        naki_tile_2 = OwnedTile(naki_tile_2, self.player_1.seating_position)
         naki_tile_3 = Tile(Suit.SOUZU.value, 7)
-        naki_tile_3.owner = self.player_1.seating_position
+        naki_tile_3 = OwnedTile(naki_tile_3, self.player_1.seating_position)
         naki_tile_4 = Tile(Suit.SOUZU.value, 8)
-        naki_tile_4.owner = self.player_1.seating_position
+        naki_tile_4 = OwnedTile(naki_tile_4, self.player_1.seating_position)
         kan_1 = Huro(Naki.ANKAN,
                      naki_tile_1,
                      [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -264,7 +265,7 @@ class TestTurnDrawFlow(unittest.TestCase):
     def test_no_suukaikan(self):
         self.tile_stack.add_dora_indicator()
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = self.player_1.seating_position
+        naki_tile = OwnedTile(naki_tile, self.player_1.seating_position)
         kan = Huro(Naki.ANKAN,
                    naki_tile,
                    [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -274,7 +275,7 @@ class TestTurnDrawFlow(unittest.TestCase):
 
     def test_rinshan_kaihou(self):
         naki_tile = Tile(Suit.SOUZU.value, 5)
-        naki_tile.owner = self.player_1.seating_position
+        naki_tile = OwnedTile(naki_tile, self.player_1.seating_position)
         kan = Huro(Naki.ANKAN,
                    naki_tile,
                    [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -532,13 +533,13 @@ class TestTurnNakiFlow(unittest.TestCase):
         for _ in range(3):
             self.tile_stack.add_dora_indicator()
         naki_tile_1 = Tile(Suit.SOUZU.value, 5)
-        naki_tile_1.owner = self.player_1.seating_position
+        naki_tile_1 = OwnedTile(naki_tile_1, self.player_1.seating_position)
         naki_tile_2 = Tile(Suit.SOUZU.value, 6)
-        naki_tile_2.owner = self.player_1.seating_position
+        naki_tile_2 = OwnedTile(naki_tile_2, self.player_1.seating_position)
         naki_tile_3 = Tile(Suit.SOUZU.value, 7)
-        naki_tile_3.owner = self.player_1.seating_position
+        naki_tile_3 = OwnedTile(naki_tile_3, self.player_1.seating_position)
         naki_tile_4 = Tile(Suit.SOUZU.value, 8)
-        naki_tile_4.owner = self.player_1.seating_position
+        naki_tile_4 = OwnedTile(naki_tile_4, self.player_1.seating_position)
         kan_1 = Huro(Naki.ANKAN,
                      naki_tile_1,
                      [Tile(Suit.SOUZU.value, 5) for i in range(4)])
@@ -1,7 +1,15 @@
+import random
+import threading
 import unittest
 
 from mahjong.components import Suit
-from mahjong.utils import get_values, get_name, roundup
+from mahjong.utils import (
+    get_values, get_name, roundup, get_rng, rand_index, LRUCache, CacheInfo)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 
 class TestGetValue(unittest.TestCase):
@@ -21,3 +29,79 @@ class TestRoundup(unittest.TestCase):
 
     def test_roundup(self):
         self.assertEqual(roundup(1), 100)
+
+
+class TestGetRng(unittest.TestCase):
+
+    def test_get_rng(self):
+        self.assertIs(get_rng(), random)
+        self.assertEqual(get_rng(3).random(), random.Random(3).random())
+        rng = random.Random(3)
+        self.assertIs(get_rng(rng), rng)
+        with self.assertRaises(TypeError):
+            get_rng('3')
+
+
+class TestRandIndex(unittest.TestCase):
+
+    def test_random(self):
+        rng_1, rng_2 = random.Random(3), random.Random(3)
+        self.assertEqual([rand_index(rng_1, 7) for _ in range(20)],
+                         [rng_2.randrange(7) for _ in range(20)])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy(self):
+        rng = np.random.default_rng(0)
+        indices = {rand_index(rng, 3) for _ in range(100)}
+        self.assertEqual(indices, {0, 1, 2})
+        self.assertTrue(all(type(i) is int for i in indices))
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_get_put(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)  # evicts b, the least recently used
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.cache_info(), CacheInfo(2, 1, 2, 2))
+
+    def test_maxsize(self):
+        cache = LRUCache(0)
+        cache.put('a', 1)
+        self.assertEqual(len(cache), 0)
+        cache = LRUCache(None)
+        for i in range(1_000):
+            cache.put(i, i)
+        self.assertEqual(len(cache), 1_000)
+        cache.resize(10)
+        self.assertEqual(len(cache), 10)
+        self.assertEqual(cache.get(999), 999)
+
+    def test_threads(self):
+        cache = LRUCache(16)
+
+        def use(thread):
+            for i in range(2_000):
+                cache.put((thread, i % 32), i)
+                cache.get((thread, i * 7 % 32))
+        threads = [threading.Thread(target=use, args=(thread,))
+                   for thread in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.cache_info()
+        # no get lost, nor the bound overrun
+        self.assertEqual(info.hits + info.misses, 4 * 2_000)
+        self.assertEqual(info.currsize, 16)
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 0, 128, 0))
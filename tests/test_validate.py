@@ -0,0 +1,122 @@
+import copy
+import os
+import tempfile
+import unittest
+
+from mahjong.components import Action, Tile, Suit
+from mahjong.event_logger import ActionLog
+from mahjong.helpers import convert_hand
+from mahjong.packed_log import append_kyokus
+from mahjong.replay import KyokuReplay
+from mahjong.self_play import play_game
+from mahjong.validate import (
+    DivergenceType, iter_file, validate, validate_kyoku, validate_files
+)
+
+
+def edited(logger, i, log):
+    """A copy of logger with its i-th ActionLog replaced."""
+    logger = copy.copy(logger)
+    logger.logs = list(logger.logs)
+    logger.logs[i] = log
+    return logger
+
+
+class TestValidate(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # the game of seed 35 has a tsumo in its second kyoku
+        cls.loggers = play_game(35).kyoku_logs
+        cls.won = next(logger for logger in cls.loggers if logger.han_fu)
+
+    def test_no_divergence(self):
+        self.assertEqual(list(validate(self.loggers)), [])
+
+    def test_points(self):
+        logger = copy.copy(self.won)
+        logger.deltas = list(logger.deltas)
+        logger.deltas[2] += 100
+        (divergence,) = validate_kyoku(logger)
+        self.assertEqual(divergence.divergence_type, DivergenceType.POINTS)
+        self.assertEqual(divergence.seat, 2)
+        self.assertEqual(divergence.actual, self.won.deltas[2])
+
+    def test_han_fu(self):
+        logger = copy.copy(self.won)
+        seat, (han, fu) = next(iter(self.won.han_fu.items()))
+        logger.han_fu = {seat: (han + 1, fu)}
+        divergences = list(validate([self.loggers[0], logger]))
+        self.assertEqual(
+            [(d.divergence_type, d.kyoku, d.seat, d.actual)
+             for d in divergences],
+            [(DivergenceType.HAN_FU, 1, seat, (han, fu))])
+
+    def test_illegal_discard(self):
+        logger = self.loggers[0]
+        i = next(i for i, log in enumerate(logger.logs)
+                 if log.action == Action.DISCARD)
+        log = logger.logs[i]
+        player = KyokuReplay(logger).seek(i).players[log.p_pos]
+        held = convert_hand(player.hand) + [logger.logs[i - 1].action_tile]
+        tile = next(Tile(Suit.PINZU.value, rank) for rank in range(1, 10)
+                    if Tile(Suit.PINZU.value, rank) not in held)
+
+        (divergence,) = validate_kyoku(edited(
+            logger, i, ActionLog(log.p_pos, Action.DISCARD, tile)))
+        self.assertEqual(divergence.divergence_type, DivergenceType.LEGAL)
+        self.assertEqual(divergence.position, i)
+        self.assertEqual(divergence.seat, log.p_pos)
+
+    def test_wrong_draw(self):
+        logger = self.loggers[0]
+        draw = logger.logs[0]
+        other = next(Tile(Suit.SOUZU.value, rank) for rank in range(1, 10)
+                     if Tile(Suit.SOUZU.value, rank) != draw.action_tile)
+
+        (divergence,) = validate_kyoku(edited(
+            logger, 0, ActionLog(draw.p_pos, Action.DRAW, other)))
+        self.assertEqual(divergence.divergence_type, DivergenceType.ACTION)
+        self.assertEqual(divergence.position, 0)
+        self.assertEqual(divergence.actual.action_tile, draw.action_tile)
+
+    def test_extra_logs(self):
+        logger = copy.copy(self.loggers[0])
+        logger.logs = logger.logs + [ActionLog(0, Action.NOACT)]
+        (divergence,) = validate_kyoku(logger)
+        self.assertEqual(divergence.divergence_type, DivergenceType.ACTION)
+        self.assertEqual(divergence.position, len(self.loggers[0].logs))
+
+    def test_validate_files(self):
+        logger = copy.copy(self.won)
+        logger.deltas = [0, 0, 0, 0]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, f'{i}.log') for i in range(2)]
+            append_kyokus(paths[0], self.loggers)
+            append_kyokus(paths[1], [self.loggers[0], logger])
+            divergences = list(validate_files(paths, n_workers=2))
+        self.assertGreater(len(divergences), 0)
+        self.assertEqual({d.path for d in divergences}, {paths[1]})
+        self.assertEqual({d.kyoku for d in divergences}, {1})
+        self.assertEqual({d.divergence_type for d in divergences},
+                         {DivergenceType.POINTS})
+
+    def test_iter_file(self):
+        logger = copy.copy(self.won)
+        logger.deltas = [0, 0, 0, 0]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'kyokus.log')
+            open(path, 'wb').close()
+            self.assertEqual(list(iter_file(path)), [])
+            append_kyokus(path, [logger, self.loggers[0], logger])
+            divergences = list(iter_file(path))
+            self.assertEqual({d.kyoku for d in divergences}, {0, 2})
+            # stopping halfway lets go of the file
+            divergences = iter_file(path)
+            self.assertEqual(next(divergences).kyoku, 0)
+            divergences.close()
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,245 @@
+import random
+import unittest
+
+from mahjong.components import (
+    Action, Huro, Naki, Stack, Tile, TILE_INDICES, SLOT_OF_INDEX
+)
+from mahjong.event_logger import ActionLog
+from mahjong.kyoku import Kyoku, Turn
+from mahjong.player import Player
+from mahjong.renderer import Renderer
+from mahjong.replay import KyokuReplay
+from mahjong.self_play import play_game
+from mahjong.visible_tiles import VisibleTiles
+
+KANS = (Naki.ANKAN, Naki.CHAKAN, Naki.DAMINKAN)
+
+
+def rescanned(kyoku, seat):
+    """Unseen copies of each tile by seat, from the players' lists, after
+    a discard of a kyoku without kans.
+    """
+    seen = [kyoku.players[seat].hand[index] for index in TILE_INDICES]
+    shown = list(kyoku.tile_stack.dora_indicators)
+    for player in kyoku.players:
+        shown += player.kawa
+        for huro in player.kabe:
+            tiles = list(huro.tiles)
+            tiles.remove(huro.naki_tile)  # still in the kawa
+            shown += tiles
+    for tile in shown:
+        seen[SLOT_OF_INDEX[tile.index]] += 1
+    return [4 - n for n in seen]
+
+
+def scripted_wall(placed):
+    """A wall_order with the tiles of placed, position -> tile index, at
+    their positions, and the other copies of those tiles after every
+    other tile in the remaining positions.
+    """
+    placed = {pos % 136: index for pos, index in placed.items()}
+    rest = [index for index in TILE_INDICES for _ in range(4)]
+    for index in placed.values():
+        rest.remove(index)
+    rest.sort(key=lambda index: index in placed.values())
+    rest = iter(rest)
+    return [placed[pos] if pos in placed else next(rest)
+            for pos in range(136)]
+
+
+class TestVisibleTiles(unittest.TestCase):
+
+    def setUp(self):
+        self.stack = Stack(random.Random(0))
+        self.wall_order = self.stack.wall_order
+        self.tracker = VisibleTiles(self.wall_order)
+
+    def test_deal(self):
+        hand = [Tile.from_index(i) for i in self.wall_order[13:26]]
+        indicator = self.stack.dora_indicators[0]
+        for tile in set(hand) | {indicator}:
+            self.assertEqual(self.tracker.remaining(1, tile),
+                             4 - hand.count(tile) - (tile == indicator))
+        counts = self.tracker.remaining_counts(1)
+        self.assertEqual(len(counts), 34)
+        self.assertEqual(sum(counts), 136 - 14)
+
+    def test_discard_and_calls(self):
+        tile = Tile.from_index(self.wall_order[52])
+        before = [self.tracker.remaining(seat, tile) for seat in range(4)]
+        self.tracker.apply(ActionLog(0, Action.DRAW, tile))
+        self.tracker.apply(ActionLog(0, Action.DISCARD, tile))
+        # the repeated discard of a nested draw_flow is the same tile
+        self.tracker.apply(ActionLog(0, Action.DISCARD, tile))
+        self.assertEqual([self.tracker.remaining(seat, tile)
+                          for seat in range(4)],
+                         [n - 1 for n in before])
+
+        # a pon shows the two other tiles to everyone but the caller
+        pon = Huro(Naki.PON, tile, [tile, tile, tile])
+        self.tracker.apply(ActionLog(2, Action.NAKI, tile, Naki.PON, pon))
+        self.assertEqual(self.tracker.remaining(1, tile), before[1] - 3)
+        self.assertEqual(self.tracker.remaining(2, tile), before[2] - 1)
+        # then the fourth copy
+        chakan = Huro(Naki.CHAKAN, tile, [tile] * 4)
+        self.tracker.apply(
+            ActionLog(2, Action.NAKI, tile, Naki.CHAKAN, chakan))
+        self.assertEqual(self.tracker.remaining(1, tile), before[1] - 4)
+
+    def test_rinshan_draw_shows_a_dora_indicator(self):
+        indicator = Tile.from_index(self.wall_order[-7])
+        tile = Tile.from_index(self.wall_order[-1])
+        before = self.tracker.remaining(3, indicator)
+        self.tracker.apply(ActionLog(0, Action.DRAW_RINSHAN, tile))
+        self.assertEqual(self.tracker.remaining(3, indicator), before - 1)
+        self.assertEqual(sum(self.tracker.remaining_counts(3)), 136 - 13 - 2)
+        self.assertEqual(sum(self.tracker.remaining_counts(0)), 136 - 13 - 3)
+
+    def test_scripted_kans(self):
+        m1, p5, ton = (Tile.from_index(i) for i in (11, 35, 1))
+        rinshan = [Tile.from_index(28), Tile.from_index(38)]
+        indicators = [Tile.from_index(i) for i in (29, 39, 19)]
+        placed = {pos: 11 for pos in range(4)}  # seat 0 ankans 1m
+        placed.update({4: 35, 5: 35, 6: 1, 13: 35, 57: 35})
+        placed.update({-5: 29, -7: 39, -9: 19, -1: 28, -2: 38})
+        wall_order = scripted_wall(placed)
+        draws = [Tile.from_index(i) for i in wall_order[52:57]]
+        tracker = VisibleTiles(wall_order)
+
+        def counts(tile):
+            return [tracker.remaining(seat, tile) for seat in range(4)]
+
+        logs = [
+            ActionLog(0, Action.DRAW, draws[0]),
+            ActionLog(0, Action.NAKI, m1, Naki.ANKAN,
+                      Huro(Naki.ANKAN, m1, [m1] * 4)),
+            ActionLog(0, Action.DRAW_RINSHAN, rinshan[0]),
+            ActionLog(0, Action.DISCARD, ton),
+            ActionLog(0, Action.DISCARD, ton),  # of the nested draw_flow
+            ActionLog(1, Action.DRAW, draws[1]),
+            ActionLog(1, Action.DISCARD, p5),
+            ActionLog(0, Action.NAKI, p5, Naki.PON,
+                      Huro(Naki.PON, p5, [p5] * 3)),
+            ActionLog(0, Action.DISCARD, draws[0]),
+        ]
+        for seat, tile in zip((1, 2, 3), draws[2:]):
+            logs += [ActionLog(seat, Action.DRAW, tile),
+                     ActionLog(seat, Action.DISCARD, tile)]
+        self.assertEqual(counts(m1), [0, 4, 4, 4])
+        self.assertEqual(counts(p5), [2, 3, 4, 4])
+        self.assertEqual(counts(indicators[1]), [4, 4, 4, 4])
+        for log in logs[:3]:
+            tracker.apply(log)
+        self.assertEqual(counts(m1), [0, 0, 0, 0])
+        self.assertEqual(counts(indicators[1]), [3, 3, 3, 3])
+        for log in logs[3:8]:
+            tracker.apply(log)
+        self.assertEqual(counts(ton), [3, 3, 3, 3])
+        self.assertEqual(counts(p5), [1, 1, 1, 1])
+        for log in logs[8:]:
+            tracker.apply(log)
+
+        for log in [
+            ActionLog(0, Action.DRAW, p5),
+            ActionLog(0, Action.NAKI, p5, Naki.CHAKAN,
+                      Huro(Naki.CHAKAN, p5, [p5] * 4)),
+            ActionLog(0, Action.DRAW_RINSHAN, rinshan[1]),
+            ActionLog(0, Action.DISCARD, rinshan[1]),
+            ActionLog(0, Action.DISCARD, rinshan[1]),
+        ]:
+            tracker.apply(log)
+        self.assertEqual(counts(p5), [0, 0, 0, 0])
+        self.assertEqual(counts(ton), [3, 3, 3, 3])
+        for indicator in indicators:
+            self.assertEqual(counts(indicator), [3, 3, 3, 3])
+        self.assertEqual(counts(rinshan[0]), [3, 4, 4, 4])
+        self.assertEqual(counts(rinshan[1]), [3, 3, 3, 3])
+        # seat 0 saw its 17 tiles, 4 discards and 3 dora indicators, the
+        # others their 15 or 14 tiles, the 3 indicators and 12 or 13
+        # shown by the others
+        self.assertEqual([sum(tracker.remaining_counts(seat))
+                          for seat in range(4)], [112, 106, 106, 106])
+
+    def test_follows_kyoku(self):
+        random.seed(3)
+        renderer = Renderer()
+        players = [Player(f'A.I. {i}', i, 'dummy', renderer)
+                   for i in range(4)]
+        kyoku = Kyoku(players, renderer=renderer, seed=3)
+        tracker = VisibleTiles()
+        kyoku.logger.listeners.append(tracker)
+        kyoku.start()
+        logger = kyoku.logger
+        offline = VisibleTiles.from_logs(logger, logger.wall_order)
+        for seat in range(4):
+            self.assertEqual(tracker.remaining_counts(seat),
+                             offline.remaining_counts(seat))
+
+    def test_restore(self):
+        random.seed(5)
+        renderer = Renderer()
+        players = [Player(f'A.I. {i}', i, 'dummy', renderer)
+                   for i in range(4)]
+        kyoku = Kyoku(players, renderer=renderer, seed=5)
+        tracker = VisibleTiles()
+        kyoku.logger.listeners.append(tracker)
+        kyoku.logger.log_start(
+            kyoku.tile_stack.wall_order, kyoku.bakaze,
+            kyoku.oya_player.seating_position, kyoku.honba, kyoku.kyotaku,
+            [player.points for player in players])
+        kyoku.deal()
+        turn = Turn(players, kyoku.tile_stack, kyoku.bakaze, kyoku.logger)
+
+        def play(n_turns, state):
+            for _ in range(n_turns):
+                if state[0] != 0:
+                    break
+                state = turn.discard_flow(state[1], state[2])
+            return state
+
+        state = play(4, turn.draw_flow(kyoku.oya_player))
+        snapshot = kyoku.snapshot(turn)
+        before = [list(tracker.remaining_counts(seat)) for seat in range(4)]
+        play(8, state)
+        self.assertNotEqual(
+            [list(tracker.remaining_counts(seat)) for seat in range(4)],
+            before)
+        kyoku.restore(snapshot, turn)
+        self.assertEqual(
+            [list(tracker.remaining_counts(seat)) for seat in range(4)],
+            before)
+
+    def test_same_as_rescan(self):
+        n_checked = n_kans = 0
+        for seed in range(6):
+            for logger in play_game(seed).kyoku_logs:
+                if any(log.naki_type in KANS for log in logger):
+                    # only check the counts stay possible, the kawa of a
+                    # daminkan has its last discard twice
+                    n_kans += 1
+                    tracker = VisibleTiles(logger.wall_order)
+                    for log in logger:
+                        tracker.apply(log)
+                        for seat in range(4):
+                            self.assertTrue(all(
+                                0 <= n <= 4
+                                for n in tracker.remaining_counts(seat)))
+                    continue
+                replay = KyokuReplay(logger, checkpoint_every=0)
+                tracker = VisibleTiles(logger.wall_order)
+                for log in logger:
+                    replay.step()
+                    tracker.apply(log)
+                    for seat in range(4):
+                        counts = tracker.remaining_counts(seat)
+                        self.assertTrue(all(0 <= n <= 4 for n in counts))
+                        if log.action == Action.DISCARD:
+                            self.assertEqual(
+                                list(counts), rescanned(replay.kyoku, seat))
+                            n_checked += 1
+        self.assertGreater(n_checked, 0)
+        self.assertGreater(n_kans, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
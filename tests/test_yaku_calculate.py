@@ -103,7 +103,8 @@ class TestYakuCalculator(unittest.TestCase):
             self.machi_tiles, self.player.agari_tile)
         total_han, fu = yaku_calc.calculate()
         self.assertEqual(total_han, 2)  # menzen tsumo and dora
-        self.assertEqual(fu, 40)
+        # 20 + 333m and 555s ankou, the 9m of the other machi not counted
+        self.assertEqual(fu, 30)
 
     def test_check_doras(self):
         yaku_calc = YakuCalculator(
@@ -111,3 +112,63 @@ class TestYakuCalculator(unittest.TestCase):
             self.machi_tiles, self.player.agari_tile)
         dora = yaku_calc.check_doras()
         self.assertEqual(dora, 1)
+
+    def test_calculate_best_separation(self):
+        # 222333444m 567p 88s, ron on 4m: reading the manzu as koutsu is
+        # only tanyao, as shuntsu it is tanyao and iipeikou
+        player = Player('test player', 0)
+        player.hand[Tile(Suit.MANZU.value, 2).index] += 3
+        player.hand[Tile(Suit.MANZU.value, 3).index] += 3
+        player.hand[Tile(Suit.MANZU.value, 4).index] += 2
+        for i in range(5, 8):
+            player.hand[Tile(Suit.PINZU.value, i).index] += 1
+        player.hand[Tile(Suit.SOUZU.value, 8).index] += 2
+        self.stack.doras = []
+        agari_tile = Tile(Suit.MANZU.value, 4)
+        machi_tiles = check_tenpai(player.hand, player.kabe)
+        yaku_calc = YakuCalculator(
+            player, self.stack, self.bakaze, True, machi_tiles, agari_tile)
+        koutsu_first = yaku_calc.calculate_evaluations(yaku_calc.evaluations)
+        self.assertEqual(koutsu_first, (1, 50))
+        self.assertEqual(yaku_calc.calculate(), (2, 30))
+
+    def test_fu_of_the_scored_separation(self):
+        # 111222333m 789p 5s, tsumo on 5s: three ankou are sanankou and
+        # 20 + 8 + 4 + 4 + 2 fu, three shuntsu are 20 + 2 fu
+        player = Player('test player', 0)
+        for rank in (1, 2, 3):
+            player.hand[Tile(Suit.MANZU.value, rank).index] += 3
+        for i in range(7, 10):
+            player.hand[Tile(Suit.PINZU.value, i).index] += 1
+        player.hand[Tile(Suit.SOUZU.value, 5).index] += 1
+        self.stack.doras = []
+        agari_tile = Tile(Suit.SOUZU.value, 5)
+        machi_tiles = check_tenpai(player.hand, player.kabe)
+        yaku_calc = YakuCalculator(
+            player, self.stack, self.bakaze, False, machi_tiles, agari_tile)
+        scores = {
+            len(separation[0]): yaku_calc.calculate_evaluations(
+                evaluations, separation, 0)
+            for separation, evaluations
+            in yaku_calc.evaluations_per_separation()}
+        self.assertEqual(scores, {3: (3, 40), 0: (1, 30)})
+        self.assertEqual(yaku_calc.calculate(), (3, 40))
+
+    def test_doras_not_added_to_stack(self):
+        # riichi 111222333m 456p 99s, two separations
+        player = Player('test player', 0)
+        player.is_riichi = True
+        for rank in (1, 2, 3):
+            player.hand[Tile(Suit.MANZU.value, rank).index] += 3
+        for i in range(4, 7):
+            player.hand[Tile(Suit.PINZU.value, i).index] += 1
+        player.hand[Tile(Suit.SOUZU.value, 9).index] += 1
+        agari_tile = Tile(Suit.SOUZU.value, 9)
+        self.stack.uradoras = [Tile(Suit.SOUZU.value, 9)]
+        machi_tiles = check_tenpai(player.hand, player.kabe)
+        yaku_calc = YakuCalculator(
+            player, self.stack, self.bakaze, True, machi_tiles, agari_tile)
+        self.assertEqual(len(yaku_calc.decomposition.separations), 2)
+        yaku_calc.calculate()
+        self.assertEqual(self.stack.doras, [Tile(Suit.PINZU.value, 3)])
+        self.assertEqual(yaku_calc.check_doras(), 1)
@@ -1,6 +1,6 @@
 import unittest
 
-from mahjong.components import Tile, Suit, Jihai, Naki, Huro
+from mahjong.components import Tile, Suit, Jihai, Naki, Huro, OwnedTile
 from mahjong.player import Player
 from mahjong.components import Stack
 from mahjong.naki_and_actions import check_tenpai
@@ -22,7 +22,7 @@ class TestJouKyouYaku(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 9).index] += 2
         self.player.hand[Tile(Suit.SOUZU.value, 5).index] += 2
         naki_tile = Tile(Suit.SOUZU.value, 2)
-        naki_tile.owner = 3
+        naki_tile = OwnedTile(naki_tile, 3)
         self.player.kabe.append(
             Huro(Naki.CHII, naki_tile,
                  [Tile(Suit.SOUZU.value, i) for i in range(1, 4)]))
@@ -195,7 +195,7 @@ class TestTeYaku(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 6).index] += 2
         self.player.hand[Tile(Suit.MANZU.value, 8).index] += 2
         naki_tile = Tile(Suit.JIHAI.value, Jihai.HATSU.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.HATSU.value)
@@ -217,7 +217,7 @@ class TestTeYaku(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 6).index] += 2
         self.player.hand[Tile(Suit.SOUZU.value, 8).index] += 2
         naki_tile = Tile(Suit.JIHAI.value, Jihai.HATSU.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.HATSU.value)
@@ -367,7 +367,7 @@ class TestTeYaku(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.HAKU.value).index] += 2
         for tile_rank in range(2, 5):
             naki_tile = Tile(Suit.MANZU.value, tile_rank)
-            naki_tile.owner = 2
+            naki_tile = OwnedTile(naki_tile, 2)
             self.player.kabe.append(
                 Huro(Naki.PON, naki_tile,
                      [Tile(Suit.MANZU.value, tile_rank) for i in range(1, 4)]))
@@ -387,12 +387,12 @@ class TestTeYaku(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.HAKU.value).index] += 2
         for tile_rank in range(2, 4):
             naki_tile = Tile(Suit.MANZU.value, tile_rank)
-            naki_tile.owner = 2
+            naki_tile = OwnedTile(naki_tile, 2)
             self.player.kabe.append(
                 Huro(Naki.PON, naki_tile,
                      [Tile(Suit.MANZU.value, tile_rank) for i in range(1, 4)]))
         naki_tile = Tile(Suit.SOUZU.value, 1)
-        naki_tile.owner = 3
+        naki_tile = OwnedTile(naki_tile, 3)
         self.player.kabe.append(
             Huro(Naki.CHII, naki_tile,
                  [Tile(Suit.SOUZU.value, i) for i in range(1, 4)]))
@@ -412,7 +412,7 @@ class TestTeYaku(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.HAKU.value).index] += 2
         for tile_rank in range(2, 5):
             naki_tile = Tile(Suit.MANZU.value, tile_rank)
-            naki_tile.owner = 2
+            naki_tile = OwnedTile(naki_tile, 2)
             self.player.kabe.append(
                 Huro(Naki.PON, naki_tile,
                      [Tile(Suit.MANZU.value, tile_rank) for i in range(1, 4)]))
@@ -432,7 +432,7 @@ class TestTeYaku(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.HAKU.value).index] += 2
         for tile_rank in range(2, 5):
             naki_tile = Tile(Suit.MANZU.value, tile_rank)
-            naki_tile.owner = 2
+            naki_tile = OwnedTile(naki_tile, 2)
             self.player.kabe.append(
                 Huro(Naki.PON, naki_tile,
                      [Tile(Suit.MANZU.value, tile_rank) for i in range(1, 4)]))
@@ -504,7 +504,7 @@ class TestTeYaku(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 5).index] += 2
         self.player.agari_tile = Tile(Suit.SOUZU.value, 5)
         naki_tile = Tile(Suit.PINZU.value, 2)
-        naki_tile.owner = 3
+        naki_tile = OwnedTile(naki_tile, 3)
         self.player.kabe.append(
             Huro(Naki.CHII, naki_tile,
                  [Tile(Suit.PINZU.value, i) for i in range(1, 4)]))
@@ -611,7 +611,7 @@ class TestTeYaku(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 8).index] += 2
         self.player.hand[Tile(Suit.SOUZU.value, 5).index] += 2
         naki_tile = Tile(Suit.PINZU.value, 9)
-        naki_tile.owner = 3
+        naki_tile = OwnedTile(naki_tile, 3)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.PINZU.value, 9) for i in range(1, 4)]))
@@ -648,7 +648,7 @@ class TestTeYaku(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 8).index] += 2
         self.player.hand[Tile(Suit.SOUZU.value, 5).index] += 2
         naki_tile = Tile(Suit.PINZU.value, 2)
-        naki_tile.owner = 3
+        naki_tile = OwnedTile(naki_tile, 3)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.PINZU.value, 2) for i in range(1, 4)]))
@@ -677,7 +677,7 @@ class TestYakuhai(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 6).index] += 2
         self.player.hand[Tile(Suit.MANZU.value, 8).index] += 3
         naki_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.CHUN.value)
@@ -699,7 +699,7 @@ class TestYakuhai(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 6).index] += 2
         self.player.hand[Tile(Suit.MANZU.value, 8).index] += 2
         naki_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.CHUN.value)
@@ -721,7 +721,7 @@ class TestYakuhai(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 6).index] += 2
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.SHAA.value).index] += 2
         naki_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.CHUN.value)
@@ -743,7 +743,7 @@ class TestYakuhai(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.TON.value).index] += 2
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.SHAA.value).index] += 2
         naki_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.CHUN.value)
@@ -765,7 +765,7 @@ class TestYakuhai(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.SHAA.value).index] += 2
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.HAKU.value).index] += 2
         naki_tile = Tile(Suit.JIHAI.value, Jihai.PEI.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.DAMINKAN, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.PEI.value)
@@ -787,7 +787,7 @@ class TestYakuhai(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.SHAA.value).index] += 2
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.HAKU.value).index] += 2
         naki_tile = Tile(Suit.JIHAI.value, Jihai.PEI.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.DAMINKAN, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.PEI.value)
@@ -809,7 +809,7 @@ class TestYakuhai(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.SHAA.value).index] += 1
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.HAKU.value).index] += 3
         naki_tile = Tile(Suit.JIHAI.value, Jihai.PEI.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.DAMINKAN, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.PEI.value)
@@ -831,7 +831,7 @@ class TestYakuhai(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 6).index] += 2
         self.player.hand[Tile(Suit.MANZU.value, 8).index] += 3
         naki_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.CHUN.value)
@@ -853,7 +853,7 @@ class TestYakuhai(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 6).index] += 2
         self.player.hand[Tile(Suit.MANZU.value, 8).index] += 3
         naki_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.CHUN.value)
@@ -875,7 +875,7 @@ class TestYakuhai(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 6).index] += 2
         self.player.hand[Tile(Suit.MANZU.value, 8).index] += 3
         naki_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.CHUN.value)
@@ -907,7 +907,7 @@ class TestPeikou(unittest.TestCase):
             self.player.hand[Tile(Suit.MANZU.value, i).index] += 1
         self.player.hand[Tile(Suit.SOUZU.value, 5).index] += 1
         naki_tile = Tile(Suit.MANZU.value, 5)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.CHII, naki_tile,
                  [Tile(Suit.MANZU.value, i) for i in range(4, 7)]))
@@ -942,7 +942,7 @@ class TestPeikou(unittest.TestCase):
         self.player.hand[Tile(Suit.JIHAI.value, Jihai.NAN.value).index] += 3
         self.player.hand[Tile(Suit.SOUZU.value, 5).index] += 1
         naki_tile = Tile(Suit.MANZU.value, 5)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.CHII, naki_tile,
                  [Tile(Suit.MANZU.value, i) for i in range(4, 7)]))
@@ -990,7 +990,7 @@ class TestChanta(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 1).index] += 1
 
         naki_tile = Tile(Suit.SOUZU.value, 9)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.SOUZU.value, 9) for i in range(1, 4)]))
@@ -1012,7 +1012,7 @@ class TestChanta(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 1).index] += 1
 
         naki_tile = Tile(Suit.SOUZU.value, 9)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.SOUZU.value, 9) for i in range(1, 4)]))
@@ -1035,7 +1035,7 @@ class TestChanta(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 1).index] += 1
 
         naki_tile = Tile(Suit.SOUZU.value, 9)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.SOUZU.value, 9) for i in range(1, 4)]))
@@ -1058,7 +1058,7 @@ class TestChanta(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 1).index] += 1
 
         naki_tile = Tile(Suit.SOUZU.value, 9)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.SOUZU.value, 9) for i in range(1, 4)]))
@@ -1079,7 +1079,7 @@ class TestChanta(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 3).index] += 3
         self.player.hand[Tile(Suit.PINZU.value, 9).index] += 1
         naki_tile = Tile(Suit.SOUZU.value, 9)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.SOUZU.value, 9) for i in range(1, 4)]))
@@ -1100,7 +1100,7 @@ class TestChanta(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 3).index] += 3
         self.player.hand[Tile(Suit.PINZU.value, 9).index] += 1
         naki_tile = Tile(Suit.SOUZU.value, 9)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.SOUZU.value, 9) for i in range(1, 4)]))
@@ -1137,7 +1137,7 @@ class TestChanta(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 9).index] += 3
         self.player.hand[Tile(Suit.PINZU.value, 9).index] += 1
         naki_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.CHUN.value)
@@ -1159,7 +1159,7 @@ class TestChanta(unittest.TestCase):
         self.player.hand[Tile(Suit.MANZU.value, 3).index] += 3
         self.player.hand[Tile(Suit.PINZU.value, 9).index] += 1
         naki_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.CHUN.value)
@@ -1272,17 +1272,17 @@ class TestKoutsu(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 2).index] += 3
 
         naki_tile = Tile(Suit.MANZU.value, 2)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.DAMINKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 2) for i in range(1, 5)]))
         naki_tile = Tile(Suit.MANZU.value, 3)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.ANKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 3) for i in range(1, 5)]))
         naki_tile = Tile(Suit.MANZU.value, 7)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.CHAKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 7) for i in range(1, 5)]))
@@ -1301,22 +1301,22 @@ class TestKoutsu(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 5).index] += 1
 
         naki_tile = Tile(Suit.MANZU.value, 2)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.DAMINKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 2) for i in range(1, 5)]))
         naki_tile = Tile(Suit.MANZU.value, 3)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.ANKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 3) for i in range(1, 5)]))
         naki_tile = Tile(Suit.MANZU.value, 7)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.CHAKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 7) for i in range(1, 5)]))
         naki_tile = Tile(Suit.PINZU.value, 7)
-        naki_tile.owner = 3
+        naki_tile = OwnedTile(naki_tile, 3)
         self.player.kabe.append(
             Huro(Naki.DAMINKAN, naki_tile,
                  [Tile(Suit.PINZU.value, 7) for i in range(1, 5)]))
@@ -1389,17 +1389,17 @@ class TestKoutsu(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 2).index] += 3
 
         naki_tile = Tile(Suit.MANZU.value, 2)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.DAMINKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 2) for i in range(1, 5)]))
         naki_tile = Tile(Suit.MANZU.value, 3)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.ANKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 3) for i in range(1, 5)]))
         naki_tile = Tile(Suit.MANZU.value, 7)
-        naki_tile.owner = 3
+        naki_tile = OwnedTile(naki_tile, 3)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.MANZU.value, 7) for i in range(1, 4)]))
@@ -1419,17 +1419,17 @@ class TestKoutsu(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 2).index] += 3
 
         naki_tile = Tile(Suit.MANZU.value, 2)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.DAMINKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 2) for i in range(1, 5)]))
         naki_tile = Tile(Suit.MANZU.value, 3)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.ANKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 3) for i in range(1, 5)]))
         naki_tile = Tile(Suit.MANZU.value, 7)
-        naki_tile.owner = 0
+        naki_tile = OwnedTile(naki_tile, 0)
         self.player.kabe.append(
             Huro(Naki.CHAKAN, naki_tile,
                  [Tile(Suit.MANZU.value, 7) for i in range(1, 5)]))
@@ -1460,7 +1460,7 @@ class TestSanshoku(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 9).index] += 2
 
         naki_tile = Tile(Suit.MANZU.value, 2)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.MANZU.value, 2) for i in range(1, 4)]))
@@ -1483,7 +1483,7 @@ class TestSanshoku(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 9).index] += 2
 
         naki_tile = Tile(Suit.MANZU.value, 2)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.MANZU.value, 2) for i in range(1, 4)]))
@@ -1543,7 +1543,7 @@ class TestSanshoku(unittest.TestCase):
         self.player.hand[Tile(Suit.PINZU.value, 9).index] += 1
 
         naki_tile = Tile(Suit.MANZU.value, 4)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.CHII, naki_tile,
                  [Tile(Suit.MANZU.value, i) for i in range(4, 7)]))
@@ -1605,7 +1605,7 @@ class TestSomete(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 1).index] += 1
 
         naki_tile = Tile(Suit.SOUZU.value, 8)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.SOUZU.value, 8) for i in range(1, 4)]))
@@ -1659,7 +1659,7 @@ class TestSomete(unittest.TestCase):
         self.player.hand[Tile(Suit.SOUZU.value, 1).index] += 1
 
         naki_tile = Tile(Suit.JIHAI.value, Jihai.CHUN.value)
-        naki_tile.owner = 2
+        naki_tile = OwnedTile(naki_tile, 2)
         self.player.kabe.append(
             Huro(Naki.PON, naki_tile,
                  [Tile(Suit.JIHAI.value, Jihai.CHUN.value)